@@ -27,6 +27,10 @@ setuptools.setup(
         "requests>=2.31",
         "pydantic>=2.0",
     ],
+    extras_require={
+        # DataStore(..., mode="stream")
+        "stream": ["ijson>=3.1"],
+    },
     packages=setuptools.find_packages(where="src"),
     package_dir={"": "src"},
     package_data={
@@ -1,11 +1,14 @@
+import os
 import json
 import pathlib
-from typing import Optional
+import threading
+from typing import Iterable, Iterator, Optional
 from typing_extensions import deprecated
 from simple_error_log.errors import Errors
 from simple_error_log.error_location import KlassMethodLocation
 from usdm4.rules.rules_validation import RulesValidation4
-from usdm4.rules.results import RulesValidationResults
+from usdm4.rules.results import RuleOutcome, RulesValidationResults
+from usdm4.rules.results_cache import ResultsCache
 from usdm4.api.wrapper import Wrapper
 from usdm4.convert.convert import Convert
 from usdm4.builder.builder import Builder
@@ -15,12 +18,23 @@ from usdm4.core.core_validation_result import CoreValidationResult
 from usdm4.core.core_cache_manager import CoreCacheManager, CacheStatus
 from usdm4.data_store.data_store import DataStore
 from usdm4.utility.tag_resolver import TagResolver
+from usdm4.utility.async_runner import AsyncRunner
 
 
 class USDM4:
     MODULE = "usdm4.USDM4"
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        snapshot_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        results_dir: Optional[str] = None,
+        async_workers: Optional[int] = None,
+        rule_timeout: Optional[float] = None,
+    ):
         """
         Initialise the USDM4 facade.
 
@@ -30,14 +44,216 @@ class USDM4:
                 used (see :func:`~usdm4.core.core_cache_manager.default_cache_dir`).
                 Pass an explicit path for web-server deployments where the
                 default user-level cache may not be appropriate.
+            snapshot_dir: Optional directory for DataStore snapshots. When
+                set, :meth:`validate`, :meth:`tag_resolver` and the seed of
+                builders from :meth:`builder` reload the decomposition of a
+                file decomposed before instead of rebuilding it (see
+                :class:`~usdm4.data_store.snapshot_cache.SnapshotCache`).
+                If None, files are always decomposed afresh.
+            max_workers: Optional number of workers :meth:`validate` and
+                :meth:`validate_data` run the rule library on. If None (or
+                1) the rules run one after another. Results are the same,
+                in the same order, either way.
+            executor: ``"thread"`` (the default) or ``"process"``, the
+                kind of pool used when ``max_workers`` is set. Processes
+                are forked and share the decomposed document; where fork
+                is unavailable threads are used instead.
+            results_dir: Optional directory for a cache of rule library
+                results. When set, :meth:`validate` returns the stored
+                results for a file validated before with the same rule
+                library and terminology, without decomposing it or running
+                any rule (see
+                :class:`~usdm4.rules.results_cache.ResultsCache`, whose
+                default size and age limits apply). If None, every file is
+                validated afresh.
+            async_workers: Optional number of threads the coroutines
+                (:meth:`validate_async`, :meth:`validate_core_async` and
+                :meth:`load_async`) run their blocking work on, bounding how
+                many run at once; the others wait their turn. If None, the
+                ``ThreadPoolExecutor`` default is used. The threads start on
+                first use and are stopped by :meth:`close` or :meth:`aclose`,
+                or by leaving ``async with USDM4() as usdm``.
+            rule_timeout: Optional budget, in seconds, for each rule of the
+                rule library. A rule running past it, e.g. caught in a loop
+                by a pathological study, is stopped at its next read of the
+                study and reported with a ``Timeout`` outcome, so one rule
+                cannot hold up a whole validation. If None, rules run to
+                completion.
         """
         self.root = self._root_path()
         self.validator = RulesValidation4(self.root)
-        self._cache_dir = cache_dir
+        # CORE validation changes the working directory while it runs, so
+        # directories are resolved now rather than against whatever it is
+        self._cache_dir = self._absolute(cache_dir)
+        self._snapshot_dir = self._absolute(snapshot_dir)
+        self._max_workers = max_workers
+        self._executor = executor
+        self._results_cache = (
+            ResultsCache(self._absolute(results_dir)) if results_dir else None
+        )
         self._core_validator: Optional[CoreValidator] = None
+        self._core_lock = threading.Lock()
+        self._async = AsyncRunner(async_workers)
+        self._rule_timeout = rule_timeout
+
+    def validate(
+        self,
+        file_path: str,
+        *,
+        profile_rule: Optional[str] = None,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        bypass_cache: bool = False,
+        max_failures: Optional[int] = None,
+    ) -> RulesValidationResults:
+        """
+        Validate a USDM JSON file with the rule library.
+
+        Each rule's outcome records its wall and CPU time and the number of
+        instances it examined; ``timings()`` on the results lists the rules
+        by cost. ``profile_rule`` names a rule (e.g. ``"DDF00010"``) to run
+        on its own under cProfile and tracemalloc, the capture being left
+        on that rule's outcome as ``profile``.
+
+        ``include`` and ``exclude`` select rules by id or tag (e.g.
+        ``["DDF00060"]`` or ``["ct"]``); only the selected rules appear in
+        the results. A rule that needs instances of classes the study does
+        not have is reported as skipped rather than run.
+
+        ``bypass_cache`` validates afresh even when a ``results_dir`` cache
+        holds results for the file, replacing them.
 
-    def validate(self, file_path: str) -> RulesValidationResults:
-        return self.validator.validate(file_path)
+        ``max_failures`` gates the file, e.g. on upload: the ERROR rules
+        run first and validation stops once that many rules have failed
+        (``1`` for the first), enough to know that
+        ``passed_or_not_implemented()`` is False. The rules not reached
+        are reported as not run, see ``not_run()`` on the results.
+        """
+        return self.validator.validate(
+            file_path,
+            snapshot_dir=self._snapshot_dir,
+            max_workers=self._max_workers,
+            executor=self._executor,
+            profile_rule=profile_rule,
+            include=include,
+            exclude=exclude,
+            results_cache=self._results_cache,
+            bypass_cache=bypass_cache,
+            max_failures=max_failures,
+            rule_timeout=self._rule_timeout,
+        )
+
+    def iter_validate(
+        self,
+        file_path: str,
+        *,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+    ) -> Iterator[RuleOutcome | RulesValidationResults]:
+        """
+        Validate a USDM JSON file with the rule library, reporting each
+        rule as it finishes.
+
+        Yields each rule's :class:`~usdm4.rules.results.RuleOutcome` as
+        soon as the rule has run, so progress and early failures can be
+        shown while the other rules are still running, and lastly the
+        same ``RulesValidationResults`` as :meth:`validate` would return.
+        ``include`` and ``exclude`` are as for :meth:`validate`; the
+        ``results_dir`` cache is not used.
+        """
+        return self.validator.iter_validate(
+            file_path,
+            snapshot_dir=self._snapshot_dir,
+            max_workers=self._max_workers,
+            executor=self._executor,
+            include=include,
+            exclude=exclude,
+            rule_timeout=self._rule_timeout,
+        )
+
+    def validate_data(
+        self,
+        data: dict | Wrapper | DataStore,
+        *,
+        profile_rule: Optional[str] = None,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        max_failures: Optional[int] = None,
+    ) -> RulesValidationResults:
+        """
+        Validate an in-memory USDM document with the rule library.
+
+        Same as :meth:`validate` but takes the study as a ``dict`` or a
+        :class:`~usdm4.api.wrapper.Wrapper` (e.g. straight from the
+        Assembler), avoiding the write to and re-read from a JSON file, or
+        as an already decomposed store from :meth:`data_store`.
+        """
+        return self.validator.validate_data(
+            data,
+            max_workers=self._max_workers,
+            executor=self._executor,
+            profile_rule=profile_rule,
+            include=include,
+            exclude=exclude,
+            max_failures=max_failures,
+            rule_timeout=self._rule_timeout,
+        )
+
+    def validate_incremental(
+        self,
+        data: dict | Wrapper | DataStore,
+        previous_data: DataStore,
+        previous: RulesValidationResults,
+        *,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+    ) -> RulesValidationResults:
+        """
+        Validate an edited study, running again only the rules the edit
+        could affect.
+
+        ``previous`` are the results of validating ``previous_data``, the
+        decomposed study before the edit (e.g. from :meth:`data_store`,
+        :meth:`validate_data` or an earlier call of this method). Outcomes
+        of the rules that read nothing changed by the edit are carried
+        forward; the results are the same as :meth:`validate_data` would
+        give for ``data``. Pass ``data`` as a decomposed ``DataStore`` to
+        use it as ``previous_data`` after the next edit. ``include`` and
+        ``exclude`` select the rules as for :meth:`validate`.
+        """
+        return self.validator.validate_incremental(
+            data,
+            previous_data,
+            previous,
+            max_workers=self._max_workers,
+            executor=self._executor,
+            include=include,
+            exclude=exclude,
+            rule_timeout=self._rule_timeout,
+        )
+
+    def validate_many(
+        self, file_paths: Iterable[str], workers: Optional[int] = None
+    ) -> Iterator[tuple[str, RulesValidationResults]]:
+        """
+        Validate many USDM JSON files with the rule library.
+
+        The files are shared out over a pool of worker processes that are
+        started once and keep the rules and controlled terminology loaded
+        for every file they validate.
+
+        Args:
+            file_paths: Paths of the USDM JSON files.
+            workers: Number of worker processes. If None, one per CPU.
+
+        Returns:
+            An iterator of ``(file_path, results)`` pairs, yielded as each
+            file completes (so not necessarily in the order given). A file
+            whose validation fails, or whose worker dies, yields results
+            holding a single ``"Validation"`` exception outcome; the other
+            files are unaffected.
+        """
+        return self.validator.validate_many(file_paths, workers, self._snapshot_dir)
 
     def validate_core(
         self,
@@ -69,6 +285,60 @@ class USDM4:
         validator = self._get_core_validator(cache_dir, api_key)
         return validator.validate(file_path, version=version)
 
+    async def validate_async(
+        self,
+        file_path: str,
+        *,
+        profile_rule: Optional[str] = None,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        bypass_cache: bool = False,
+        max_failures: Optional[int] = None,
+    ) -> RulesValidationResults:
+        """
+        Coroutine form of :meth:`validate`, run on the ``async_workers``
+        threads so the event loop is not blocked.
+
+        Cancelling the coroutine drops a validation still waiting for a
+        thread; one already running finishes in the background and its
+        results are discarded.
+        """
+        return await self._async.run(
+            self.validate,
+            os.path.abspath(file_path),
+            profile_rule=profile_rule,
+            include=include,
+            exclude=exclude,
+            bypass_cache=bypass_cache,
+            max_failures=max_failures,
+        )
+
+    async def validate_core_async(
+        self,
+        file_path: str,
+        version: str = "4-0",
+        cache_dir: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ) -> "CoreValidationResult":
+        """
+        Coroutine form of :meth:`validate_core`, run on the
+        ``async_workers`` threads as for :meth:`validate_async`.
+
+        CORE validation changes the process's working directory while it
+        runs, so CORE validations take turns; the rule library
+        validations and loads run alongside them. They find their files
+        all the same as ``file_path`` and ``cache_dir`` are made absolute
+        here, and the directories given to :class:`USDM4` when it is
+        created.
+        """
+        return await self._async.run(
+            self.validate_core,
+            os.path.abspath(file_path),
+            version,
+            self._absolute(cache_dir),
+            api_key,
+        )
+
     def prepare_core(
         self,
         version: str = "4-0",
@@ -112,18 +382,42 @@ class USDM4:
     ) -> CoreValidator:
         """Get or create the CoreValidator instance."""
         effective_cache_dir = cache_dir or self._cache_dir
-        if self._core_validator is None or cache_dir is not None or api_key is not None:
-            self._core_validator = CoreValidator(
-                cache_dir=effective_cache_dir, api_key=api_key
-            )
-        return self._core_validator
+        with self._core_lock:
+            if (
+                self._core_validator is None
+                or cache_dir is not None
+                or api_key is not None
+            ):
+                self._core_validator = CoreValidator(
+                    cache_dir=effective_cache_dir, api_key=api_key
+                )
+            return self._core_validator
+
+    @staticmethod
+    def _absolute(path: Optional[str]) -> Optional[str]:
+        return os.path.abspath(path) if path else path
 
     def convert(self, file_path: str) -> Wrapper:
         with open(file_path, "r") as file:
             data = json.load(file)
         return Convert.convert(data)
 
-    def tag_resolver(self, file_path: str, errors: Errors) -> TagResolver:
+    def data_store(self, file_path: str) -> DataStore:
+        """
+        Decompose a USDM JSON file once into a frozen
+        :class:`~usdm4.data_store.data_store.DataStore`.
+
+        The store can be shared, including between threads, by
+        :meth:`validate_data`, :meth:`tag_resolver` and ``Builder.seed``
+        rather than each decomposing the file again. Raises
+        :class:`~usdm4.data_store.data_store.DecompositionError` if the
+        file cannot be decomposed.
+        """
+        store = DataStore(file_path, snapshot_dir=self._snapshot_dir)
+        store.decompose()
+        return store.freeze()
+
+    def tag_resolver(self, file_path: str | DataStore, errors: Errors) -> TagResolver:
         """
         Return a TagResolver over a USDM JSON file: translates usdm:ref and
         usdm:tag elements in content text (e.g. NarrativeContentItem or
@@ -132,13 +426,17 @@ class USDM4:
         Note: usdm:macro is deliberately NOT handled here — macros are an
         authoring convenience expanded at workbook import by usdm4_excel;
         they never appear in USDM JSON.
+
+        A store from :meth:`data_store` may be given instead of a file.
         """
-        store = DataStore(file_path)
+        if isinstance(file_path, DataStore):
+            return TagResolver(file_path, errors)
+        store = DataStore(file_path, snapshot_dir=self._snapshot_dir)
         store.decompose()
         return TagResolver(store, errors)
 
     def builder(self, errors: Errors) -> Builder:
-        return Builder(self.root, errors)
+        return Builder(self.root, errors, self._snapshot_dir)
 
     def assembler(self, errors: Errors) -> Assembler:
         return Assembler(self.root, errors)
@@ -178,5 +476,33 @@ class USDM4:
             )
             return None
 
+    async def load_async(self, filepath: str, errors: Errors) -> Wrapper | None:
+        """
+        Coroutine form of :meth:`load`, run on the ``async_workers``
+        threads as for :meth:`validate_async`.
+        """
+        return await self._async.run(self.load, os.path.abspath(filepath), errors)
+
+    def close(self) -> None:
+        """
+        Stop the threads of the coroutines, cancelling the calls waiting
+        for one and waiting for those running. The coroutines cannot be
+        used afterwards; the other methods are unaffected.
+        """
+        self._async.shutdown()
+
+    async def aclose(self) -> None:
+        """
+        Coroutine form of :meth:`close`, waiting for the running calls
+        without blocking the event loop.
+        """
+        await self._async.aclose()
+
+    async def __aenter__(self) -> "USDM4":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     def _root_path(self) -> str:
         return pathlib.Path(__file__).parent.resolve()
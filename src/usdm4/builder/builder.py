@@ -31,7 +31,7 @@ from usdm4.builder.other_ct_version_manager import OtherCTVersionManager
 class Builder:
     MODULE = "usdm4.builder.builder.Builder"
 
-    def __init__(self, root_path: str, errors: Errors):
+    def __init__(self, root_path: str, errors: Errors, snapshot_dir: str | None = None):
         self._id_manager: IdManager = IdManager(v4_classes)
         self.errors = errors
         self.api_instance: APIInstance = APIInstance(self._id_manager)
@@ -42,6 +42,7 @@ class Builder:
         self.cross_reference = CrossReference()
         self.other_ct_version_manager = OtherCTVersionManager()
         self._data_store = None
+        self._snapshot_dir = snapshot_dir
 
         # Lazy loading: Track if CT libraries have been loaded
         self._ct_loaded = False
@@ -72,9 +73,14 @@ class Builder:
         _data_store."""
         return self._data_store
 
-    def seed(self, file_path: str):
-        self._data_store = DataStore(file_path)
-        self._data_store.decompose()
+    def seed(self, file_path: str | DataStore):
+        # A decomposed store, e.g. one shared with other consumers, is used
+        # as is
+        if isinstance(file_path, DataStore):
+            self._data_store = file_path
+        else:
+            self._data_store = DataStore(file_path, snapshot_dir=self._snapshot_dir)
+            self._data_store.decompose()
         for klass in v4_classes:
             for instance in self._data_store.instances_by_klass(klass):
                 if "id" in instance:
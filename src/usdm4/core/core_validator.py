@@ -19,6 +19,7 @@ import json
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -95,6 +96,8 @@ class CoreValidator:
             print(result.format_text())
     """
 
+    _cwd_lock = threading.Lock()
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -168,18 +171,21 @@ class CoreValidator:
         cdisc_package_dir = engine_imports["package_dir"]
         self._ensure_engine_resources(cdisc_package_dir)
 
-        original_cwd = os.getcwd()
-        original_log_level = logging.root.manager.disable
+        # The working directory and logging are process-wide, so validations
+        # in different threads take turns
+        with self._cwd_lock:
+            original_cwd = os.getcwd()
+            original_log_level = logging.root.manager.disable
 
-        # Suppress the engine's verbose output
-        logging.disable(logging.CRITICAL)
-        os.chdir(cdisc_package_dir)
+            # Suppress the engine's verbose output
+            logging.disable(logging.CRITICAL)
+            os.chdir(cdisc_package_dir)
 
-        try:
-            return self._run_validation(abs_path, version, engine_imports)
-        finally:
-            os.chdir(original_cwd)
-            logging.disable(original_log_level)
+            try:
+                return self._run_validation(abs_path, version, engine_imports)
+            finally:
+                os.chdir(original_cwd)
+                logging.disable(original_log_level)
 
     def _validate_file(self, abs_path: str) -> None:
         """Check that the file exists and is valid USDM JSON."""
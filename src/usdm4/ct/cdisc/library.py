@@ -30,6 +30,71 @@ class MissingCodelistError(Exception):
     """
 
 
+class TermIndex:
+    """Where to find the terms of one codelist.
+
+    Maps each term's conceptId, and its casefolded conceptId, preferred
+    term and submission value, to the position of the first term with
+    it, so a lookup costs a dict access per field instead of a scan of
+    the terms. The index remembers the terms list it was built from and
+    its length (see :meth:`current`): terms appended later, as by
+    ``_merge_extension``, are noticed, terms edited in place are not.
+    """
+
+    FIELDS = ["conceptId", "preferredTerm", "submissionValue"]
+
+    def __init__(self, terms: list[dict]):
+        self._terms = terms
+        self._size = len(terms)
+        self._concept_ids = {}
+        self._folded = {field: {} for field in self.FIELDS}
+        for position, term in enumerate(terms):
+            self._concept_ids.setdefault(term.get("conceptId", ""), position)
+            for field, positions in self._folded.items():
+                value = term.get(field)
+                positions.setdefault(
+                    value.casefold() if isinstance(value, str) else "", position
+                )
+
+    def current(self, terms: list[dict]) -> bool:
+        return terms is self._terms and len(terms) == self._size
+
+    def find(self, value: str, by: str = "any") -> tuple[dict, str]:
+        """The first term matching ``value``, with its source tag, as
+        :meth:`Library.find_in_terms`."""
+        needle = (value or "").casefold()
+        positions = []
+        if by in ("concept_id", "any"):
+            try:
+                positions.append(self._concept_ids.get(value))
+            except TypeError:
+                # Unhashable, equal to no conceptId
+                pass
+        if by in ("preferred_term", "any"):
+            positions.append(self._folded["preferredTerm"].get(needle))
+        if by in ("submission_value", "any"):
+            positions.append(self._folded["submissionValue"].get(needle))
+        positions = [position for position in positions if position is not None]
+        if not positions:
+            return (None, None)
+        term = self._terms[min(positions)]
+        return (term, term.get("source") or "cdisc")
+
+    def first(self, field: str, value: str) -> dict:
+        """The first term whose ``field`` matches ``value`` ignoring case."""
+        position = self._folded[field].get(value.casefold())
+        return None if position is None else self._terms[position]
+
+    def item(self, value: str) -> dict:
+        """The first term matching ``value`` ignoring case by conceptId,
+        failing that by preferred term, failing that by submission value."""
+        for field in self.FIELDS:
+            term = self.first(field, value)
+            if term is not None:
+                return term
+        return None
+
+
 class Library:
     """
     A class to manage CDISC controlled terminology (CT) data.
@@ -70,6 +135,7 @@ class Library:
         self._by_term = {}  # Maps term concept IDs to parent code list IDs
         self._by_submission = {}  # Maps submission values to parent code list IDs
         self._by_pt = {}  # Maps preferred terms to parent code list IDs
+        self._term_indexes = {}  # Maps concept IDs to code list term indexes
 
     def load(self) -> None:
         if self._cache.exists():
@@ -79,6 +145,9 @@ class Library:
             self._get_usdm_ct() if self._usdm() else self._get_all_ct()  # Fetch from API
             self._cache.save(self._by_code_list)  # Cache the results
         self._add_missing_ct()  # Add any additional required terminology
+        # Index the terms now, extensions included, rather than on first use
+        for code_list in self._by_code_list.values():
+            self._term_index(code_list)
         # Version reflects the loaded CT data, not a hardcoded default: the
         # newest effective_date across loaded codelists (missing/sponsor
         # codelists without a source are skipped).
@@ -224,7 +293,7 @@ class Library:
             raise MissingCodelistError(
                 f"Codelist {codelist_id!r} is loaded but has no terms"
             )
-        return self.find_in_terms(terms, value, by)
+        return self._term_index(cl).find(value, by)
 
     @staticmethod
     def find_in_terms(
@@ -232,34 +301,23 @@ class Library:
     ) -> tuple[dict, str]:
         """Search a list of CDISC term dicts for ``value``.
 
-        Returns ``(term, source_tag)`` or ``(None, None)``. This is the
-        core matching primitive — :meth:`find_in_codelist` resolves a
-        codelist_id to a terms list and delegates here, and
-        :meth:`RuleTemplate._ct_check` calls it directly with terms it
-        has already obtained via :meth:`klass_and_attribute`. One
-        matching primitive, two entry points; the membership semantics
-        live in exactly one place.
+        Returns ``(term, source_tag)`` or ``(None, None)``. The matching
+        itself is :meth:`TermIndex.find`, which :meth:`find_in_codelist`
+        uses with the index of the resolved codelist and
+        :meth:`RuleTemplate._ct_check` with an index of the terms it has
+        obtained via :meth:`klass_and_attribute`. One matching primitive,
+        three entry points; the membership semantics live in exactly one
+        place.
 
         See :meth:`is_in_codelist` for the ``by`` parameter semantics.
+        With ``"any"`` the first term matching on any of the three fields
+        wins. The terms are indexed afresh on every call, so a caller
+        looking up many values should build a :class:`TermIndex` once.
         """
-        needle = (value or "").casefold()
-        for term in terms:
-            if by in ("concept_id", "any") and term.get("conceptId", "") == value:
-                return (term, term.get("source") or "cdisc")
-            if (
-                by in ("preferred_term", "any")
-                and (term.get("preferredTerm") or "").casefold() == needle
-            ):
-                return (term, term.get("source") or "cdisc")
-            if (
-                by in ("submission_value", "any")
-                and (term.get("submissionValue") or "").casefold() == needle
-            ):
-                return (term, term.get("source") or "cdisc")
-        return (None, None)
+        return TermIndex(terms).find(value, by)
 
     def submission(self, value, cl=None):
-        if value in list(self._by_submission.keys()):
+        if value in self._by_submission:
             return self._find_in_collection(
                 self._by_submission[value], "submissionValue", value, cl
             )
@@ -267,7 +325,7 @@ class Library:
             return None
 
     def preferred_term(self, value, cl=None):
-        if value in list(self._by_pt.keys()):
+        if value in self._by_pt:
             return self._find_in_collection(
                 self._by_pt[value], "preferredTerm", value, cl
             )
@@ -282,45 +340,29 @@ class Library:
             return None
         elif len(concepts) == 1:
             code_list = self._by_code_list[concepts[0]]
-            return next(
-                (
-                    item
-                    for item in code_list["terms"]
-                    if item[key].upper() == value.upper()
-                ),
-                None,
-            )
+            return self._term_index(code_list).first(key, value)
         else:
             if cl and cl in concepts:
                 code_list = self._by_code_list[cl]
-                return next(
-                    (
-                        item
-                        for item in code_list["terms"]
-                        if item[key].upper() == value.upper()
-                    ),
-                    None,
-                )
+                return self._term_index(code_list).first(key, value)
             else:
                 return None
 
     def _get_item(self, code_list, value) -> dict:
         try:
-            for field in ["conceptId", "preferredTerm", "submissionValue"]:
-                result = next(
-                    (
-                        item
-                        for item in code_list["terms"]
-                        if item[field].upper() == value.upper()
-                    ),
-                    None,
-                )
-                if result:
-                    return result
-            return None
+            return self._term_index(code_list).item(value)
         except Exception:
             return None
 
+    def _term_index(self, code_list: dict) -> TermIndex:
+        """The :class:`TermIndex` of a loaded code list, built by ``load``,
+        or on first use, and rebuilt if its terms have been added to."""
+        index = self._term_indexes.get(code_list["conceptId"])
+        if index is None or not index.current(code_list["terms"]):
+            index = TermIndex(code_list["terms"])
+            self._term_indexes[code_list["conceptId"]] = index
+        return index
+
     def _get_usdm_ct(self) -> None:
         for item in self._config.required_code_lists():
             print(f"[{item}] ", end="", flush=True)
@@ -1,6 +1,15 @@
+import gc
 import json
+import threading
 from simple_error_log.errors import Errors
 from simple_error_log import ErrorLocation
+from usdm4.api.wrapper import Wrapper
+from usdm4.data_store.snapshot_cache import SnapshotCache
+
+try:
+    import ijson
+except ImportError:  # Optional, only needed by the stream mode
+    ijson = None
 
 
 class DataStoreErrorLocation(ErrorLocation):
@@ -25,123 +34,545 @@ class DecompositionError(Exception):
         return f"error decomposing the '.json' file, {self.message}, at {self.error}"
 
 
+class _Node:
+    """Compact per-instance record held by the DataStore: the instance,
+    the record of its parent, its position when held in a list attribute
+    and its enclosing scope instances."""
+
+    __slots__ = ("instance", "parent", "index", "scopes")
+
+    def __init__(self, instance: dict, parent: "_Node | None", index: int | None):
+        self.instance = instance
+        self.parent = parent
+        self.index = index
+        self.scopes = None
+
+
 class DataStore:
-    def __init__(self, filename: str):
+    TREE = "tree"
+    STREAM = "stream"
+    MODES = [TREE, STREAM]
+    # Longest string value shared between instances when streaming
+    SHARE_LIMIT = 64
+    # Classes whose nearest enclosing instance is recorded for every
+    # instance during decomposition, the scopes rules compare against
+    SCOPE_KLASSES = frozenset(
+        [
+            "StudyVersion",
+            "StudyDesign",
+            "InterventionalStudyDesign",
+            "ObservationalStudyDesign",
+            "ScheduleTimeline",
+            "StudyDefinitionDocumentVersion",
+        ]
+    )
+
+    def __init__(
+        self,
+        filename: str | None,
+        snapshot_dir: str | None = None,
+        mode: str = TREE,
+    ):
+        """``mode`` is how a file is parsed. ``"tree"``, the default, reads
+        the whole file and parses it with ``json``. ``"stream"`` parses the
+        file as it is read, with the optional ``ijson`` package, sharing
+        object keys and short string values between instances, so neither
+        the file's text nor repeated values are held. The peak memory of
+        decomposing a large file is well below that of ``"tree"``, at the
+        cost of a slower parse. Both modes build the same store.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown decomposition mode '{mode}', expected one of {self.MODES}"
+            )
+        if mode == self.STREAM and ijson is None:
+            raise ImportError(
+                "The stream mode needs the ijson package, pip install usdm4[stream]"
+            )
         self._klasses = {}
-        self._ids = {}
-        self._parent = {}
+        self._nodes = {}
         self._path = {}
+        self._referrers = {}
+        self._indexes = {}
+        self._duplicates = {}
+        self._lock = threading.Lock()
+        self._frozen = False
+        self._decomposed = False
         self.filename = filename
+        self.snapshot_dir = snapshot_dir
+        self.mode = mode
         self.data = None
         self.errors = Errors()
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DataStore":
+        """A store over an already-parsed USDM document, no file involved.
+
+        The dict is not modified. A null study id is replaced exactly as
+        for a loaded file, but in copies of the top-level and study
+        objects held by the store.
+        """
+        store = cls(None)
+        store.data = data
+        return store
+
+    @classmethod
+    def from_wrapper(cls, wrapper: Wrapper) -> "DataStore":
+        # JSON mode so values match what a save and reload would produce
+        return cls.from_dict(wrapper.model_dump(mode="json", by_alias=True))
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self) -> "DataStore":
+        """Mark the decomposed store read-only so that one store can be
+        shared by several consumers, including from different threads:
+        the rules engine (``validate_data``), ``TagResolver`` and
+        ``Builder.seed``. Returns the store. Raises ``RuntimeError`` if
+        the store has not been decomposed.
+
+        The indexes built by decomposition are not changed afterwards and
+        lookups return copies of them, so concurrent readers are safe. Two
+        caches are still filled in on first use: ``path_by_id`` stores
+        each path it builds, without a lock, as concurrent builds of a
+        path give the same string and a dict assignment is atomic, and
+        ``where`` builds each attribute index under ``_lock``, once. The
+        instances are the document's own dicts, shared by every consumer,
+        and must be treated as read-only.
+        """
+        if not self._decomposed:
+            raise RuntimeError("DataStore must be decomposed before it is frozen")
+        self._frozen = True
+        return self
+
     def decompose(self):
-        self.data = self._load_data()
-        self._check_study_id(self.data)
-        self._decompose(self.data, None, "")
+        if self._frozen:
+            raise RuntimeError("DataStore is frozen and cannot be decomposed again")
+        if self.snapshot_dir is not None and self.filename is not None:
+            self._decompose_cached()
+        else:
+            self._decompose_source()
+        self._decomposed = True
 
     def instance_by_id(self, id: str) -> dict:
-        if id not in self._ids:
+        if id not in self._nodes:
             return None
-        return self._ids[id]
+        return self._nodes[id].instance
 
     def path_by_id(self, id: str) -> str:
-        if id not in self._path:
+        # Paths are only needed to report failures, so are built on first
+        # request from the parent links and then kept
+        if id not in self._nodes:
             return None
+        if id not in self._path:
+            self._path[id] = self._node_path(self._nodes[id])
         return self._path[id]
 
+    def parent_by_id(self, id: str) -> dict:
+        """The instance directly containing instance ``id``, None for the
+        top-level wrapper or an unknown id."""
+        if id not in self._nodes or self._nodes[id].parent is None:
+            return None
+        return self._nodes[id].parent.instance
+
+    def instances(self) -> list:
+        """Every indexed instance as ``(id, instance)`` pairs."""
+        return [(id, node.instance) for id, node in self._nodes.items()]
+
+    def referrers(self, id: str, attribute: str | None = None) -> list:
+        """Instances that reference ``id`` from an ``...Id`` / ``...Ids``
+        attribute, in document order, optionally limited to one attribute
+        name (e.g. ``"criterionItemId"``)."""
+        by_attribute = self._referrers.get(id, {})
+        if attribute is not None:
+            return list(by_attribute.get(attribute, []))
+        referrers = {}
+        for instances in by_attribute.values():
+            for instance in instances:
+                referrers[instance["id"]] = instance
+        return list(referrers.values())
+
+    def has_klass(self, klass: str) -> bool:
+        """Whether the document holds at least one instance of ``klass``."""
+        return bool(self._klasses.get(klass))
+
     def instances_by_klass(self, klass: str) -> list:
         if klass not in self._klasses:
             return []
         return list(self._klasses[klass].values())
 
+    def duplicates(self) -> dict:
+        """Ids held by more than one instance, each mapped to every
+        occurrence as ``(instance, path)`` pairs in decomposition order.
+
+        Found while decomposing, so no further walk of the document is
+        needed. The paths are document JSONPaths (e.g.
+        ``$.study.versions[0].studyDesigns[0]``) rather than the class
+        paths of ``path_by_id``, which cannot tell the occurrences apart.
+        """
+        if not self._duplicates:
+            return {}
+        # Ids keep their first position in the index, so this lists them
+        # in order of first occurrence
+        return {
+            id: [
+                (node.instance, self._json_path(node)) for node in self._duplicates[id]
+            ]
+            for id in self._nodes
+            if id in self._duplicates
+        }
+
+    def changed_ids(self, previous: "DataStore") -> set:
+        """Ids of the instances whose content, sub-instances included,
+        differs from that of the instance with the same id in
+        ``previous``, another decomposed store, with the ids held by only
+        one of the two. Ids held more than once in either are included.
+
+        The documents are compared top down, an instance equal in both
+        settling its sub-instances, so only the branches holding a change
+        are compared further.
+        """
+        changed = set(self._nodes).symmetric_difference(previous._nodes)
+        changed.update(self._duplicates, previous._duplicates)
+        # The top-level object, which has no id, is indexed as "$root"
+        stack = [("$root", self.data)]
+        while stack:
+            id, instance = stack.pop()
+            node = previous._nodes.get(id)
+            if id not in changed and node is not None and node.instance == instance:
+                continue
+            changed.add(id)
+            for value in instance.values():
+                for item in value if isinstance(value, list) else [value]:
+                    if isinstance(item, dict):
+                        stack.append((item["id"], item))
+        return changed
+
+    def where(self, klass: str, attribute_path: str, value) -> list:
+        """Instances of ``klass`` whose attribute equals ``value``, in
+        document order. ``attribute_path`` may be dotted to reach into
+        nested objects, e.g. ``where("Timing", "type.code", "C201358")``;
+        an absent or null attribute matches ``None``.
+
+        Each (klass, attribute_path) is indexed by value on first use and
+        the index kept, so later selections are a dict lookup rather than
+        a scan of the class.
+        """
+        key = (klass, attribute_path)
+        if key not in self._indexes:
+            # One build per index even with concurrent first queries
+            with self._lock:
+                if key not in self._indexes:
+                    self._indexes[key] = self._index(klass, attribute_path.split("."))
+        return list(self._indexes[key].get(value, []))
+
+    def ancestor(self, id: str, klass: str) -> dict:
+        """Nearest instance of ``klass`` enclosing instance ``id``, the
+        instance itself if it is a ``klass``. A dict lookup for the
+        SCOPE_KLASSES, a walk up the parent chain for any other class."""
+        return self.parent_by_klass(id, klass)
+
     def parent_by_klass(self, id: str, klasses: str | list) -> dict:
-        klasses = [klasses] if isinstance(klasses, str) else klasses
-        found = False
-        if id not in self._ids:
+        node = self._nodes.get(id)
+        if node is None:
             return None
-        instance = self._ids[id]
-        while not found:
-            if "instanceType" not in instance:
-                return None
-            elif instance["instanceType"] in klasses:
-                found = True
-            else:
-                instance = self._parent[instance["id"]]
-        return instance
+        if isinstance(klasses, str):
+            if klasses in self.SCOPE_KLASSES:
+                return node.scopes.get(klasses)
+            klasses = [klasses]
+        elif self.SCOPE_KLASSES.issuperset(klasses):
+            # Scopes are held nearest last
+            scopes = node.scopes
+            for klass in reversed(scopes):
+                if klass in klasses:
+                    return scopes[klass]
+            return None
+        while node is not None and "instanceType" in node.instance:
+            if node.instance["instanceType"] in klasses:
+                return node.instance
+            node = node.parent
+        return None
+
+    def _index(self, klass: str, attributes: list) -> dict:
+        index = {}
+        for instance in self.instances_by_klass(klass):
+            value = instance
+            for attribute in attributes:
+                value = value.get(attribute) if isinstance(value, dict) else None
+            # Lists and objects cannot be selected by value, so are left out
+            if isinstance(value, (dict, list)):
+                continue
+            index.setdefault(value, []).append(instance)
+        return index
+
+    def _decompose_cached(self) -> None:
+        """Reload the decomposition from a snapshot of an identical file,
+        decomposing and saving a snapshot when there is none."""
+        cache = SnapshotCache(self.snapshot_dir)
+        key = cache.key(self.filename)
+        # Reloading creates every object in one go, pausing the cyclic
+        # collector meanwhile saves it repeatedly scanning them
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            state = cache.read(key)
+            if state is not None:
+                self._restore(state)
+        finally:
+            if enabled:
+                gc.enable()
+        if state is None:
+            self._decompose_source()
+            cache.save(key, self._snapshot())
+
+    def _snapshot(self) -> dict:
+        """The decomposed state with node records flattened into lists,
+        far cheaper to pickle and reload than the records themselves.
+
+        The node table holds every indexed record and every record on
+        their parent chains, which can include records shadowed by a
+        duplicate id.
+        """
+        positions = {}
+        nodes = []
+        indexed = list(self._nodes.values())
+        for occurrences in self._duplicates.values():
+            indexed.extend(occurrences)
+        for node in indexed:
+            while node is not None and id(node) not in positions:
+                positions[id(node)] = len(nodes)
+                nodes.append(node)
+                node = node.parent
+        return {
+            "data": self.data,
+            "klasses": self._klasses,
+            "referrers": self._referrers,
+            "errors": self.errors,
+            "instances": [node.instance for node in nodes],
+            "parents": [
+                positions[id(node.parent)] if node.parent else None for node in nodes
+            ],
+            "indexes": [node.index for node in nodes],
+            "scopes": [node.scopes for node in nodes],
+            "ids": list(self._nodes.keys()),
+            "positions": [positions[id(node)] for node in self._nodes.values()],
+            "duplicates": {
+                key: [positions[id(node)] for node in occurrences]
+                for key, occurrences in self._duplicates.items()
+            },
+        }
 
-    def _decompose(self, data, parent, path, instance_index=None) -> None:
-        if isinstance(data, dict):
-            path = self._add_klass_instance(data, parent, path, instance_index)
+    def _restore(self, state: dict) -> None:
+        nodes = [
+            _Node(instance, None, index)
+            for instance, index in zip(state["instances"], state["indexes"])
+        ]
+        for node, parent, scopes in zip(nodes, state["parents"], state["scopes"]):
+            if parent is not None:
+                node.parent = nodes[parent]
+            node.scopes = scopes
+        self.data = state["data"]
+        self._klasses = state["klasses"]
+        self._referrers = state["referrers"]
+        self.errors = state["errors"]
+        self._nodes = {
+            id: nodes[position]
+            for id, position in zip(state["ids"], state["positions"])
+        }
+        self._duplicates = {
+            id: [nodes[position] for position in positions]
+            for id, positions in state["duplicates"].items()
+        }
+
+    def _decompose_source(self) -> None:
+        if self.filename is not None:
+            self.data = self._load_data()
+        self.data = self._check_study_id(self.data)
+        self._decompose(self.data)
+
+    def _decompose(self, data) -> None:
+        # Explicit stack rather than recursion: no per-level call overhead
+        # and no recursion limit on deeply nested documents. Children are
+        # pushed in reverse so instances are still visited in document
+        # order.
+        stack = [_Node(data, None, None)]
+        while stack:
+            node = stack.pop()
+            data = node.instance
+            self._add_klass_instance(node)
+            node.scopes = self._scopes(data, node.parent.scopes if node.parent else {})
+            children = []
             for key, value in data.items():
                 if isinstance(value, dict):
-                    self._decompose(value, data, path)
+                    children.append(_Node(value, node, None))
                 elif isinstance(value, list):
+                    if key.endswith("Ids"):
+                        self._add_references(data, key, value)
                     for index, item in enumerate(value):
-                        self._decompose(item, data, path, index)
+                        if isinstance(item, dict):
+                            children.append(_Node(item, node, index))
+                elif key.endswith("Id"):
+                    self._add_references(data, key, [value])
+            stack.extend(reversed(children))
 
-    def _add_klass_instance(self, data, parent, path, instance_index) -> None:
-        id, klass = self._check_id_klass(parent, data, path)
-        path = self._update_path(path, data, instance_index)
+    def _add_klass_instance(self, node: _Node) -> None:
+        id, klass = self._check_id_klass(node.parent, node.instance)
         if klass not in self._klasses:
             self._klasses[klass] = {}
-        if id in self._ids:
-            location = DataStoreErrorLocation(path, klass, "id")
+        if id in self._nodes:
+            location = DataStoreErrorLocation(self._node_path(node), klass, "id")
             self.errors.add("Duplicate id '{id}' detected", location, "DUP_ID")
-        self._klasses[klass][id] = data
-        self._ids[id] = data
-        self._path[id] = path
-        self._parent[id] = parent
-        return path
+            # Every occurrence is kept, the index itself holds the last
+            self._duplicates.setdefault(id, [self._nodes[id]]).append(node)
+        self._klasses[klass][id] = node.instance
+        self._nodes[id] = node
+
+    def _scopes(self, data: dict, scopes: dict) -> dict:
+        """The enclosing scope instances for ``data`` given its parent's.
+
+        The parent's dict is shared by every descendant and only copied
+        when ``data`` itself opens a scope, keeping the nearest last.
+        """
+        klass = data.get("instanceType")
+        if klass not in self.SCOPE_KLASSES:
+            return scopes
+        scopes = {k: v for k, v in scopes.items() if k != klass}
+        scopes[klass] = data
+        return scopes
+
+    def _add_references(self, data: dict, attribute: str, values: list) -> None:
+        for value in values:
+            if isinstance(value, str) and value:
+                by_attribute = self._referrers.setdefault(value, {})
+                by_attribute.setdefault(attribute, []).append(data)
+
+    def _json_path(self, node: _Node) -> str:
+        """Document JSONPath of an instance, built from the attribute of
+        each parent that holds the record's instance."""
+        parts = []
+        while node.parent is not None:
+            for key, value in node.parent.instance.items():
+                if node.index is None:
+                    if value is node.instance:
+                        parts.append(f".{key}")
+                        break
+                elif (
+                    isinstance(value, list)
+                    and node.index < len(value)
+                    and value[node.index] is node.instance
+                ):
+                    parts.append(f".{key}[{node.index}]")
+                    break
+            node = node.parent
+        parts.append("$")
+        return "".join(reversed(parts))
+
+    def _node_path(self, node: _Node) -> str:
+        """JSON path of an instance built by walking its parent records.
+
+        Records link objects rather than ids, so the path is right even
+        for an instance whose id, or an ancestor's, is duplicated.
+        """
+        parts = []
+        while node.parent is not None:
+            parts.append(self._update_path("", node.instance, node.index))
+            node = node.parent
+        parts.append("$")
+        return "".join(reversed(parts))
 
     def _load_data(self) -> dict:
+        if self.mode == self.STREAM:
+            return self._stream_data()
         with open(self.filename, "r") as file:
             return json.load(file)
 
+    def _stream_data(self) -> dict:
+        """The document built from ijson's parse events as the file is read.
+
+        Keys and short string values are looked up in a memo of those seen
+        so far, so the many instances repeating a key, code, code system
+        or class name share one string.
+        """
+        memo = {}
+        stack = []
+        key = None
+        with open(self.filename, "rb") as file:
+            for event, value in ijson.basic_parse(file, use_float=True):
+                if event == "map_key":
+                    key = memo.setdefault(value, value)
+                    continue
+                if event == "end_map" or event == "end_array":
+                    value = stack.pop()
+                    if not stack:
+                        return value
+                    continue
+                if event == "start_map":
+                    value = {}
+                elif event == "start_array":
+                    value = []
+                elif event == "string" and len(value) <= self.SHARE_LIMIT:
+                    value = memo.setdefault(value, value)
+                if stack:
+                    container = stack[-1]
+                    if type(container) is dict:
+                        container[key] = value
+                    else:
+                        container.append(value)
+                if event == "start_map" or event == "start_array":
+                    stack.append(value)
+                elif not stack:
+                    return value
+
     def _update_path(self, path: str, data: dict, instance_index: int) -> str:
         path = path + "." + data["instanceType"] if "instanceType" in data else "$"
         path = path + f"[{instance_index}]" if instance_index is not None else path
         return path
 
-    def _check_id_klass(self, parent: dict, data: dict, path: str) -> None:
-        id, error = self._check_id(parent, data, path)
+    def _check_id_klass(self, parent: _Node, data: dict) -> None:
+        id, error = self._check_id(parent, data)
         if error:
             raise DecompositionError(error, "missing id attribute")
-        klass, error = self._check_instance_type(parent, data, path)
+        klass, error = self._check_instance_type(parent, data)
         if error:
             raise DecompositionError(error, "missing instanceType attribute")
         return id, klass
 
-    def _check_id(self, parent: dict, data: dict, path: str) -> None:
+    def _check_id(self, parent: _Node, data: dict) -> None:
         if parent:
             if "id" in data:
                 return data["id"], None
             else:
                 klass = data["instanceType"] if "instanceType" in data else ""
+                path = self._node_path(parent)
                 return None, DataStoreErrorLocation(path, klass, "id")
         else:
             return "$root", None
 
-    def _check_instance_type(self, parent: dict, data: dict, path: str) -> None:
+    def _check_instance_type(self, parent: _Node, data: dict) -> None:
         if parent:
             if "instanceType" in data:
                 return data["instanceType"], None
             else:
                 id = data["id"] if "id" in data else ""
                 return None, DataStoreErrorLocation(
-                    path, f"missing instanceType for id '{id}'", "instanceType"
+                    self._node_path(parent),
+                    f"missing instanceType for id '{id}'",
+                    "instanceType",
                 )
         else:
             return "Wrapper", None
 
-    def _check_study_id(self, data):
-        # Do not want a null study id though it is permitted
+    def _check_study_id(self, data: dict) -> dict:
+        # Do not want a null study id though it is permitted. The substitute
+        # goes into copies of the top-level and study objects, leaving the
+        # source document untouched.
         if "study" not in data:
             location = DataStoreErrorLocation("$", "study", "")
             raise DecompositionError(location, "missing study attribute")
         if "id" not in data["study"]:
             location = DataStoreErrorLocation("$.Study", "study", "id")
             raise DecompositionError(location, "missing id attribute")
-        data["study"]["id"] = (
-            "$root.study.id" if data["study"]["id"] is None else data["study"]["id"]
-        )
+        if data["study"]["id"] is None:
+            return {**data, "study": {**data["study"], "id": "$root.study.id"}}
+        return data
@@ -0,0 +1,15 @@
+from usdm4.file_cache.pickle_cache import PickleCache
+
+
+class SnapshotCache(PickleCache):
+    """On-disk cache of decomposed DataStores keyed by file content.
+
+    A snapshot is the parsed document together with the indexes built over
+    it, pickled so that reloading it costs far less than parsing and
+    decomposing the JSON again. Snapshots are named by the SHA-256 of the
+    file contents and the snapshot format version, so an edited file or a
+    change to the DataStore layout simply misses the cache.
+    """
+
+    # Bump whenever the state saved by DataStore changes shape
+    VERSION = 2
@@ -0,0 +1,66 @@
+import os
+import pickle
+import hashlib
+import tempfile
+
+
+class PickleCache:
+    """On-disk cache of pickled objects keyed by file content.
+
+    Entries are named by a SHA-256 over the contents of a file, any further
+    parts given to :meth:`key` and the cache format ``VERSION``, so that a
+    change to any of them simply misses the cache. Subclasses set
+    ``VERSION`` and bump it whenever the objects they store change shape.
+
+    The cache is an optimisation only: an entry that cannot be read is
+    treated as a miss and one that cannot be written is skipped.
+    """
+
+    VERSION = 1
+    EXTENSION = ".pickle"
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+
+    def key(self, filename: str, *parts: str) -> str:
+        digest = hashlib.sha256()
+        with open(filename, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        for part in [*parts, f"v{self.VERSION}"]:
+            digest.update(b"\0" + part.encode())
+        return digest.hexdigest()
+
+    def exists(self, key: str) -> bool:
+        return os.path.isfile(self._full_filepath(key))
+
+    def read(self, key: str) -> object | None:
+        try:
+            with open(self._full_filepath(key), "rb") as file:
+                return pickle.load(file)
+        except Exception:
+            return None
+
+    def save(self, key: str, value: object) -> None:
+        # Written to a temporary file and renamed so a concurrent reader
+        # never sees a partial entry
+        try:
+            os.makedirs(self.filepath, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=self.filepath, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp, self._full_filepath(key))
+            except Exception:
+                os.remove(temp)
+        except Exception:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._full_filepath(key))
+        except Exception:
+            pass
+
+    def _full_filepath(self, key: str) -> str:
+        return os.path.join(self.filepath, f"{key}{self.EXTENSION}")
@@ -0,0 +1,117 @@
+import os
+import traceback
+import multiprocessing
+from typing import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.results import RulesValidationResults
+
+# The engine of a worker process, set up once when the worker starts
+_engine: RulesValidationEngine | None = None
+
+
+def _start_worker(
+    engine: RulesValidationEngine | None, root_path: str, package_name: str
+) -> None:
+    # A forked worker is handed the parent's engine, rules and terminology
+    # already loaded; otherwise the worker loads its own
+    global _engine
+    _engine = engine or RulesValidationEngine(root_path, package_name)
+    _engine._ct_library()
+
+
+def _validate_file(filename: str, snapshot_dir: str | None) -> RulesValidationResults:
+    try:
+        return _engine.validate_rules(filename, snapshot_dir=snapshot_dir)
+    except Exception as e:
+        results = RulesValidationResults()
+        results.add_exception("Validation", e, f"{traceback.format_exc()}")
+        return results
+
+
+class BatchValidation:
+    """Validate many USDM JSON files with the rule library on a pool of
+    worker processes.
+
+    The workers are started once per batch and keep their rules and
+    terminology for every file they validate. Results are yielded as each
+    file completes, so not in the order the files were given. A file whose
+    validation raises is reported with an exception outcome; a file that
+    kills its worker (e.g. a crash or the process running out of memory)
+    is pinned down by re-running the files that were in flight one at a
+    time, reported the same way, and the rest of the batch carries on.
+    """
+
+    def __init__(
+        self,
+        engine: RulesValidationEngine,
+        workers: int | None = None,
+        snapshot_dir: str | None = None,
+    ):
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.snapshot_dir = snapshot_dir
+
+    def validate(
+        self, filenames: Iterable[str]
+    ) -> Iterator[tuple[str, RulesValidationResults]]:
+        pending = list(filenames)
+        while pending:
+            unfinished = yield from self._run(pending, self.workers)
+            # The worker that died was running one of the first files still
+            # unfinished, the pool having taken at most one more file than it
+            # has workers
+            suspects = unfinished[: self.workers + 1]
+            for filename in suspects:
+                if (yield from self._run([filename], 1)):
+                    yield filename, self._crashed()
+            pending = unfinished[len(suspects) :]
+
+    def _run(
+        self, filenames: list[str], workers: int
+    ) -> Iterator[tuple[str, RulesValidationResults]]:
+        # Yields the results of the files that completed and returns the
+        # files, in their original order, left unfinished by a broken pool
+        unfinished = set()
+        pool = self._pool(workers)
+        try:
+            futures = {
+                pool.submit(_validate_file, filename, self.snapshot_dir): index
+                for index, filename in enumerate(filenames)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    unfinished.add(index)
+                    continue
+                yield filenames[index], results
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return [filenames[index] for index in sorted(unfinished)]
+
+    def _pool(self, workers: int) -> ProcessPoolExecutor:
+        if RulesValidationEngine._can_fork():
+            # Load the terminology before forking so the workers share it
+            self.engine._ct_library()
+            context, engine = multiprocessing.get_context("fork"), self.engine
+        else:
+            context, engine = multiprocessing.get_context("spawn"), None
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_start_worker,
+            initargs=(engine, self.engine.root_path, self.engine.package_name),
+        )
+
+    def _crashed(self) -> RulesValidationResults:
+        results = RulesValidationResults()
+        results.add_exception(
+            "Validation",
+            BrokenProcessPool(
+                "The worker process terminated while validating the file"
+            ),
+        )
+        return results
@@ -1,17 +1,268 @@
+import io
 import os
 import sys
+import time
+import hashlib
+import pstats
+import cProfile
 import inspect
 import importlib
+import threading
 import traceback
+import tracemalloc
+import multiprocessing
 from pathlib import Path
-from typing import List, Type
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Type
+from usdm4.__info__ import __package_version__
 from usdm4.rules.rule_template import RuleTemplate
+from usdm4.rules.rule_registry import RuleRegistry
+from usdm4.rules.results_cache import ResultsCache
+from usdm4.api.wrapper import Wrapper
 from usdm4.data_store.data_store import DataStore, DecompositionError
 from usdm4.ct.cdisc.library import Library as CTLibrary
-from usdm4.rules.results import RulesValidationResults
+from usdm4.rules.results import (
+    RuleOutcome,
+    RuleProfile,
+    RuleStatus,
+    RulesValidationResults,
+)
+
+# Rules and config of the process pool run in progress, inherited by the
+# forked workers so that neither is pickled
+_shared: dict = {}
+_shared_lock = threading.Lock()
+
+
+def _run_shared_rule(index: int) -> RuleOutcome:
+    return RulesValidationEngine._run_rule(
+        _shared["rules"][index], _shared["config"], timeout=_shared.get("timeout")
+    )
+
+
+class _ChangedAnswer(Exception):
+    """Raised on finding a changed instance in the answer to a query."""
+
+
+def _fingerprint(answer, changed: set, duplicated: set):
+    """A store's answer to a query with each of its instances replaced by
+    its id, so that the answers of two stores compare without comparing
+    whole instances. Raises _ChangedAnswer if any of them is one of the
+    ``changed`` (see ``DataStore.changed_ids``). An instance whose id is
+    ``duplicated``, so does not identify it, is kept to compare by value."""
+    if isinstance(answer, dict):
+        if "instanceType" in answer:
+            if answer["id"] in duplicated:
+                return answer
+            if answer["id"] in changed:
+                raise _ChangedAnswer(answer["id"])
+            return answer["id"]
+        # The top-level object, or a mapping such as duplicates()
+        return tuple(
+            (key, _fingerprint(value, changed, duplicated))
+            for key, value in answer.items()
+        )
+    if isinstance(answer, (list, tuple)):
+        return tuple(_fingerprint(value, changed, duplicated) for value in answer)
+    return answer
+
+
+class RuleTimeout(BaseException):
+    """Raised in a rule that has run past its time budget. Not an
+    ``Exception``, so that a rule's ``except Exception`` does not swallow
+    it."""
+
+
+class _CheckedList(list):
+    """Instances handed to a rule with a time budget, checking the budget
+    as the rule iterates over them."""
+
+    def __init__(self, instances: list, check: Callable[[], None]):
+        super().__init__(instances)
+        self._check = check
+
+    def __iter__(self):
+        for instance in super().__iter__():
+            self._check()
+            yield instance
+
+
+class _RuleStore:
+    """The DataStore as seen by one rule, counting the instances the rule
+    enumerates from it and recording the queries it makes as
+    ``(method, args, kwargs)`` in ``reads``, the keyword arguments as
+    sorted ``(name, value)`` pairs. Reading anything other than a query
+    from the store leaves ``reads`` None, what the rule saw being unknown.
+    With a ``check`` it is called on every query and as the rule iterates
+    over the instances it is given, so that a rule over its time budget
+    is stopped.
+    """
+
+    QUERIES = [
+        "instance_by_id",
+        "path_by_id",
+        "parent_by_id",
+        "referrers",
+        "duplicates",
+        "ancestor",
+        "parent_by_klass",
+        "has_klass",
+    ]
+
+    def __init__(self, data_store: DataStore, check: Callable[[], None] | None = None):
+        self._data_store = data_store
+        self._check = check
+        self.count = 0
+        self.reads: set[tuple] | None = set()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._data_store, name)
+        if name not in self.QUERIES:
+            self.reads = None
+            return attribute
+
+        def query(*args, **kwargs):
+            if self._check:
+                self._check()
+            self._read(name, args, kwargs)
+            return attribute(*args, **kwargs)
+
+        return query
+
+    def instances_by_klass(self, klass: str) -> list:
+        return self._checked(
+            self.visited(klass, self._data_store.instances_by_klass(klass))
+        )
+
+    def visited(self, klass: str, instances: list) -> list:
+        # Also used by the engine for the instances it hands to a visitor
+        self._read("instances_by_klass", (klass,))
+        self.count += len(instances)
+        return instances
+
+    def where(self, klass: str, attribute_path: str, value) -> list:
+        self._read("where", (klass, attribute_path, value))
+        instances = self._data_store.where(klass, attribute_path, value)
+        self.count += len(instances)
+        return self._checked(instances)
+
+    def instances(self) -> list:
+        self._read("instances", ())
+        instances = self._data_store.instances()
+        self.count += len(instances)
+        return self._checked(instances)
+
+    def _checked(self, instances: list) -> list:
+        if self._check is None:
+            return instances
+        self._check()
+        return _CheckedList(instances, self._check)
+
+    def _read(self, name: str, args: tuple, kwargs: dict | None = None) -> None:
+        if self.reads is None:
+            return
+        kwargs = tuple(sorted(kwargs.items())) if kwargs else ()
+        try:
+            self.reads.add((name, args, kwargs))
+        except TypeError:
+            # Lists of classes are passed to parent_by_klass
+            read = (
+                name,
+                tuple(tuple(a) if isinstance(a, list) else a for a in args),
+                tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs),
+            )
+            try:
+                self.reads.add(read)
+            except TypeError:
+                self.reads = None
+
+
+class _Stopwatch:
+    """Wall and CPU time spent running one rule, over one or more spells,
+    and optionally a cProfile and tracemalloc capture of them. ``check``
+    raises RuleTimeout once the wall time exceeds ``timeout`` seconds."""
+
+    PROFILE_LINES = 30
+
+    def __init__(self, profile: bool = False, timeout: float | None = None):
+        self.timeout = timeout
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self._profiler = cProfile.Profile() if profile else None
+        self._peak_memory = 0
+        self._snapshot = None
+
+    def __enter__(self) -> "_Stopwatch":
+        if self._profiler:
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._memory = tracemalloc.get_traced_memory()[0]
+            self._profiler.enable()
+        self.resume(time.perf_counter(), time.thread_time())
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.pause(time.perf_counter(), time.thread_time())
+        if self._profiler:
+            self._profiler.disable()
+            peak = tracemalloc.get_traced_memory()[1] - self._memory
+            self._peak_memory = max(self._peak_memory, peak)
+            self._snapshot = tracemalloc.take_snapshot()
+            if self._tracing:
+                tracemalloc.stop()
+
+    def resume(self, wall: float, cpu: float) -> None:
+        """Start a spell at the given ``perf_counter`` and ``thread_time``
+        readings, which the caller may have taken for something else."""
+        self._wall = wall
+        self._cpu = cpu
+
+    def pause(self, wall: float, cpu: float) -> None:
+        self.wall_time += wall - self._wall
+        self.cpu_time += cpu - self._cpu
+
+    def check(self) -> None:
+        # Only called while the rule runs, so within a spell
+        if (
+            self.timeout is not None
+            and self.wall_time + time.perf_counter() - self._wall > self.timeout
+        ):
+            raise RuleTimeout(f"Rule exceeded its time budget of {self.timeout}s")
+
+    def record(self, outcome: RuleOutcome, data: _RuleStore) -> RuleOutcome:
+        outcome.wall_time = self.wall_time
+        outcome.cpu_time = self.cpu_time
+        outcome.instance_count = data.count
+        # A rule stopped part way has read only part of what it would have
+        outcome.reads = None if outcome.status == RuleStatus.TIMEOUT else data.reads
+        if self._profiler:
+            stream = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.PROFILE_LINES)
+            allocations = self._snapshot.statistics("lineno")[: self.PROFILE_LINES]
+            outcome.profile = RuleProfile(
+                stream.getvalue(),
+                self._peak_memory,
+                "\n".join(str(allocation) for allocation in allocations),
+            )
+        return outcome
 
 
 class RulesValidationEngine:
+    THREAD = "thread"
+    PROCESS = "process"
+    EXECUTORS = [THREAD, PROCESS]
+    # The sources, relative to the root path, that decide the results of a
+    # validation besides the file and the terminology version
+    LIBRARY_SOURCES = [
+        "rules/**/*.py",
+        "data_store/**/*.py",
+        "ct/cdisc/**/*.py",
+        "ct/cdisc/**/*.yaml",
+    ]
+
     def __init__(self, root_path: str, package_name: str):
         self.root_path = root_path
         # print(f"LIBRARY: {root_path}, {package_name}")
@@ -19,29 +270,414 @@ class RulesValidationEngine:
         # print(f"PATHS: {self.root_path}, {self.library_path}, {self.ct_path}")
         self.package_name = package_name
         self.rules: List[Type[RuleTemplate]] = []
+        # Terminology is loaded on first use and kept for later calls
+        self._ct: CTLibrary | None = None
+        self._ct_lock = threading.Lock()
+        self._library_digest: str | None = None
         self._load_rules()
 
-    def validate_rules(self, filename: str) -> RulesValidationResults:
-        data_store, e = self._data_store(filename)
+    def validate_rules(
+        self,
+        filename: str,
+        *,
+        snapshot_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        profile_rule: str | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        results_cache: ResultsCache | None = None,
+        bypass_cache: bool = False,
+        max_failures: int | None = None,
+        rule_timeout: float | None = None,
+    ) -> RulesValidationResults:
+        """Validate a USDM JSON file. Rules run one after another unless
+        ``max_workers`` is greater than one, in which case they run on a
+        pool of that size, threads or (``executor=PROCESS``) forked
+        processes sharing the decomposed document. The results are the
+        same, in the same rule order, either way.
+
+        Every outcome records the rule's wall and CPU time and the number
+        of instances it examined. ``profile_rule`` names a rule (e.g.
+        ``"DDF00010"``) to run on its own, before the others, under
+        cProfile and tracemalloc; its outcome carries the capture.
+
+        ``include`` and ``exclude`` select the rules to run by rule id or
+        tag (e.g. ``["DDF00060", RuleTemplate.CT]``): only the rules
+        matching ``include``, when given, less those matching ``exclude``.
+        Rules not selected are left out of the results. A selected rule
+        whose ``requires`` classes have no instance in the document is
+        not run and reported as skipped.
+
+        With a ``results_cache`` the results of an identical file, rule
+        library, terminology version and selection are returned from it
+        without decomposing the file or running any rule. Fresh results
+        are saved to it; ``bypass_cache`` (implied by ``profile_rule``)
+        skips the lookup, so refreshing the entry.
+
+        ``max_failures`` turns the validation into a gate: the ERROR
+        level rules run before the others and the validation stops once
+        that many rules have failed or raised. The rules it stopped
+        before are reported as not run (see ``not_run()`` on the results).
+        On a pool, rules not yet handed to a worker are dropped; the few
+        already started finish, though they are also reported as not run.
+        Gated results are incomplete so are not saved to the cache,
+        though complete results found there are returned.
+
+        ``rule_timeout`` is a budget, in seconds of wall time, for each
+        rule. The budget is checked whenever the rule queries the store
+        and as it iterates over the instances it is given, so a rule
+        caught in a loop over the document is stopped; one spending its
+        time elsewhere (e.g. on one huge text) is stopped at its next
+        read. A rule stopped is reported with a timeout outcome, and
+        results holding one are not saved to the cache."""
+        self._check_executor(executor)
+        self._check_max_failures(max_failures)
+        self._check_rule_timeout(rule_timeout)
+        self._check_profile_rule(profile_rule)
+        selected = self._select_rules(include, exclude)
+        if results_cache is not None:
+            key = results_cache.key(
+                filename,
+                self._library_version(),
+                self._ct_library().version,
+                repr(
+                    [sorted(names) if names else names for names in (include, exclude)]
+                ),
+            )
+            if not bypass_cache and profile_rule is None:
+                results = results_cache.read(key)
+                if results is not None:
+                    return results
+        results = self._validate(
+            *self._data_store(filename, snapshot_dir),
+            max_workers,
+            executor,
+            profile_rule,
+            selected,
+            max_failures,
+            rule_timeout,
+        )
+        if (
+            results_cache is not None
+            and max_failures is None
+            and not results.by_status(RuleStatus.TIMEOUT)
+        ):
+            results_cache.save(key, results)
+        return results
+
+    def iter_validate(
+        self,
+        filename: str,
+        *,
+        snapshot_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        rule_timeout: float | None = None,
+    ) -> Iterator[RuleOutcome | RulesValidationResults]:
+        """Validate a USDM JSON file as :meth:`validate_rules` does,
+        yielding each rule's ``RuleOutcome`` as soon as the rule has
+        finished and, last, the ``RulesValidationResults`` that
+        :meth:`validate_rules` would have returned.
+
+        Outcomes come in the order the rules finish: skipped rules first,
+        then the visiting rules together once the document has been
+        walked, then the others; on a thread pool, whichever finishes
+        first. The arguments are checked on the call, the file is only
+        decomposed once iteration starts."""
+        self._check_executor(executor)
+        self._check_rule_timeout(rule_timeout)
+        selected = self._select_rules(include, exclude)
+        return self._iter_validate(
+            filename, snapshot_dir, max_workers, executor, selected, rule_timeout
+        )
+
+    def validate_data(
+        self,
+        data: dict | Wrapper | DataStore,
+        *,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        profile_rule: str | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_failures: int | None = None,
+        rule_timeout: float | None = None,
+    ) -> RulesValidationResults:
+        """Validate an in-memory USDM document (a dict or a ``Wrapper``)
+        without writing it to, and re-reading it from, a file. A
+        ``DataStore`` is validated as given, it must already be decomposed
+        (e.g. a frozen store shared with other consumers). The other
+        arguments are as for :meth:`validate_rules`."""
+        self._check_executor(executor)
+        self._check_max_failures(max_failures)
+        self._check_rule_timeout(rule_timeout)
+        self._check_profile_rule(profile_rule)
+        selected = self._select_rules(include, exclude)
+        return self._validate(
+            *self._data_store_for(data),
+            max_workers,
+            executor,
+            profile_rule,
+            selected,
+            max_failures,
+            rule_timeout,
+        )
+
+    def validate_incremental(
+        self,
+        data: dict | Wrapper | DataStore,
+        previous_data: DataStore,
+        previous: RulesValidationResults,
+        *,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        rule_timeout: float | None = None,
+    ) -> RulesValidationResults:
+        """Validate a changed document, running again only the rules that
+        could see the change. ``previous`` are this engine's results for
+        ``previous_data``, the decomposed document before the change.
+
+        Every outcome records the queries its rule made of the store; a
+        rule whose queries all answer the same for both documents has its
+        previous outcome, timings included, carried forward. The documents
+        are compared once, for the ids of the instances changed (see
+        ``DataStore.changed_ids``); an answer holding none of them is
+        compared by the ids of the instances in it. The results
+        are otherwise those of :meth:`validate_data`, the other arguments
+        being as for it. ``data`` is best given as a decomposed
+        ``DataStore``, to be passed as ``previous_data`` next time. The
+        terminology must not have been reloaded since ``previous``. A
+        rule that timed out is always run again."""
+        self._check_executor(executor)
+        self._check_rule_timeout(rule_timeout)
+        selected = self._select_rules(include, exclude)
+        data_store, e = self._data_store_for(data)
+        if data_store is None:
+            return self._validate(None, e)
+        changed = data_store.changed_ids(previous_data)
+        duplicated = set(data_store.duplicates()) | set(previous_data.duplicates())
+        answers: dict[tuple, bool] = {}
+
+        def answer(store: DataStore, read: tuple):
+            name, args, kwargs = read
+            return _fingerprint(
+                getattr(store, name)(*args, **dict(kwargs)), changed, duplicated
+            )
+
+        def unchanged(read: tuple) -> bool:
+            # Each query is put to both stores once, whichever rules made it
+            if read not in answers:
+                try:
+                    answers[read] = answer(previous_data, read) == answer(
+                        data_store, read
+                    )
+                except _ChangedAnswer:
+                    answers[read] = False
+            return answers[read]
+
+        carried = {}
+        for rule_class in selected:
+            outcome = previous.outcomes.get(self._rule_id(rule_class))
+            if (
+                outcome is not None
+                and outcome.reads is not None
+                and all(unchanged(read) for read in outcome.reads)
+            ):
+                carried[rule_class] = outcome
+        ran = self._validate(
+            data_store,
+            None,
+            max_workers,
+            executor,
+            None,
+            [rule_class for rule_class in selected if rule_class not in carried],
+            None,
+            rule_timeout,
+        )
+        results = RulesValidationResults()
+        for rule_class in selected:
+            results.add_outcome(
+                carried.get(rule_class) or ran.outcomes[self._rule_id(rule_class)]
+            )
+        return results
+
+    def _iter_validate(
+        self,
+        filename: str,
+        snapshot_dir: str | None,
+        max_workers: int | None,
+        executor: str,
+        selected: list[Type[RuleTemplate]],
+        timeout: float | None,
+    ) -> Iterator[RuleOutcome | RulesValidationResults]:
+        data_store, e = self._data_store(filename, snapshot_dir)
+        if data_store is None:
+            results = self._validate(None, e)
+            yield from results.outcomes.values()
+            yield results
+            return
+        config = {"data": data_store, "ct": self._ct_library()}
+        outcomes = {}
+        for rule_class, outcome in self._iter_outcomes(
+            config, max_workers, executor, None, selected, timeout
+        ):
+            outcomes[rule_class] = outcome
+            yield outcome
+        yield self._merge(selected, outcomes)
+
+    def reload_ct(self) -> None:
+        """Load the controlled terminology afresh, e.g. after the CT cache
+        files have changed. Later validations use the new terminology."""
+        ct = CTLibrary(self.root_path)
+        ct.load()
+        self._ct = ct
+
+    def _validate(
+        self,
+        data_store: DataStore | None,
+        e: DecompositionError | None,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        profile_rule: str | None = None,
+        selected: list[Type[RuleTemplate]] | None = None,
+        max_failures: int | None = None,
+        timeout: float | None = None,
+    ) -> RulesValidationResults:
         if data_store:
-            ct = CTLibrary(self.root_path)
-            ct.load()
-            config = {"data": data_store, "ct": ct}
-            results = self._execute_rules(config)
+            config = {"data": data_store, "ct": self._ct_library()}
+            if max_failures is None:
+                results = self._execute_rules(
+                    config, max_workers, executor, profile_rule, selected, timeout
+                )
+            else:
+                results = self._gate_rules(
+                    config,
+                    max_workers,
+                    executor,
+                    profile_rule,
+                    selected,
+                    max_failures,
+                    timeout,
+                )
         else:
             results = RulesValidationResults()
             results.add_exception("Decomposition", e)
         return results
 
-    def _data_store(self, filename: str) -> DataStore:
+    def _ct_library(self) -> CTLibrary:
+        # Shared, read-only, by every validation; loaded once even when the
+        # first validations run concurrently
+        if self._ct is None:
+            with self._ct_lock:
+                if self._ct is None:
+                    self.reload_ct()
+        return self._ct
+
+    def _library_version(self) -> str:
+        # A digest of the package version and of the sources the rules run
+        # on: the rules package, the DataStore and the CT library with its
+        # configuration. Any change to a rule, to the code running the
+        # rules or to the data they check against changes it
+        if self._library_digest is None:
+            digest = hashlib.sha256(__package_version__.encode())
+            root_path = Path(self.root_path)
+            files = {
+                file
+                for pattern in self.LIBRARY_SOURCES
+                for file in root_path.glob(pattern)
+            }
+            for file in sorted(files):
+                digest.update(b"\0" + file.relative_to(root_path).as_posix().encode())
+                digest.update(b"\0" + file.read_bytes())
+            self._library_digest = digest.hexdigest()
+        return self._library_digest
+
+    def _check_executor(self, executor: str) -> None:
+        if executor not in self.EXECUTORS:
+            raise ValueError(
+                f"Unknown executor '{executor}', expected one of {self.EXECUTORS}"
+            )
+
+    def _check_max_failures(self, max_failures: int | None) -> None:
+        if max_failures is not None and max_failures < 1:
+            raise ValueError(
+                f"Invalid max_failures {max_failures}, expected at least 1"
+            )
+
+    def _check_rule_timeout(self, rule_timeout: float | None) -> None:
+        if rule_timeout is not None and rule_timeout <= 0:
+            raise ValueError(
+                f"Invalid rule_timeout {rule_timeout}, expected a positive number"
+            )
+
+    def _check_profile_rule(self, profile_rule: str | None) -> None:
+        if profile_rule is not None and not any(
+            self._rule_id(rule_class) == profile_rule for rule_class in self.rules
+        ):
+            raise ValueError(f"Unknown rule or tag '{profile_rule}'")
+
+    def _select_rules(
+        self, include: list[str] | None, exclude: list[str] | None
+    ) -> list[Type[RuleTemplate]]:
+        if include is None and exclude is None:
+            return self.rules
+        known = set()
+        for rule_class in self.rules:
+            known.add(self._rule_id(rule_class))
+            known.update(rule_class.tags)
+        for name in (include or []) + (exclude or []):
+            if name not in known:
+                raise ValueError(f"Unknown rule or tag '{name}'")
+        return [
+            rule_class
+            for rule_class in self.rules
+            if (include is None or self._matches(rule_class, include))
+            and not (exclude and self._matches(rule_class, exclude))
+        ]
+
+    def _matches(self, rule_class: Type[RuleTemplate], names: list[str]) -> bool:
+        return self._rule_id(rule_class) in names or any(
+            tag in names for tag in rule_class.tags
+        )
+
+    def _data_store(self, filename: str, snapshot_dir: str | None = None) -> DataStore:
+        return self._decompose(DataStore(filename, snapshot_dir=snapshot_dir))
+
+    def _data_store_for(
+        self, data: dict | Wrapper | DataStore
+    ) -> tuple[DataStore | None, DecompositionError | None]:
+        # A DataStore is taken as already decomposed
+        if isinstance(data, DataStore):
+            return data, None
+        data_store = (
+            DataStore.from_wrapper(data)
+            if isinstance(data, Wrapper)
+            else DataStore.from_dict(data)
+        )
+        return self._decompose(data_store)
+
+    def _decompose(self, data_store: DataStore) -> DataStore:
         try:
-            data_store = DataStore(filename)
             data_store.decompose()
             return data_store, None
         except DecompositionError as e:
             return None, e
 
     def _load_rules(self) -> None:
+        # The registry lists the rules without importing them; a rule's
+        # module is imported when the rule first runs
+        entries = RuleRegistry(self.library_path, self.package_name).entries()
+        if entries is not None:
+            self.rules = entries
+            return
+        self._scan_rules()
+
+    def _scan_rules(self) -> None:
         # Iterate through all .py files in the library directory
         for file in Path(self.library_path).glob("rule_*.py"):
             if file.name.startswith("rule_ddf") and file.name.endswith(".py"):
@@ -75,20 +711,330 @@ class RulesValidationEngine:
                 except Exception:
                     continue
 
-    def _execute_rules(self, config: dict) -> RulesValidationResults:
+    def _execute_rules(
+        self,
+        config: dict,
+        max_workers: int | None = None,
+        executor: str = THREAD,
+        profile_rule: str | None = None,
+        selected: list[Type[RuleTemplate]] | None = None,
+        timeout: float | None = None,
+    ) -> RulesValidationResults:
+        selected = self.rules if selected is None else selected
+        outcomes = dict(
+            self._iter_outcomes(
+                config, max_workers, executor, profile_rule, selected, timeout
+            )
+        )
+        return self._merge(selected, outcomes)
+
+    @staticmethod
+    def _merge(
+        selected: list[Type[RuleTemplate]],
+        outcomes: dict[Type[RuleTemplate], RuleOutcome],
+    ) -> RulesValidationResults:
+        # Merged in rule order whatever ran them, so the results match a
+        # sequential run
         results = RulesValidationResults()
-        for rule_class in self.rules:
-            try:
-                # Execute the rule
-                rule: RuleTemplate = rule_class()
-                passed = rule.validate(config)
-                if passed:
-                    results.add_success(rule._rule)
-                else:
-                    results.add_failure(rule._rule, rule.errors())
-            except NotImplementedError:
-                # Rule not implemented yet
-                results.add_not_implemented(rule._rule)
-            except Exception as e:
-                results.add_exception(rule._rule, e, f"{traceback.format_exc()}")
+        for rule_class in selected:
+            results.add_outcome(outcomes[rule_class])
         return results
+
+    def _gate_rules(
+        self,
+        config: dict,
+        max_workers: int | None,
+        executor: str,
+        profile_rule: str | None,
+        selected: list[Type[RuleTemplate]] | None,
+        max_failures: int,
+        timeout: float | None = None,
+    ) -> RulesValidationResults:
+        # ERROR level rules run first; the run stops once max_failures
+        # rules have failed or raised and the rules left are not run
+        selected = self.rules if selected is None else selected
+        errors = [r for r in selected if self._rule_level(r) == RuleTemplate.ERROR]
+        others = [r for r in selected if self._rule_level(r) != RuleTemplate.ERROR]
+        outcomes = {}
+        failures = 0
+        for rules in (errors, others):
+            if failures >= max_failures:
+                break
+            iterator = self._iter_outcomes(
+                config, max_workers, executor, profile_rule, rules, timeout
+            )
+            for rule_class, outcome in iterator:
+                outcomes[rule_class] = outcome
+                if outcome.status in (
+                    RuleStatus.FAILURE,
+                    RuleStatus.EXCEPTION,
+                    RuleStatus.TIMEOUT,
+                ):
+                    failures += 1
+                    if failures >= max_failures:
+                        iterator.close()
+                        break
+        for rule_class in selected:
+            if rule_class not in outcomes:
+                outcomes[rule_class] = RuleOutcome(
+                    self._rule_id(rule_class), RuleStatus.NOT_RUN
+                )
+        return self._merge(selected, outcomes)
+
+    def _iter_outcomes(
+        self,
+        config: dict,
+        max_workers: int | None,
+        executor: str,
+        profile_rule: str | None,
+        selected: list[Type[RuleTemplate]],
+        timeout: float | None = None,
+    ) -> Iterator[tuple[Type[RuleTemplate], RuleOutcome]]:
+        # Yields each rule with its outcome as soon as the rule has finished
+        # A rule with nothing to check in the document is not run
+        data = config["data"]
+        done = set()
+        for rule_class in selected:
+            if rule_class.requires and not any(
+                data.has_klass(klass) for klass in rule_class.requires
+            ):
+                done.add(rule_class)
+                yield (
+                    rule_class,
+                    RuleOutcome(
+                        self._rule_id(rule_class),
+                        RuleStatus.SKIPPED,
+                        reads={
+                            ("has_klass", (klass,), ()) for klass in rule_class.requires
+                        },
+                    ),
+                )
+        # A profiled rule runs first and alone, so that nothing else is
+        # captured with it
+        for rule_class in selected:
+            if (
+                rule_class not in done
+                and profile_rule is not None
+                and self._rule_id(rule_class) == profile_rule
+            ):
+                done.add(rule_class)
+                yield (
+                    rule_class,
+                    self._run_rule(rule_class, config, profile=True, timeout=timeout),
+                )
+        # Visiting rules share one walk of the document, the others run
+        # one after another or on a pool
+        visitors = [
+            rule_class
+            for rule_class in selected
+            if rule_class.visits and rule_class not in done
+        ]
+        rules = [
+            rule_class
+            for rule_class in selected
+            if not rule_class.visits and rule_class not in done
+        ]
+        yield from zip(visitors, self._run_visitors(visitors, config, timeout))
+        if max_workers is None or max_workers <= 1 or len(rules) <= 1:
+            for rule_class in rules:
+                yield rule_class, self._run_rule(rule_class, config, timeout=timeout)
+        elif executor == self.PROCESS and self._can_fork():
+            yield from self._run_processes(rules, config, max_workers, timeout)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(
+                        self._run_rule, rule_class, config, timeout=timeout
+                    ): rule_class
+                    for rule_class in rules
+                }
+                try:
+                    for future in as_completed(futures):
+                        yield futures[future], future.result()
+                finally:
+                    # Rules not yet started are dropped if the caller stops
+                    # early
+                    for future in futures:
+                        future.cancel()
+
+    def _run_processes(
+        self,
+        rules: list[Type[RuleTemplate]],
+        config: dict,
+        max_workers: int,
+        timeout: float | None = None,
+    ) -> Iterator[tuple[Type[RuleTemplate], RuleOutcome]]:
+        # Workers are forked while the rules and config are published in
+        # _shared, so each sees the decomposed document copy-on-write and
+        # only rule indexes and outcomes cross the process boundary. A
+        # fork pool starts all its workers on the first submit, so _shared
+        # is only held, and other process runs kept waiting, while the
+        # rules are submitted rather than while the outcomes are read.
+        # Each rule is its own future, yielded as it finishes, so that a
+        # caller stopping early (see _gate_rules) drops the rules not yet
+        # handed to a worker; only those already running or in the pool's
+        # queue of max_workers + 1 calls still run
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            with _shared_lock:
+                _shared["rules"] = rules
+                _shared["config"] = config
+                _shared["timeout"] = timeout
+                try:
+                    futures = {
+                        pool.submit(_run_shared_rule, index): rule_class
+                        for index, rule_class in enumerate(rules)
+                    }
+                finally:
+                    _shared.clear()
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def _rule_id(rule_class: Type[RuleTemplate]) -> str:
+        # Registry entries know their id without importing the rule
+        return getattr(rule_class, "rule_id", None) or rule_class()._rule
+
+    @staticmethod
+    def _rule_level(rule_class: Type[RuleTemplate]) -> int:
+        return getattr(rule_class, "level", None) or rule_class()._level
+
+    @staticmethod
+    def _can_fork() -> bool:
+        # Without fork the document would have to be pickled to every
+        # worker, so fall back to threads
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    @staticmethod
+    def _run_rule(
+        rule_class: Type[RuleTemplate],
+        config: dict,
+        profile: bool = False,
+        timeout: float | None = None,
+    ) -> RuleOutcome:
+        rule, outcome = RulesValidationEngine._new_rule(rule_class)
+        if rule is None:
+            return outcome
+        stopwatch = _Stopwatch(profile, timeout)
+        data = _RuleStore(config["data"], stopwatch.check if timeout else None)
+        with stopwatch:
+            outcome = RulesValidationEngine._run(
+                rule, rule.validate, {**config, "data": data}
+            )
+        return stopwatch.record(outcome, data)
+
+    @staticmethod
+    def _run_visitors(
+        rule_classes: list[Type[RuleTemplate]],
+        config: dict,
+        timeout: float | None = None,
+    ) -> list[RuleOutcome]:
+        # Each instance of a visited class is handed to every rule visiting
+        # that class in turn; a rule that raises is visited no further
+        new_rules = [
+            RulesValidationEngine._new_rule(rule_class) for rule_class in rule_classes
+        ]
+        rules: list[RuleTemplate] = [rule for rule, _ in new_rules if rule is not None]
+        visitors: dict[str, list[RuleTemplate]] = {}
+        for rule in rules:
+            for klass in rule.visits:
+                visitors.setdefault(klass, []).append(rule)
+        stopwatches = {rule: _Stopwatch(timeout=timeout) for rule in rules}
+        stores = {
+            rule: _RuleStore(
+                config["data"], stopwatches[rule].check if timeout else None
+            )
+            for rule in rules
+        }
+        configs = {rule: {**config, "data": stores[rule]} for rule in rules}
+        raised: dict[RuleTemplate, RuleOutcome] = {}
+        data = config["data"]
+        for klass, klass_rules in visitors.items():
+            instances = data.instances_by_klass(klass)
+            visiting = []
+            for rule in klass_rules:
+                if rule not in raised:
+                    stores[rule].visited(klass, instances)
+                    visiting.append(
+                        (rule, rule.visit, configs[rule], stopwatches[rule])
+                    )
+            # The clock readings ending one visit start the next
+            wall, cpu = time.perf_counter(), time.thread_time()
+            for instance in instances:
+                for rule, visit, rule_config, stopwatch in visiting:
+                    stopwatch.resume(wall, cpu)
+                    try:
+                        if timeout:
+                            stopwatch.check()
+                        visit(instance, rule_config)
+                    except RuleTimeout as e:
+                        raised[rule] = RulesValidationEngine._timed_out(rule, e)
+                        visiting = [item for item in visiting if item[0] is not rule]
+                    except Exception as e:
+                        raised[rule] = RulesValidationEngine._raised(rule, e)
+                        visiting = [item for item in visiting if item[0] is not rule]
+                    wall, cpu = time.perf_counter(), time.thread_time()
+                    stopwatch.pause(wall, cpu)
+        outcomes = []
+        for rule, outcome in new_rules:
+            if rule is not None:
+                with stopwatches[rule]:
+                    outcome = raised.get(rule) or RulesValidationEngine._run(
+                        rule, rule.finish, configs[rule]
+                    )
+                outcome = stopwatches[rule].record(outcome, stores[rule])
+            outcomes.append(outcome)
+        return outcomes
+
+    @staticmethod
+    def _new_rule(
+        rule_class: Type[RuleTemplate],
+    ) -> tuple[RuleTemplate | None, RuleOutcome | None]:
+        # A registry entry imports its rule's module here, so a module that
+        # fails to import fails only its own rule
+        try:
+            return rule_class(), None
+        except Exception as e:
+            rule_id = RulesValidationEngine._rule_id(rule_class)
+            results = RulesValidationResults()
+            results.add_exception(rule_id, e, f"{traceback.format_exc()}")
+            return None, results.outcomes[rule_id]
+
+    @staticmethod
+    def _run(
+        rule: RuleTemplate, method: Callable[[dict], bool], config: dict
+    ) -> RuleOutcome:
+        results = RulesValidationResults()
+        try:
+            # Execute the rule
+            if method(config):
+                results.add_success(rule._rule)
+            else:
+                results.add_failure(rule._rule, rule.errors())
+        except RuleTimeout as e:
+            return RulesValidationEngine._timed_out(rule, e)
+        except Exception as e:
+            return RulesValidationEngine._raised(rule, e)
+        return results.outcomes[rule._rule]
+
+    @staticmethod
+    def _timed_out(rule: RuleTemplate, e: RuleTimeout) -> RuleOutcome:
+        results = RulesValidationResults()
+        results.add_timeout(rule._rule, str(e))
+        return results.outcomes[rule._rule]
+
+    @staticmethod
+    def _raised(rule: RuleTemplate, e: Exception) -> RuleOutcome:
+        # Called while handling the exception, for its traceback
+        results = RulesValidationResults()
+        if isinstance(e, NotImplementedError):
+            # Rule not implemented yet
+            results.add_not_implemented(rule._rule)
+        else:
+            results.add_exception(rule._rule, e, f"{traceback.format_exc()}")
+        return results.outcomes[rule._rule]
@@ -0,0 +1,221 @@
+# Generated by tools/build_rule_registry.py from the rule library, do
+# not edit. Regenerate whenever a rule is added, removed or changed.
+#
+# (rule id, module, class, level, visits, requires, tags)
+# fmt: off
+RULES = [
+    ("DDF00006", "rule_ddf00006", "RuleDDF00006", 40, [], ["Timing"], ["timeline"]),
+    ("DDF00007", "rule_ddf00007", "RuleDDF00007", 40, [], [], ["timeline"]),
+    ("DDF00008", "rule_ddf00008", "RuleDDF00008", 40, [], ["ScheduledActivityInstance"], ["timeline"]),
+    ("DDF00009", "rule_ddf00009", "RuleDDF00009", 40, [], ["ScheduleTimeline"], ["timeline"]),
+    ("DDF00010", "rule_ddf00010", "RuleDDF00010", 40, [], [], []),
+    ("DDF00011", "rule_ddf00011", "RuleDDF00011", 40, [], [], ["timeline"]),
+    ("DDF00012", "rule_ddf00012", "RuleDDF00012", 40, [], [], ["timeline"]),
+    ("DDF00013", "rule_ddf00013", "RuleDDF00013", 40, [], ["BiomedicalConceptProperty"], []),
+    ("DDF00014", "rule_ddf00014", "RuleDDF00014", 30, [], ["BiomedicalConceptCategory"], []),
+    ("DDF00017", "rule_ddf00017", "RuleDDF00017", 40, [], ["SubjectEnrollment"], []),
+    ("DDF00018", "rule_ddf00018", "RuleDDF00018", 40, [], [], []),
+    ("DDF00019", "rule_ddf00019", "RuleDDF00019", 40, [], [], ["timeline"]),
+    ("DDF00020", "rule_ddf00020", "RuleDDF00020", 40, [], ["StudyAmendmentReason"], []),
+    ("DDF00021", "rule_ddf00021", "RuleDDF00021", 40, [], [], []),
+    ("DDF00022", "rule_ddf00022", "RuleDDF00022", 40, [], [], []),
+    ("DDF00023", "rule_ddf00023", "RuleDDF00023", 40, [], [], []),
+    ("DDF00024", "rule_ddf00024", "RuleDDF00024", 40, [], ["StudyEpoch"], []),
+    ("DDF00025", "rule_ddf00025", "RuleDDF00025", 40, [], [], ["timeline"]),
+    ("DDF00026", "rule_ddf00026", "RuleDDF00026", 40, ["ScheduledActivityInstance"], ["ScheduledActivityInstance"], ["timeline"]),
+    ("DDF00027", "rule_ddf00027", "RuleDDF00027", 40, [], [], []),
+    ("DDF00028", "rule_ddf00028", "RuleDDF00028", 40, ["Activity"], ["Activity"], []),
+    ("DDF00029", "rule_ddf00029", "RuleDDF00029", 40, [], ["Encounter"], []),
+    ("DDF00030", "rule_ddf00030", "RuleDDF00030", 40, [], ["PersonName"], []),
+    ("DDF00031", "rule_ddf00031", "RuleDDF00031", 40, [], [], ["timeline"]),
+    ("DDF00032", "rule_ddf00032", "RuleDDF00032", 40, ["StudyVersion"], ["StudyVersion"], []),
+    ("DDF00033", "rule_ddf00033", "RuleDDF00033", 40, [], ["Duration"], []),
+    ("DDF00034", "rule_ddf00034", "RuleDDF00034", 40, [], ["Duration"], []),
+    ("DDF00035", "rule_ddf00035", "RuleDDF00035", 30, [], [], []),
+    ("DDF00036", "rule_ddf00036", "RuleDDF00036", 40, [], [], ["timeline"]),
+    ("DDF00037", "rule_ddf00037", "RuleDDF00037", 40, [], ["ScheduleTimeline"], ["timeline"]),
+    ("DDF00038", "rule_ddf00038", "RuleDDF00038", 40, [], [], ["timeline"]),
+    ("DDF00039", "rule_ddf00039", "RuleDDF00039", 30, [], ["Duration"], []),
+    ("DDF00040", "rule_ddf00040", "RuleDDF00040", 40, [], [], []),
+    ("DDF00041", "rule_ddf00041", "RuleDDF00041", 40, [], [], []),
+    ("DDF00042", "rule_ddf00042", "RuleDDF00042", 30, [], [], []),
+    ("DDF00044", "rule_ddf00044", "RuleDDF00044", 40, [], ["ConditionAssignment"], ["timeline"]),
+    ("DDF00045", "rule_ddf00045", "RuleDDF00045", 30, [], [], []),
+    ("DDF00046", "rule_ddf00046", "RuleDDF00046", 40, [], ["Timing"], ["timeline"]),
+    ("DDF00047", "rule_ddf00047", "RuleDDF00047", 40, [], ["StudyCell"], []),
+    ("DDF00050", "rule_ddf00050", "RuleDDF00050", 40, [], [], []),
+    ("DDF00051", "rule_ddf00051", "RuleDDF00051", 40, [], [], ["ct", "timeline"]),
+    ("DDF00052", "rule_ddf00052", "RuleDDF00052", 40, [], ["AliasCode"], []),
+    ("DDF00054", "rule_ddf00054", "RuleDDF00054", 40, ["Encounter"], ["Encounter"], []),
+    ("DDF00058", "rule_ddf00058", "RuleDDF00058", 40, [], ["Indication"], []),
+    ("DDF00059", "rule_ddf00059", "RuleDDF00059", 40, [], ["StudyIntervention"], []),
+    ("DDF00060", "rule_ddf00060", "RuleDDF00060", 40, ["Timing"], ["Timing"], ["timeline"]),
+    ("DDF00061", "rule_ddf00061", "RuleDDF00061", 40, [], [], ["timeline"]),
+    ("DDF00062", "rule_ddf00062", "RuleDDF00062", 40, [], [], ["timeline"]),
+    ("DDF00063", "rule_ddf00063", "RuleDDF00063", 30, [], ["AliasCode"], []),
+    ("DDF00069", "rule_ddf00069", "RuleDDF00069", 40, [], [], []),
+    ("DDF00071", "rule_ddf00071", "RuleDDF00071", 40, [], [], []),
+    ("DDF00072", "rule_ddf00072", "RuleDDF00072", 40, [], [], []),
+    ("DDF00073", "rule_ddf00073", "RuleDDF00073", 30, [], ["StudyVersion"], []),
+    ("DDF00075", "rule_ddf00075", "RuleDDF00075", 30, ["Activity"], ["Activity"], []),
+    ("DDF00076", "rule_ddf00076", "RuleDDF00076", 30, ["Activity"], ["Activity"], []),
+    ("DDF00080", "rule_ddf00080", "RuleDDF00080", 30, ["ScheduledActivityInstance"], ["ScheduledActivityInstance"], ["timeline"]),
+    ("DDF00081", "rule_ddf00081", "RuleDDF00081", 40, [], [], []),
+    ("DDF00082", "rule_ddf00082", "RuleDDF00082", 40, [], [], []),
+    ("DDF00083", "rule_ddf00083", "RuleDDF00083", 40, [], [], []),
+    ("DDF00084", "rule_ddf00084", "RuleDDF00084", 40, [], [], []),
+    ("DDF00087", "rule_ddf00087", "RuleDDF00087", 30, [], [], []),
+    ("DDF00088", "rule_ddf00088", "RuleDDF00088", 30, [], [], []),
+    ("DDF00090", "rule_ddf00090", "RuleDDF00090", 40, ["Activity"], ["Activity"], []),
+    ("DDF00091", "rule_ddf00091", "RuleDDF00091", 40, [], ["Condition"], []),
+    ("DDF00093", "rule_ddf00093", "RuleDDF00093", 40, [], ["StudyVersion"], []),
+    ("DDF00094", "rule_ddf00094", "RuleDDF00094", 30, [], ["StudyVersion"], []),
+    ("DDF00096", "rule_ddf00096", "RuleDDF00096", 40, [], [], []),
+    ("DDF00097", "rule_ddf00097", "RuleDDF00097", 40, [], ["StudyDesignPopulation"], []),
+    ("DDF00098", "rule_ddf00098", "RuleDDF00098", 40, [], ["StudyDesignPopulation"], []),
+    ("DDF00099", "rule_ddf00099", "RuleDDF00099", 30, [], [], ["timeline"]),
+    ("DDF00100", "rule_ddf00100", "RuleDDF00100", 40, ["StudyVersion"], ["StudyVersion"], []),
+    ("DDF00101", "rule_ddf00101", "RuleDDF00101", 30, [], [], []),
+    ("DDF00102", "rule_ddf00102", "RuleDDF00102", 40, ["ScheduledActivityInstance"], ["ScheduledActivityInstance"], ["timeline"]),
+    ("DDF00104", "rule_ddf00104", "RuleDDF00104", 40, [], [], ["ct", "timeline"]),
+    ("DDF00105", "rule_ddf00105", "RuleDDF00105", 40, [], [], ["timeline"]),
+    ("DDF00106", "rule_ddf00106", "RuleDDF00106", 40, [], [], ["timeline"]),
+    ("DDF00107", "rule_ddf00107", "RuleDDF00107", 40, [], ["ScheduledActivityInstance"], ["timeline"]),
+    ("DDF00108", "rule_ddf00108", "RuleDDF00108", 40, [], [], ["timeline"]),
+    ("DDF00110", "rule_ddf00110", "RuleDDF00110", 40, [], [], ["ct"]),
+    ("DDF00112", "rule_ddf00112", "RuleDDF00112", 40, [], [], ["ct"]),
+    ("DDF00114", "rule_ddf00114", "RuleDDF00114", 40, [], ["Condition"], []),
+    ("DDF00115", "rule_ddf00115", "RuleDDF00115", 40, [], ["StudyVersion"], []),
+    ("DDF00124", "rule_ddf00124", "RuleDDF00124", 40, [], ["ParameterMap"], []),
+    ("DDF00125", "rule_ddf00125", "RuleDDF00125", 40, [], [], []),
+    ("DDF00126", "rule_ddf00126", "RuleDDF00126", 40, [], [], []),
+    ("DDF00127", "rule_ddf00127", "RuleDDF00127", 40, [], ["Encounter"], []),
+    ("DDF00128", "rule_ddf00128", "RuleDDF00128", 40, [], [], ["ct"]),
+    ("DDF00132", "rule_ddf00132", "RuleDDF00132", 40, [], ["StudyDesignPopulation"], []),
+    ("DDF00133", "rule_ddf00133", "RuleDDF00133", 40, [], ["StudyDesignPopulation"], []),
+    ("DDF00136", "rule_ddf00136", "RuleDDF00136", 40, [], [], ["ct"]),
+    ("DDF00137", "rule_ddf00137", "RuleDDF00137", 40, [], ["ParameterMap"], []),
+    ("DDF00140", "rule_ddf00140", "RuleDDF00140", 40, [], [], ["ct"]),
+    ("DDF00141", "rule_ddf00141", "RuleDDF00141", 40, [], [], ["ct"]),
+    ("DDF00142", "rule_ddf00142", "RuleDDF00142", 40, [], [], ["ct"]),
+    ("DDF00143", "rule_ddf00143", "RuleDDF00143", 40, [], [], ["ct"]),
+    ("DDF00144", "rule_ddf00144", "RuleDDF00144", 40, [], [], ["ct"]),
+    ("DDF00146", "rule_ddf00146", "RuleDDF00146", 40, [], [], ["ct"]),
+    ("DDF00147", "rule_ddf00147", "RuleDDF00147", 40, [], [], ["ct"]),
+    ("DDF00148", "rule_ddf00148", "RuleDDF00148", 40, [], [], ["ct"]),
+    ("DDF00149", "rule_ddf00149", "RuleDDF00149", 40, [], [], ["ct"]),
+    ("DDF00150", "rule_ddf00150", "RuleDDF00150", 40, [], [], ["ct"]),
+    ("DDF00151", "rule_ddf00151", "RuleDDF00151", 40, [], ["GovernanceDate"], []),
+    ("DDF00152", "rule_ddf00152", "RuleDDF00152", 40, ["Activity"], ["Activity"], []),
+    ("DDF00153", "rule_ddf00153", "RuleDDF00153", 30, [], ["ScheduleTimeline"], ["timeline"]),
+    ("DDF00154", "rule_ddf00154", "RuleDDF00154", 40, [], ["InterventionalStudyDesign"], []),
+    ("DDF00155", "rule_ddf00155", "RuleDDF00155", 40, [], [], []),
+    ("DDF00156", "rule_ddf00156", "RuleDDF00156", 40, ["Encounter"], ["Encounter"], []),
+    ("DDF00157", "rule_ddf00157", "RuleDDF00157", 40, [], [], ["ct"]),
+    ("DDF00158", "rule_ddf00158", "RuleDDF00158", 40, [], ["ObservationalStudyDesign"], []),
+    ("DDF00159", "rule_ddf00159", "RuleDDF00159", 40, [], [], []),
+    ("DDF00160", "rule_ddf00160", "RuleDDF00160", 40, [], ["Activity"], []),
+    ("DDF00161", "rule_ddf00161", "RuleDDF00161", 40, [], [], []),
+    ("DDF00162", "rule_ddf00162", "RuleDDF00162", 40, [], ["NarrativeContentItem"], []),
+    ("DDF00163", "rule_ddf00163", "RuleDDF00163", 30, [], ["NarrativeContent"], []),
+    ("DDF00164", "rule_ddf00164", "RuleDDF00164", 40, [], ["NarrativeContent"], []),
+    ("DDF00165", "rule_ddf00165", "RuleDDF00165", 40, [], ["NarrativeContent"], []),
+    ("DDF00166", "rule_ddf00166", "RuleDDF00166", 40, [], [], ["ct"]),
+    ("DDF00167", "rule_ddf00167", "RuleDDF00167", 40, ["StudyVersion"], ["StudyVersion"], []),
+    ("DDF00168", "rule_ddf00168", "RuleDDF00168", 40, [], [], []),
+    ("DDF00169", "rule_ddf00169", "RuleDDF00169", 40, [], [], ["ct"]),
+    ("DDF00170", "rule_ddf00170", "RuleDDF00170", 40, [], [], []),
+    ("DDF00171", "rule_ddf00171", "RuleDDF00171", 30, [], [], []),
+    ("DDF00172", "rule_ddf00172", "RuleDDF00172", 40, [], ["StudyVersion"], []),
+    ("DDF00173", "rule_ddf00173", "RuleDDF00173", 40, [], [], []),
+    ("DDF00174", "rule_ddf00174", "RuleDDF00174", 30, [], [], []),
+    ("DDF00175", "rule_ddf00175", "RuleDDF00175", 40, [], [], ["ct"]),
+    ("DDF00176", "rule_ddf00176", "RuleDDF00176", 40, [], [], ["ct"]),
+    ("DDF00177", "rule_ddf00177", "RuleDDF00177", 30, [], ["Administration"], []),
+    ("DDF00178", "rule_ddf00178", "RuleDDF00178", 40, [], ["Administration"], []),
+    ("DDF00179", "rule_ddf00179", "RuleDDF00179", 40, [], [], ["ct"]),
+    ("DDF00180", "rule_ddf00180", "RuleDDF00180", 40, [], [], ["ct"]),
+    ("DDF00181", "rule_ddf00181", "RuleDDF00181", 40, [], ["StudyDefinitionDocumentVersion"], []),
+    ("DDF00182", "rule_ddf00182", "RuleDDF00182", 30, [], ["StudyDefinitionDocumentVersion"], []),
+    ("DDF00183", "rule_ddf00183", "RuleDDF00183", 40, [], [], ["ct"]),
+    ("DDF00184", "rule_ddf00184", "RuleDDF00184", 40, [], ["Substance"], []),
+    ("DDF00185", "rule_ddf00185", "RuleDDF00185", 40, [], ["StudyVersion"], []),
+    ("DDF00186", "rule_ddf00186", "RuleDDF00186", 40, [], ["Strength"], []),
+    ("DDF00187", "rule_ddf00187", "RuleDDF00187", 30, [], [], []),
+    ("DDF00188", "rule_ddf00188", "RuleDDF00188", 40, [], [], []),
+    ("DDF00189", "rule_ddf00189", "RuleDDF00189", 40, [], ["StudyVersion"], []),
+    ("DDF00190", "rule_ddf00190", "RuleDDF00190", 40, [], ["StudyRole"], []),
+    ("DDF00191", "rule_ddf00191", "RuleDDF00191", 30, [], ["StudyVersion"], []),
+    ("DDF00192", "rule_ddf00192", "RuleDDF00192", 30, [], ["StudyVersion"], []),
+    ("DDF00193", "rule_ddf00193", "RuleDDF00193", 30, [], ["StudyVersion"], []),
+    ("DDF00194", "rule_ddf00194", "RuleDDF00194", 40, [], ["Address"], []),
+    ("DDF00195", "rule_ddf00195", "RuleDDF00195", 40, [], [], []),
+    ("DDF00196", "rule_ddf00196", "RuleDDF00196", 40, [], ["StudyAmendment"], []),
+    ("DDF00197", "rule_ddf00197", "RuleDDF00197", 30, [], [], []),
+    ("DDF00198", "rule_ddf00198", "RuleDDF00198", 30, [], [], []),
+    ("DDF00199", "rule_ddf00199", "RuleDDF00199", 40, [], [], ["ct"]),
+    ("DDF00200", "rule_ddf00200", "RuleDDF00200", 40, [], [], ["ct"]),
+    ("DDF00201", "rule_ddf00201", "RuleDDF00201", 40, [], ["StudyVersion"], []),
+    ("DDF00202", "rule_ddf00202", "RuleDDF00202", 40, [], ["StudyVersion"], []),
+    ("DDF00203", "rule_ddf00203", "RuleDDF00203", 40, [], ["StudyVersion"], []),
+    ("DDF00204", "rule_ddf00204", "RuleDDF00204", 40, [], [], []),
+    ("DDF00205", "rule_ddf00205", "RuleDDF00205", 40, [], ["Administration"], []),
+    ("DDF00206", "rule_ddf00206", "RuleDDF00206", 40, [], ["StudyVersion"], []),
+    ("DDF00207", "rule_ddf00207", "RuleDDF00207", 40, [], [], ["ct"]),
+    ("DDF00208", "rule_ddf00208", "RuleDDF00208", 40, [], [], ["ct"]),
+    ("DDF00209", "rule_ddf00209", "RuleDDF00209", 40, [], [], ["ct"]),
+    ("DDF00210", "rule_ddf00210", "RuleDDF00210", 40, [], [], ["ct"]),
+    ("DDF00211", "rule_ddf00211", "RuleDDF00211", 30, [], ["ProductOrganizationRole"], []),
+    ("DDF00212", "rule_ddf00212", "RuleDDF00212", 40, [], ["ProductOrganizationRole"], []),
+    ("DDF00213", "rule_ddf00213", "RuleDDF00213", 30, [], ["StudyVersion"], []),
+    ("DDF00214", "rule_ddf00214", "RuleDDF00214", 40, [], [], ["ct"]),
+    ("DDF00215", "rule_ddf00215", "RuleDDF00215", 40, [], [], ["ct"]),
+    ("DDF00216", "rule_ddf00216", "RuleDDF00216", 40, [], [], ["ct"]),
+    ("DDF00217", "rule_ddf00217", "RuleDDF00217", 40, [], [], ["ct"]),
+    ("DDF00218", "rule_ddf00218", "RuleDDF00218", 40, [], [], ["ct"]),
+    ("DDF00219", "rule_ddf00219", "RuleDDF00219", 40, [], [], []),
+    ("DDF00220", "rule_ddf00220", "RuleDDF00220", 40, [], [], []),
+    ("DDF00221", "rule_ddf00221", "RuleDDF00221", 40, [], [], []),
+    ("DDF00222", "rule_ddf00222", "RuleDDF00222", 40, [], [], []),
+    ("DDF00223", "rule_ddf00223", "RuleDDF00223", 40, [], [], ["ct"]),
+    ("DDF00224", "rule_ddf00224", "RuleDDF00224", 40, [], [], ["ct"]),
+    ("DDF00225", "rule_ddf00225", "RuleDDF00225", 40, [], [], ["ct"]),
+    ("DDF00226", "rule_ddf00226", "RuleDDF00226", 40, [], [], ["ct"]),
+    ("DDF00227", "rule_ddf00227", "RuleDDF00227", 40, [], ["InterventionalStudyDesign"], []),
+    ("DDF00228", "rule_ddf00228", "RuleDDF00228", 40, [], ["ObservationalStudyDesign"], []),
+    ("DDF00229", "rule_ddf00229", "RuleDDF00229", 40, [], [], ["ct"]),
+    ("DDF00230", "rule_ddf00230", "RuleDDF00230", 40, [], [], ["ct"]),
+    ("DDF00231", "rule_ddf00231", "RuleDDF00231", 40, [], ["BiospecimenRetention"], []),
+    ("DDF00232", "rule_ddf00232", "RuleDDF00232", 30, [], ["ObservationalStudyDesign"], []),
+    ("DDF00233", "rule_ddf00233", "RuleDDF00233", 40, [], [], ["ct"]),
+    ("DDF00234", "rule_ddf00234", "RuleDDF00234", 40, [], [], []),
+    ("DDF00235", "rule_ddf00235", "RuleDDF00235", 40, [], [], []),
+    ("DDF00236", "rule_ddf00236", "RuleDDF00236", 30, [], ["BiomedicalConcept"], []),
+    ("DDF00237", "rule_ddf00237", "RuleDDF00237", 40, [], [], []),
+    ("DDF00238", "rule_ddf00238", "RuleDDF00238", 40, [], ["Strength"], []),
+    ("DDF00239", "rule_ddf00239", "RuleDDF00239", 40, [], ["Strength"], []),
+    ("DDF00240", "rule_ddf00240", "RuleDDF00240", 40, [], [], []),
+    ("DDF00241", "rule_ddf00241", "RuleDDF00241", 40, [], ["Range"], []),
+    ("DDF00242", "rule_ddf00242", "RuleDDF00242", 40, [], ["Range"], []),
+    ("DDF00243", "rule_ddf00243", "RuleDDF00243", 30, [], [], []),
+    ("DDF00244", "rule_ddf00244", "RuleDDF00244", 40, [], ["NarrativeContentItem"], []),
+    ("DDF00245", "rule_ddf00245", "RuleDDF00245", 40, [], ["StudyDefinitionDocumentVersion"], []),
+    ("DDF00246", "rule_ddf00246", "RuleDDF00246", 40, [], [], []),
+    ("DDF00247", "rule_ddf00247", "RuleDDF00247", 30, [], [], []),
+    ("DDF00248", "rule_ddf00248", "RuleDDF00248", 40, [], [], []),
+    ("DDF00249", "rule_ddf00249", "RuleDDF00249", 30, [], ["EligibilityCriterionItem"], []),
+    ("DDF00250", "rule_ddf00250", "RuleDDF00250", 40, [], [], []),
+    ("DDF00251", "rule_ddf00251", "RuleDDF00251", 40, [], [], []),
+    ("DDF00252", "rule_ddf00252", "RuleDDF00252", 40, [], [], []),
+    ("DDF00253", "rule_ddf00253", "RuleDDF00253", 40, [], [], []),
+    ("DDF00254", "rule_ddf00254", "RuleDDF00254", 40, [], ["Activity"], []),
+    ("DDF00255", "rule_ddf00255", "RuleDDF00255", 30, [], ["StudyAmendment"], []),
+    ("DDF00256", "rule_ddf00256", "RuleDDF00256", 30, [], ["StudyAmendment"], []),
+    ("DDF00257", "rule_ddf00257", "RuleDDF00257", 40, [], ["InterventionalStudyDesign"], []),
+    ("DDF00258", "rule_ddf00258", "RuleDDF00258", 30, [], [], []),
+    ("DDF00259", "rule_ddf00259", "RuleDDF00259", 40, [], [], ["ct"]),
+    ("DDF00260", "rule_ddf00260", "RuleDDF00260", 30, [], [], []),
+    ("DDF00261", "rule_ddf00261", "RuleDDF00261", 30, [], ["GeographicScope"], []),
+    ("DDFSDW001", "rule_ddfsdw001", "RuleDDFSDW001", 40, [], [], []),
+]
+# fmt: on
@@ -29,6 +29,9 @@ class RuleDDF00006(RuleTemplate):
     Attributes: windowLabel, windowLower, windowUpper
     """
 
+    requires = ["Timing"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00006",
@@ -19,6 +19,8 @@ class RuleDDF00007(RuleTemplate):
     Attributes: relativeToScheduledInstanceId
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00007",
@@ -28,12 +30,7 @@ class RuleDDF00007(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        for timing in data.instances_by_klass("Timing"):
-            type_obj = timing.get("type")
-            if not isinstance(type_obj, dict):
-                continue
-            if type_obj.get("code") != FIXED_REFERENCE_CODE:
-                continue
+        for timing in data.where("Timing", "type.code", FIXED_REFERENCE_CODE):
             to_id = timing.get("relativeToScheduledInstanceId")
             from_id = timing.get("relativeFromScheduledInstanceId")
             if not to_id:
@@ -25,6 +25,9 @@ class RuleDDF00008(RuleTemplate):
     Attributes: timelineExit, defaultCondition
     """
 
+    requires = ["ScheduledActivityInstance"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00008",
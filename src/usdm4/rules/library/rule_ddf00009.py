@@ -42,6 +42,9 @@ class RuleDDF00009(RuleTemplate):
     Attributes: type
     """
 
+    requires = ["ScheduleTimeline"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00009",
@@ -4,7 +4,7 @@
 # instanceType then by name, and flags groups with count > 1. That is
 # "names unique per class, model-wide" — stricter than the rule text's
 # "same parent class" phrasing but matching the authoritative check.
-# Iterates via DataStore._ids to avoid having to enumerate every class.
+# Iterates via DataStore.instances() to avoid having to enumerate every class.
 from collections import defaultdict
 
 from usdm4.rules.rule_template import RuleTemplate
@@ -29,7 +29,7 @@ class RuleDDF00010(RuleTemplate):
         data = config["data"]
         # Group (instanceType, name) across every indexed instance with a name.
         groups: dict = defaultdict(list)
-        for iid, instance in data._ids.items():
+        for iid, instance in data.instances():
             if not isinstance(instance, dict):
                 continue
             name = instance.get("name")
@@ -3,6 +3,8 @@ from usdm4.data_store.data_store import DataStore
 
 
 class RuleDDF00011(RuleTemplate):
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00011",
@@ -23,6 +23,8 @@ class RuleDDF00012(RuleTemplate):
     Attributes: mainTimeline
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00012",
@@ -9,6 +9,8 @@ class RuleDDF00013(RuleTemplate):
     Attributes: isRequired, isEnabled
     """
 
+    requires = ["BiomedicalConceptProperty"]
+
     def __init__(self):
         super().__init__(
             "DDF00013",
@@ -16,6 +16,8 @@ class RuleDDF00014(RuleTemplate):
     Attributes: members, children
     """
 
+    requires = ["BiomedicalConceptCategory"]
+
     def __init__(self):
         super().__init__(
             "DDF00014",
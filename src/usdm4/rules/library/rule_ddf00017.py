@@ -43,6 +43,8 @@ class RuleDDF00017(RuleTemplate):
     Attributes: quantity
     """
 
+    requires = ["SubjectEnrollment"]
+
     def __init__(self):
         super().__init__(
             "DDF00017",
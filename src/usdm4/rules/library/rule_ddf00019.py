@@ -16,6 +16,8 @@ class RuleDDF00019(RuleTemplate):
     Attributes: defaultConditionId
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00019",
@@ -9,6 +9,8 @@ class RuleDDF00020(RuleTemplate):
     Attributes: code, otherReason
     """
 
+    requires = ["StudyAmendmentReason"]
+
     def __init__(self):
         super().__init__(
             "DDF00020",
@@ -20,6 +20,8 @@ class RuleDDF00024(RuleTemplate):
     Attributes: previousId, nextId
     """
 
+    requires = ["StudyEpoch"]
+
     def __init__(self):
         super().__init__(
             "DDF00024",
@@ -42,6 +42,8 @@ class RuleDDF00025(RuleTemplate):
     Attributes: windowLabel, windowLower, windowUpper
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00025",
@@ -51,12 +53,7 @@ class RuleDDF00025(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        for item in data.instances_by_klass("Timing"):
-            type_block = item.get("type")
-            if not isinstance(type_block, dict):
-                continue
-            if type_block.get("code") != _FIXED_REFERENCE_CODE:
-                continue
+        for item in data.where("Timing", "type.code", _FIXED_REFERENCE_CODE):
             path = data.path_by_id(item["id"])
             for attr, message in _WINDOW_ATTRIBUTES:
                 if bool(item.get(attr)):
@@ -14,6 +14,10 @@ class RuleDDF00026(RuleTemplate):
     Attributes: timelineId
     """
 
+    visits = ["ScheduledActivityInstance"]
+    requires = ["ScheduledActivityInstance"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00026",
@@ -21,20 +25,18 @@ class RuleDDF00026(RuleTemplate):
             'A scheduled activity instance must not point (via the "timeline" relationship) to the timeline in which it is specified.',
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for sai in data.instances_by_klass("ScheduledActivityInstance"):
-            sub_timeline_id = sai.get("timelineId")
-            if not sub_timeline_id:
-                continue
-            parent_timeline = data.parent_by_klass(sai.get("id"), "ScheduleTimeline")
-            if not isinstance(parent_timeline, dict):
-                continue
-            if sub_timeline_id == parent_timeline.get("id"):
-                self._add_failure(
-                    "ScheduledActivityInstance's sub-timeline points to its own containing timeline",
-                    "ScheduledActivityInstance",
-                    "timelineId",
-                    data.path_by_id(sai["id"]),
-                )
-        return self._result()
+        sub_timeline_id = instance.get("timelineId")
+        if not sub_timeline_id:
+            return
+        parent_timeline = data.parent_by_klass(instance.get("id"), "ScheduleTimeline")
+        if not isinstance(parent_timeline, dict):
+            return
+        if sub_timeline_id == parent_timeline.get("id"):
+            self._add_failure(
+                "ScheduledActivityInstance's sub-timeline points to its own containing timeline",
+                "ScheduledActivityInstance",
+                "timelineId",
+                data.path_by_id(instance["id"]),
+            )
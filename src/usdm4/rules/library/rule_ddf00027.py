@@ -5,7 +5,7 @@
 # two can share a non-null nextId. CORE's `is_not_unique_set` keys
 # the sibling set by (parent_entity, parent_id, parent_rel) — we
 # use (parent_id, instance class) as the proxy since DataStore's
-# `_parent` gives us the parent directly, and the instance's class
+# parent_by_id gives us the parent directly, and the instance's class
 # stands in for parent_rel (in practice each class lives in one
 # named list per parent).
 from collections import defaultdict
@@ -43,7 +43,7 @@ class RuleDDF00027(RuleTemplate):
         groups: dict = defaultdict(lambda: {"prev": [], "next": []})
         for klass in SCOPE_CLASSES:
             for instance in data.instances_by_klass(klass):
-                parent = data._parent.get(instance.get("id"))
+                parent = data.parent_by_id(instance.get("id"))
                 if not isinstance(parent, dict):
                     continue
                 key = (parent.get("id"), klass)
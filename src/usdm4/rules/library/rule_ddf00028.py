@@ -20,6 +20,9 @@ class RuleDDF00028(RuleTemplate):
     Attributes: previousId, nextId
     """
 
+    visits = ["Activity"]
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00028",
@@ -27,24 +30,22 @@ class RuleDDF00028(RuleTemplate):
             "An activity must only reference activities that are specified within the same study design.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for activity in data.instances_by_klass("Activity"):
-            act_design = data.parent_by_klass(activity.get("id"), STUDY_DESIGN_KLASSES)
-            if act_design is None:
+        act_design = data.parent_by_klass(instance.get("id"), STUDY_DESIGN_KLASSES)
+        if act_design is None:
+            return
+        for attr in ("previousId", "nextId"):
+            target_id = instance.get(attr)
+            if not target_id:
+                continue
+            target_design = data.parent_by_klass(target_id, STUDY_DESIGN_KLASSES)
+            if target_design is None:
                 continue
-            for attr in ("previousId", "nextId"):
-                target_id = activity.get(attr)
-                if not target_id:
-                    continue
-                target_design = data.parent_by_klass(target_id, STUDY_DESIGN_KLASSES)
-                if target_design is None:
-                    continue
-                if target_design.get("id") != act_design.get("id"):
-                    self._add_failure(
-                        f"Activity.{attr} {target_id!r} is defined under a different StudyDesign",
-                        "Activity",
-                        attr,
-                        data.path_by_id(activity["id"]),
-                    )
-        return self._result()
+            if target_design.get("id") != act_design.get("id"):
+                self._add_failure(
+                    f"Activity.{attr} {target_id!r} is defined under a different StudyDesign",
+                    "Activity",
+                    attr,
+                    data.path_by_id(instance["id"]),
+                )
@@ -20,6 +20,8 @@ class RuleDDF00029(RuleTemplate):
     Attributes: previousId, nextId
     """
 
+    requires = ["Encounter"]
+
     def __init__(self):
         super().__init__(
             "DDF00029",
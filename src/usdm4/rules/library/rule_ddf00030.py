@@ -9,6 +9,8 @@ class RuleDDF00030(RuleTemplate):
     Attributes: text, familyName
     """
 
+    requires = ["PersonName"]
+
     def __init__(self):
         super().__init__(
             "DDF00030",
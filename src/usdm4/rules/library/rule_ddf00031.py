@@ -9,6 +9,8 @@ class RuleDDF00031(RuleTemplate):
     Attributes: relativeToScheduledInstance
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00031",
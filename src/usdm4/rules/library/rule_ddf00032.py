@@ -9,6 +9,9 @@ class RuleDDF00032(RuleTemplate):
     Attributes: businessTherapeuticAreas
     """
 
+    visits = ["StudyVersion"]
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00032",
@@ -16,20 +19,18 @@ class RuleDDF00032(RuleTemplate):
             "Within a study version, if more than 1 business therapeutic area is defined then they must be distinct.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("StudyVersion"):
-            values = []
-            for sub in item.get("businessTherapeuticAreas") or []:
-                v = sub.get("code") if isinstance(sub, dict) else sub
-                if v not in (None, ""):
-                    values.append(v)
-            if len(values) != len(set(values)):
-                dupes = sorted(set(v for v in values if values.count(v) > 1))
-                self._add_failure(
-                    f"Duplicate businessTherapeuticAreas entries: {dupes!r}",
-                    "StudyVersion",
-                    "businessTherapeuticAreas",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        values = []
+        for sub in instance.get("businessTherapeuticAreas") or []:
+            v = sub.get("code") if isinstance(sub, dict) else sub
+            if v not in (None, ""):
+                values.append(v)
+        if len(values) != len(set(values)):
+            dupes = sorted(set(v for v in values if values.count(v) > 1))
+            self._add_failure(
+                f"Duplicate businessTherapeuticAreas entries: {dupes!r}",
+                "StudyVersion",
+                "businessTherapeuticAreas",
+                data.path_by_id(instance["id"]),
+            )
@@ -13,6 +13,8 @@ class RuleDDF00033(RuleTemplate):
     Attributes: text, quantity
     """
 
+    requires = ["Duration"]
+
     def __init__(self):
         super().__init__(
             "DDF00033",
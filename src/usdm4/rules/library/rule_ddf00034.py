@@ -9,6 +9,8 @@ class RuleDDF00034(RuleTemplate):
     Attributes: durationWillVary, reasonDurationWillVary
     """
 
+    requires = ["Duration"]
+
     def __init__(self):
         super().__init__(
             "DDF00034",
@@ -9,6 +9,8 @@ class RuleDDF00036(RuleTemplate):
     Attributes: relativeToFrom
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00036",
@@ -4,6 +4,7 @@
 # "at least one ... must" idiom) but the semantic is set-level, not
 # per-instance: for each ScheduleTimeline, at least ONE of its
 # ScheduledActivityInstances must have a timelineExitId set. Hand-authored.
+from usdm4.rules.primitives import group_by_scope
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -15,6 +16,9 @@ class RuleDDF00037(RuleTemplate):
     Attributes: timelineExit
     """
 
+    requires = ["ScheduleTimeline"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00037",
@@ -24,14 +28,13 @@ class RuleDDF00037(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
+        by_timeline = group_by_scope(
+            data,
+            data.instances_by_klass("ScheduledActivityInstance"),
+            ["ScheduleTimeline"],
+        )
         for timeline in data.instances_by_klass("ScheduleTimeline"):
-            activities = [
-                sai
-                for sai in data.instances_by_klass("ScheduledActivityInstance")
-                if (p := data.parent_by_klass(sai["id"], ["ScheduleTimeline"]))
-                is not None
-                and p["id"] == timeline["id"]
-            ]
+            activities = by_timeline.get(timeline["id"], [])
             if not activities:
                 # A timeline without any activity instances can't satisfy the
                 # rule by definition; leave that as a separate concern.
@@ -9,6 +9,8 @@ class RuleDDF00038(RuleTemplate):
     Attributes: defaultCondition
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00038",
@@ -9,6 +9,8 @@ class RuleDDF00039(RuleTemplate):
     Attributes: quantity
     """
 
+    requires = ["Duration"]
+
     def __init__(self):
         super().__init__(
             "DDF00039",
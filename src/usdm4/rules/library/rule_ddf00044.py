@@ -3,8 +3,8 @@
 # ConditionAssignment sits inside its parent instance (typically a
 # ScheduledDecisionInstance in USDM samples — but we don't need to hard-code
 # the parent class). Its `conditionTargetId` must not equal the id of the
-# instance that owns it. DataStore's private `_parent` dict gives us the
-# immediate container; there is no public API for that.
+# instance that owns it. DataStore.parent_by_id gives us the immediate
+# container.
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -16,6 +16,9 @@ class RuleDDF00044(RuleTemplate):
     Attributes: conditionTargetId
     """
 
+    requires = ["ConditionAssignment"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00044",
@@ -29,7 +32,7 @@ class RuleDDF00044(RuleTemplate):
             target_id = assignment.get("conditionTargetId")
             if not target_id:
                 continue
-            parent = data._parent.get(assignment.get("id"))
+            parent = data.parent_by_id(assignment.get("id"))
             if parent is None:
                 continue
             if target_id == parent.get("id"):
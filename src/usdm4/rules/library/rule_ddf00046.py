@@ -15,6 +15,9 @@ class RuleDDF00046(RuleTemplate):
     Attributes: relativeFromScheduledInstanceId, relativeToScheduledInstanceId
     """
 
+    requires = ["Timing"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00046",
@@ -20,6 +20,8 @@ class RuleDDF00047(RuleTemplate):
     Attributes: elementIds
     """
 
+    requires = ["StudyCell"]
+
     def __init__(self):
         super().__init__(
             "DDF00047",
@@ -9,6 +9,8 @@ class RuleDDF00051(RuleTemplate):
     Attributes: type
     """
 
+    tags = [RuleTemplate.CT, RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00051",
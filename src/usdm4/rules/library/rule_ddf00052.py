@@ -9,6 +9,8 @@ class RuleDDF00052(RuleTemplate):
     Attributes: standardCodeAliases
     """
 
+    requires = ["AliasCode"]
+
     def __init__(self):
         super().__init__(
             "DDF00052",
@@ -9,6 +9,8 @@ class RuleDDF00058(RuleTemplate):
     Attributes: codes
     """
 
+    requires = ["Indication"]
+
     def __init__(self):
         super().__init__(
             "DDF00058",
@@ -9,6 +9,8 @@ class RuleDDF00059(RuleTemplate):
     Attributes: codes
     """
 
+    requires = ["StudyIntervention"]
+
     def __init__(self):
         super().__init__(
             "DDF00059",
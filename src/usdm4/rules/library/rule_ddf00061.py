@@ -9,6 +9,8 @@ class RuleDDF00061(RuleTemplate):
     Attributes: windowLower
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00061",
@@ -9,6 +9,8 @@ class RuleDDF00062(RuleTemplate):
     Attributes: windowUpper
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00062",
@@ -19,6 +19,8 @@ class RuleDDF00063(RuleTemplate):
     Attributes: standardCodeAliases
     """
 
+    requires = ["AliasCode"]
+
     def __init__(self):
         super().__init__(
             "DDF00063",
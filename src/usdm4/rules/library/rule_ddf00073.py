@@ -10,6 +10,7 @@
 # report; 623 rows on the sample vs CORE's 2).
 from collections import defaultdict
 
+from usdm4.rules.primitives import group_by_scope
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -21,6 +22,8 @@ class RuleDDF00073(RuleTemplate):
     Attributes: codeSystem, codeSystemVersion
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00073",
@@ -30,14 +33,13 @@ class RuleDDF00073(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
+        by_version = group_by_scope(
+            data, data.instances_by_klass("Code"), ["StudyVersion"]
+        )
         for sv in data.instances_by_klass("StudyVersion"):
-            sv_id = sv.get("id")
             # {codeSystem: {codeSystemVersion: [Code instance, ...]}}
             by_system_version: dict = defaultdict(lambda: defaultdict(list))
-            for code_inst in data.instances_by_klass("Code"):
-                code_sv = data.parent_by_klass(code_inst.get("id"), "StudyVersion")
-                if code_sv is None or code_sv.get("id") != sv_id:
-                    continue
+            for code_inst in by_version.get(sv.get("id"), []):
                 cs = code_inst.get("codeSystem")
                 csv = code_inst.get("codeSystemVersion")
                 if cs and csv:
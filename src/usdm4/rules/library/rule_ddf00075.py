@@ -23,6 +23,9 @@ class RuleDDF00075(RuleTemplate):
     Attributes: definedProcedures, biomedicalConceptIds, bcCategoryIds, bcSurrogateIds
     """
 
+    visits = ["Activity"]
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00075",
@@ -30,17 +33,15 @@ class RuleDDF00075(RuleTemplate):
             "An activity is expected to refer to at least one procedure, biomedical concept, biomedical concept category or biomedical concept surrogate.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for activity in data.instances_by_klass("Activity"):
-            # Wrapper activities with children aren't expected to carry leaf refs
-            if activity.get("childIds"):
-                continue
-            if not any(activity.get(a) for a in LEAF_REF_ATTRS):
-                self._add_failure(
-                    "Activity does not reference any procedure, BC, BC category, or BC surrogate",
-                    "Activity",
-                    ", ".join(LEAF_REF_ATTRS),
-                    data.path_by_id(activity["id"]),
-                )
-        return self._result()
+        # Wrapper activities with children aren't expected to carry leaf refs
+        if instance.get("childIds"):
+            return
+        if not any(instance.get(a) for a in LEAF_REF_ATTRS):
+            self._add_failure(
+                "Activity does not reference any procedure, BC, BC category, or BC surrogate",
+                "Activity",
+                ", ".join(LEAF_REF_ATTRS),
+                data.path_by_id(instance["id"]),
+            )
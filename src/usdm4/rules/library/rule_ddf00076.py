@@ -15,6 +15,9 @@ class RuleDDF00076(RuleTemplate):
     Attributes: biomedicalConceptIds, bcCategoryIds
     """
 
+    visits = ["Activity"]
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00076",
@@ -22,24 +25,22 @@ class RuleDDF00076(RuleTemplate):
             "If a biomedical concept is referenced from an activity then it is not expected to be referenced as well by a biomedical concept category that is referenced from the same activity.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for activity in data.instances_by_klass("Activity"):
-            direct = set(activity.get("biomedicalConceptIds") or [])
-            if not direct:
-                continue
-            via_category: set = set()
-            for cat_id in activity.get("bcCategoryIds") or []:
-                cat = data.instance_by_id(cat_id)
-                if isinstance(cat, dict):
-                    for member_id in cat.get("memberIds") or []:
-                        via_category.add(member_id)
-            overlap = direct & via_category
-            if overlap:
-                self._add_failure(
-                    f"Activity references BC(s) {sorted(overlap)} both directly and through a BC Category it also references",
-                    "Activity",
-                    "biomedicalConceptIds, bcCategoryIds",
-                    data.path_by_id(activity["id"]),
-                )
-        return self._result()
+        direct = set(instance.get("biomedicalConceptIds") or [])
+        if not direct:
+            return
+        via_category: set = set()
+        for cat_id in instance.get("bcCategoryIds") or []:
+            cat = data.instance_by_id(cat_id)
+            if isinstance(cat, dict):
+                for member_id in cat.get("memberIds") or []:
+                    via_category.add(member_id)
+        overlap = direct & via_category
+        if overlap:
+            self._add_failure(
+                f"Activity references BC(s) {sorted(overlap)} both directly and through a BC Category it also references",
+                "Activity",
+                "biomedicalConceptIds, bcCategoryIds",
+                data.path_by_id(instance["id"]),
+            )
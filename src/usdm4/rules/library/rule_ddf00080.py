@@ -14,6 +14,10 @@ class RuleDDF00080(RuleTemplate):
     Attributes: epochId
     """
 
+    visits = ["ScheduledActivityInstance"]
+    requires = ["ScheduledActivityInstance"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00080",
@@ -21,17 +25,15 @@ class RuleDDF00080(RuleTemplate):
             "All scheduled activity instances are expected to refer to an epoch.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for sai in data.instances_by_klass("ScheduledActivityInstance"):
-            timeline = data.parent_by_klass(sai.get("id"), "ScheduleTimeline")
-            if not isinstance(timeline, dict) or not timeline.get("mainTimeline"):
-                continue
-            if not sai.get("epochId"):
-                self._add_failure(
-                    "ScheduledActivityInstance in the main timeline does not refer to an epoch",
-                    "ScheduledActivityInstance",
-                    "epochId",
-                    data.path_by_id(sai["id"]),
-                )
-        return self._result()
+        timeline = data.parent_by_klass(instance.get("id"), "ScheduleTimeline")
+        if not isinstance(timeline, dict) or not timeline.get("mainTimeline"):
+            return
+        if not instance.get("epochId"):
+            self._add_failure(
+                "ScheduledActivityInstance in the main timeline does not refer to an epoch",
+                "ScheduledActivityInstance",
+                "epochId",
+                data.path_by_id(instance["id"]),
+            )
@@ -28,7 +28,9 @@ class RuleDDF00082(RuleTemplate):
         try:
             data: DataStore = config["data"]
             validator = SchemaValidation(self._schema_path())
-            validator.validate_file(data.filename, "Wrapper-Input")
+            # Validate the already-loaded document rather than re-reading
+            # the file, which may not exist for an in-memory DataStore
+            validator.validate_against_component(data.data, "Wrapper-Input")
             return True
         except ValidationError as e:
             location = SchemaErrorLocation(e.json_path, e.instance)
@@ -2,12 +2,9 @@
 #
 # Global id uniqueness within the study version. CORE-001015 walks
 # `**.*[id and instanceType]`, groups by id and reports groups with count
-# > 1. DataStore._ids dedupes by overwriting (so iterating it misses
-# duplicates) — so we walk the raw JSON tree directly, tracking a
-# JSONPath for each occurrence so multiple paths can be reported for a
-# repeated id.
-from collections import defaultdict
-
+# > 1. DataStore finds repeated ids while decomposing and keeps every
+# occurrence, with the document JSONPath of each, so the rule needs no
+# walk of its own.
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -28,39 +25,14 @@ class RuleDDF00083(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        root = getattr(data, "data", None)
-        if root is None:
-            return self._result()
-
-        occurrences: dict = defaultdict(list)
-        _collect(root, "$", occurrences)
-
-        for iid, hits in occurrences.items():
-            if len(hits) <= 1:
+        for iid, hits in data.duplicates().items():
+            if not isinstance(iid, str):
                 continue
-            for itype, path in hits:
+            for instance, path in hits:
                 self._add_failure(
                     f"id {iid!r} is not unique ({len(hits)} occurrences)",
-                    itype or "Unknown",
+                    instance.get("instanceType") or "Unknown",
                     "id",
                     path,
                 )
         return self._result()
-
-
-def _collect(node, path: str, occurrences: dict) -> None:
-    """Recursive walk collecting (id -> [(instanceType, path), ...]).
-
-    An 'instance' is a dict that carries both `id` and `instanceType`,
-    mirroring CORE-001015's `**.*[id and instanceType]` filter.
-    """
-    if isinstance(node, dict):
-        iid = node.get("id")
-        itype = node.get("instanceType")
-        if isinstance(iid, str) and isinstance(itype, str):
-            occurrences[iid].append((itype, path))
-        for key, child in node.items():
-            _collect(child, f"{path}.{key}", occurrences)
-    elif isinstance(node, list):
-        for index, child in enumerate(node):
-            _collect(child, f"{path}[{index}]", occurrences)
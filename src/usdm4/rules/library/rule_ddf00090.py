@@ -9,6 +9,9 @@ class RuleDDF00090(RuleTemplate):
     Attributes: bcCategories
     """
 
+    visits = ["Activity"]
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00090",
@@ -16,20 +19,18 @@ class RuleDDF00090(RuleTemplate):
             "The same Biomedical Concept Category must not be referenced more than once from the same activity.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("Activity"):
-            values = []
-            for sub in item.get("bcCategories") or []:
-                v = sub.get("id") if isinstance(sub, dict) else sub
-                if v not in (None, ""):
-                    values.append(v)
-            if len(values) != len(set(values)):
-                dupes = sorted(set(v for v in values if values.count(v) > 1))
-                self._add_failure(
-                    f"Duplicate bcCategories entries: {dupes!r}",
-                    "Activity",
-                    "bcCategories",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        values = []
+        for sub in instance.get("bcCategories") or []:
+            v = sub.get("id") if isinstance(sub, dict) else sub
+            if v not in (None, ""):
+                values.append(v)
+        if len(values) != len(set(values)):
+            dupes = sorted(set(v for v in values if values.count(v) > 1))
+            self._add_failure(
+                f"Duplicate bcCategories entries: {dupes!r}",
+                "Activity",
+                "bcCategories",
+                data.path_by_id(instance["id"]),
+            )
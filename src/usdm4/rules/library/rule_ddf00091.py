@@ -23,6 +23,8 @@ class RuleDDF00091(RuleTemplate):
     Attributes: appliesToIds
     """
 
+    requires = ["Condition"]
+
     def __init__(self):
         super().__init__(
             "DDF00091",
@@ -32,6 +32,8 @@ class RuleDDF00093(RuleTemplate):
     Attributes: dateValues
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00093",
@@ -19,6 +19,8 @@ class RuleDDF00094(RuleTemplate):
     Attributes: dateValues
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00094",
@@ -28,13 +28,7 @@ class RuleDDF00096(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        for endpoint in data.instances_by_klass("Endpoint"):
-            level = endpoint.get("level")
-            if (
-                not isinstance(level, dict)
-                or level.get("code") != PRIMARY_ENDPOINT_CODE
-            ):
-                continue
+        for endpoint in data.where("Endpoint", "level.code", PRIMARY_ENDPOINT_CODE):
             objective = data.parent_by_klass(endpoint.get("id"), "Objective")
             if not isinstance(objective, dict):
                 self._add_failure(
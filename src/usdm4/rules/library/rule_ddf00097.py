@@ -31,6 +31,8 @@ class RuleDDF00097(RuleTemplate):
     Attributes: plannedAge
     """
 
+    requires = ["StudyDesignPopulation"]
+
     def __init__(self):
         super().__init__(
             "DDF00097",
@@ -25,6 +25,8 @@ class RuleDDF00098(RuleTemplate):
     Attributes: plannedSex
     """
 
+    requires = ["StudyDesignPopulation"]
+
     def __init__(self):
         super().__init__(
             "DDF00098",
@@ -13,6 +13,8 @@ class RuleDDF00099(RuleTemplate):
     Attributes: epochId
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00099",
@@ -9,6 +9,9 @@ class RuleDDF00100(RuleTemplate):
     Attributes: titles
     """
 
+    visits = ["StudyVersion"]
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00100",
@@ -16,20 +19,18 @@ class RuleDDF00100(RuleTemplate):
             "Within a study version, there must be no more than one title of each type.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("StudyVersion"):
-            values = []
-            for sub in item.get("titles") or []:
-                v = sub.get("type.code") if isinstance(sub, dict) else sub
-                if v not in (None, ""):
-                    values.append(v)
-            if len(values) != len(set(values)):
-                dupes = sorted(set(v for v in values if values.count(v) > 1))
-                self._add_failure(
-                    f"Duplicate titles entries: {dupes!r}",
-                    "StudyVersion",
-                    "titles",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        values = []
+        for sub in instance.get("titles") or []:
+            v = sub.get("type.code") if isinstance(sub, dict) else sub
+            if v not in (None, ""):
+                values.append(v)
+        if len(values) != len(set(values)):
+            dupes = sorted(set(v for v in values if values.count(v) > 1))
+            self._add_failure(
+                f"Duplicate titles entries: {dupes!r}",
+                "StudyVersion",
+                "titles",
+                data.path_by_id(instance["id"]),
+            )
@@ -1,4 +1,5 @@
 from usdm4.rules.rule_template import RuleTemplate
+from usdm4.rules.primitives import any_ids_unresolved
 
 
 class RuleDDF00102(RuleTemplate):
@@ -9,6 +10,10 @@ class RuleDDF00102(RuleTemplate):
     Attributes: timelineExit
     """
 
+    visits = ["ScheduledActivityInstance"]
+    requires = ["ScheduledActivityInstance"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00102",
@@ -17,20 +22,16 @@ class RuleDDF00102(RuleTemplate):
         )
 
     # GENERATED — predicate inferred from rule text, please review.
-    def validate(self, config: dict) -> bool:
-        from usdm4.rules.primitives import any_ids_unresolved
-
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("ScheduledActivityInstance"):
-            raw = item.get("timelineExit")
-            if raw in (None, "", [], {}):
-                continue
-            ids = raw if isinstance(raw, list) else [raw]
-            for unresolved in any_ids_unresolved(ids, data):
-                self._add_failure(
-                    f"timelineExit references unresolved id {unresolved!r}",
-                    "ScheduledActivityInstance",
-                    "timelineExit",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        raw = instance.get("timelineExit")
+        if raw in (None, "", [], {}):
+            return
+        ids = raw if isinstance(raw, list) else [raw]
+        for unresolved in any_ids_unresolved(ids, data):
+            self._add_failure(
+                f"timelineExit references unresolved id {unresolved!r}",
+                "ScheduledActivityInstance",
+                "timelineExit",
+                data.path_by_id(instance["id"]),
+            )
@@ -9,6 +9,8 @@ class RuleDDF00104(RuleTemplate):
     Attributes: relativeToFrom
     """
 
+    tags = [RuleTemplate.CT, RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00104",
@@ -9,6 +9,8 @@ class RuleDDF00105(RuleTemplate):
     Attributes: epoch
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00105",
@@ -9,6 +9,8 @@ class RuleDDF00106(RuleTemplate):
     Attributes: encounter
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00106",
@@ -22,6 +22,9 @@ class RuleDDF00107(RuleTemplate):
     Attributes: timelineId
     """
 
+    requires = ["ScheduledActivityInstance"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00107",
@@ -9,6 +9,8 @@ class RuleDDF00108(RuleTemplate):
     Attributes: exits
     """
 
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00108",
@@ -9,6 +9,8 @@ class RuleDDF00110(RuleTemplate):
     Attributes: category
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00110",
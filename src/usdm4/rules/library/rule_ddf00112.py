@@ -9,6 +9,8 @@ class RuleDDF00112(RuleTemplate):
     Attributes: role
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00112",
@@ -18,6 +18,8 @@ class RuleDDF00114(RuleTemplate):
     Attributes: contextIds
     """
 
+    requires = ["Condition"]
+
     def __init__(self):
         super().__init__(
             "DDF00114",
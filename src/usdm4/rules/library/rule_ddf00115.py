@@ -17,6 +17,8 @@ class RuleDDF00115(RuleTemplate):
     Attributes: titles
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00115",
@@ -48,6 +48,8 @@ class RuleDDF00124(RuleTemplate):
     Attributes: reference
     """
 
+    requires = ["ParameterMap"]
+
     def __init__(self):
         super().__init__(
             "DDF00124",
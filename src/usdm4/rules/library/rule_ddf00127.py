@@ -21,6 +21,8 @@ class RuleDDF00127(RuleTemplate):
     Attributes: scheduledAtId
     """
 
+    requires = ["Encounter"]
+
     def __init__(self):
         super().__init__(
             "DDF00127",
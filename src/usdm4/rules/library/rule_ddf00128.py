@@ -9,6 +9,8 @@ class RuleDDF00128(RuleTemplate):
     Attributes: type
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00128",
@@ -38,6 +38,8 @@ class RuleDDF00132(RuleTemplate):
     Attributes: plannedCompletionNumber
     """
 
+    requires = ["StudyDesignPopulation"]
+
     def __init__(self):
         super().__init__(
             "DDF00132",
@@ -25,6 +25,8 @@ class RuleDDF00133(RuleTemplate):
     Attributes: plannedEnrollmentNumber
     """
 
+    requires = ["StudyDesignPopulation"]
+
     def __init__(self):
         super().__init__(
             "DDF00133",
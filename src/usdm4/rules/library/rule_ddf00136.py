@@ -9,6 +9,8 @@ class RuleDDF00136(RuleTemplate):
     Attributes: contactModes
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00136",
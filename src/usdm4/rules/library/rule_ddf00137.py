@@ -55,6 +55,8 @@ class RuleDDF00137(RuleTemplate):
     Attributes: reference
     """
 
+    requires = ["ParameterMap"]
+
     def __init__(self):
         super().__init__(
             "DDF00137",
@@ -9,6 +9,8 @@ class RuleDDF00140(RuleTemplate):
     Attributes: organizationType
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00140",
@@ -17,6 +17,8 @@ class RuleDDF00141(RuleTemplate):
     Attributes: plannedSex
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00141",
@@ -9,6 +9,8 @@ class RuleDDF00147(RuleTemplate):
     Attributes: level
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00147",
@@ -9,6 +9,8 @@ class RuleDDF00149(RuleTemplate):
     Attributes: dataOriginType
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00149",
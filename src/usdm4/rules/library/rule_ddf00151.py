@@ -16,6 +16,8 @@ class RuleDDF00151(RuleTemplate):
     Attributes: geographicScopes
     """
 
+    requires = ["GovernanceDate"]
+
     def __init__(self):
         super().__init__(
             "DDF00151",
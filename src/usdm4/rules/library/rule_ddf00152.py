@@ -20,6 +20,9 @@ class RuleDDF00152(RuleTemplate):
     Attributes: timelineId
     """
 
+    visits = ["Activity"]
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00152",
@@ -27,21 +30,19 @@ class RuleDDF00152(RuleTemplate):
             "An activity must only reference timelines that are specified within the same study design.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for activity in data.instances_by_klass("Activity"):
-            timeline_id = activity.get("timelineId")
-            if not timeline_id:
-                continue
-            act_design = data.parent_by_klass(activity.get("id"), STUDY_DESIGN_KLASSES)
-            tl_design = data.parent_by_klass(timeline_id, STUDY_DESIGN_KLASSES)
-            if act_design is None or tl_design is None:
-                continue
-            if act_design.get("id") != tl_design.get("id"):
-                self._add_failure(
-                    f"Activity.timelineId {timeline_id!r} is defined under a different StudyDesign",
-                    "Activity",
-                    "timelineId",
-                    data.path_by_id(activity["id"]),
-                )
-        return self._result()
+        timeline_id = instance.get("timelineId")
+        if not timeline_id:
+            return
+        act_design = data.parent_by_klass(instance.get("id"), STUDY_DESIGN_KLASSES)
+        tl_design = data.parent_by_klass(timeline_id, STUDY_DESIGN_KLASSES)
+        if act_design is None or tl_design is None:
+            return
+        if act_design.get("id") != tl_design.get("id"):
+            self._add_failure(
+                f"Activity.timelineId {timeline_id!r} is defined under a different StudyDesign",
+                "Activity",
+                "timelineId",
+                data.path_by_id(instance["id"]),
+            )
@@ -13,6 +13,9 @@ class RuleDDF00153(RuleTemplate):
     Attributes: plannedDuration
     """
 
+    requires = ["ScheduleTimeline"]
+    tags = [RuleTemplate.TIMELINE]
+
     def __init__(self):
         super().__init__(
             "DDF00153",
@@ -9,6 +9,8 @@ class RuleDDF00154(RuleTemplate):
     Attributes: characteristics
     """
 
+    requires = ["InterventionalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00154",
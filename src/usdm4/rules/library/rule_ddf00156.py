@@ -9,6 +9,9 @@ class RuleDDF00156(RuleTemplate):
     Attributes: environmentalSettings
     """
 
+    visits = ["Encounter"]
+    requires = ["Encounter"]
+
     def __init__(self):
         super().__init__(
             "DDF00156",
@@ -16,20 +19,18 @@ class RuleDDF00156(RuleTemplate):
             "Within an encounter, if more environmental settings are defined, they must be distinct.",
         )
 
-    def validate(self, config: dict) -> bool:
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("Encounter"):
-            values = []
-            for sub in item.get("environmentalSettings") or []:
-                v = sub.get("code") if isinstance(sub, dict) else sub
-                if v not in (None, ""):
-                    values.append(v)
-            if len(values) != len(set(values)):
-                dupes = sorted(set(v for v in values if values.count(v) > 1))
-                self._add_failure(
-                    f"Duplicate environmentalSettings entries: {dupes!r}",
-                    "Encounter",
-                    "environmentalSettings",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        values = []
+        for sub in instance.get("environmentalSettings") or []:
+            v = sub.get("code") if isinstance(sub, dict) else sub
+            if v not in (None, ""):
+                values.append(v)
+        if len(values) != len(set(values)):
+            dupes = sorted(set(v for v in values if values.count(v) > 1))
+            self._add_failure(
+                f"Duplicate environmentalSettings entries: {dupes!r}",
+                "Encounter",
+                "environmentalSettings",
+                data.path_by_id(instance["id"]),
+            )
@@ -9,6 +9,8 @@ class RuleDDF00157(RuleTemplate):
     Attributes: environmentalSettings
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00157",
@@ -9,6 +9,8 @@ class RuleDDF00158(RuleTemplate):
     Attributes: criteria
     """
 
+    requires = ["ObservationalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00158",
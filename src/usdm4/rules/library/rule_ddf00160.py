@@ -35,6 +35,8 @@ class RuleDDF00160(RuleTemplate):
     Attributes: childIds + {biomedicalConceptIds, bcCategoryIds, bcSurrogateIds, timelineId, definedProcedures}
     """
 
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00160",
@@ -66,6 +66,8 @@ class RuleDDF00162(RuleTemplate):
     Attributes: text
     """
 
+    requires = ["NarrativeContentItem"]
+
     def __init__(self):
         super().__init__(
             "DDF00162",
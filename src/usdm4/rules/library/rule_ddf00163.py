@@ -13,6 +13,8 @@ class RuleDDF00163(RuleTemplate):
     Attributes: childIds, contentItemId
     """
 
+    requires = ["NarrativeContent"]
+
     def __init__(self):
         super().__init__(
             "DDF00163",
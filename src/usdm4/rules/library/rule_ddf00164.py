@@ -9,6 +9,8 @@ class RuleDDF00164(RuleTemplate):
     Attributes: sectionNumber, displaySectionNumber
     """
 
+    requires = ["NarrativeContent"]
+
     def __init__(self):
         super().__init__(
             "DDF00164",
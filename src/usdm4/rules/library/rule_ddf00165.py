@@ -9,6 +9,8 @@ class RuleDDF00165(RuleTemplate):
     Attributes: sectionTitle, displaySectionTitle
     """
 
+    requires = ["NarrativeContent"]
+
     def __init__(self):
         super().__init__(
             "DDF00165",
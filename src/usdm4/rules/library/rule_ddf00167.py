@@ -1,4 +1,5 @@
 from usdm4.rules.rule_template import RuleTemplate
+from usdm4.rules.primitives import duplicate_values
 
 
 class RuleDDF00167(RuleTemplate):
@@ -9,6 +10,9 @@ class RuleDDF00167(RuleTemplate):
     Attributes: documentVersions
     """
 
+    visits = ["StudyVersion"]
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00167",
@@ -16,17 +20,13 @@ class RuleDDF00167(RuleTemplate):
             "A study definition document version must not be referenced more than once by the same study version.",
         )
 
-    def validate(self, config: dict) -> bool:
-        from usdm4.rules.primitives import duplicate_values
-
+    def visit(self, instance: dict, config: dict) -> None:
         data = config["data"]
-        for item in data.instances_by_klass("StudyVersion"):
-            dupes = duplicate_values(item.get("documentVersionIds") or [])
-            if dupes:
-                self._add_failure(
-                    f"Duplicate {dupes!r} in documentVersionIds",
-                    "StudyVersion",
-                    "documentVersionIds",
-                    data.path_by_id(item["id"]),
-                )
-        return self._result()
+        dupes = duplicate_values(instance.get("documentVersionIds") or [])
+        if dupes:
+            self._add_failure(
+                f"Duplicate {dupes!r} in documentVersionIds",
+                "StudyVersion",
+                "documentVersionIds",
+                data.path_by_id(instance["id"]),
+            )
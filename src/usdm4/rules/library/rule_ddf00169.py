@@ -9,6 +9,8 @@ class RuleDDF00169(RuleTemplate):
     Attributes: status
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00169",
@@ -28,6 +28,8 @@ class RuleDDF00172(RuleTemplate):
     Attributes: scope
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00172",
@@ -9,6 +9,8 @@ class RuleDDF00175(RuleTemplate):
     Attributes: frequency
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00175",
@@ -9,6 +9,8 @@ class RuleDDF00176(RuleTemplate):
     Attributes: route
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00176",
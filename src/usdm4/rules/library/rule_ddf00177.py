@@ -9,6 +9,8 @@ class RuleDDF00177(RuleTemplate):
     Attributes: dose, route
     """
 
+    requires = ["Administration"]
+
     def __init__(self):
         super().__init__(
             "DDF00177",
@@ -9,6 +9,8 @@ class RuleDDF00178(RuleTemplate):
     Attributes: dose
     """
 
+    requires = ["Administration"]
+
     def __init__(self):
         super().__init__(
             "DDF00178",
@@ -9,6 +9,8 @@ class RuleDDF00179(RuleTemplate):
     Attributes: administrableDoseForm
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00179",
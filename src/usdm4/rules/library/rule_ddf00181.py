@@ -30,6 +30,8 @@ class RuleDDF00181(RuleTemplate):
     Attributes: dateValues
     """
 
+    requires = ["StudyDefinitionDocumentVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00181",
@@ -19,6 +19,8 @@ class RuleDDF00182(RuleTemplate):
     Attributes: dateValues
     """
 
+    requires = ["StudyDefinitionDocumentVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00182",
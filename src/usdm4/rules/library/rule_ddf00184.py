@@ -13,6 +13,8 @@ class RuleDDF00184(RuleTemplate):
     Attributes: referenceSubstanceId
     """
 
+    requires = ["Substance"]
+
     def __init__(self):
         super().__init__(
             "DDF00184",
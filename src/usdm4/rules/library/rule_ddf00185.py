@@ -18,6 +18,8 @@ class RuleDDF00185(RuleTemplate):
     Attributes: dose, administrableProductId, medicalDeviceId
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00185",
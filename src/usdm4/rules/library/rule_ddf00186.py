@@ -15,6 +15,8 @@ class RuleDDF00186(RuleTemplate):
     Attributes: denominator
     """
 
+    requires = ["Strength"]
+
     def __init__(self):
         super().__init__(
             "DDF00186",
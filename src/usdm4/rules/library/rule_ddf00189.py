@@ -17,6 +17,8 @@ class RuleDDF00189(RuleTemplate):
     Attributes: appliesToIds
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00189",
@@ -14,6 +14,8 @@ class RuleDDF00190(RuleTemplate):
     Attributes: assignedPersons, organizations
     """
 
+    requires = ["StudyRole"]
+
     def __init__(self):
         super().__init__(
             "DDF00190",
@@ -29,6 +29,8 @@ class RuleDDF00191(RuleTemplate):
     Attributes: masking
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00191",
@@ -28,6 +28,8 @@ class RuleDDF00192(RuleTemplate):
     Attributes: masking
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00192",
@@ -30,6 +30,8 @@ class RuleDDF00193(RuleTemplate):
     Attributes: masking
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00193",
@@ -44,6 +44,8 @@ class RuleDDF00194(RuleTemplate):
     Attributes: All
     """
 
+    requires = ["Address"]
+
     def __init__(self):
         super().__init__(
             "DDF00194",
@@ -19,6 +19,8 @@ class RuleDDF00196(RuleTemplate):
     Attributes: sectionNumber, sectionTitle
     """
 
+    requires = ["StudyAmendment"]
+
     def __init__(self):
         super().__init__(
             "DDF00196",
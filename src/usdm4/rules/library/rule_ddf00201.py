@@ -17,6 +17,8 @@ class RuleDDF00201(RuleTemplate):
     Attributes: code
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00201",
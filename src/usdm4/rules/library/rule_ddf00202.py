@@ -19,6 +19,8 @@ class RuleDDF00202(RuleTemplate):
     Attributes: organizations
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00202",
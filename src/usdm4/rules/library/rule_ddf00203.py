@@ -16,6 +16,8 @@ class RuleDDF00203(RuleTemplate):
     Attributes: appliesToIds
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00203",
@@ -17,6 +17,8 @@ class RuleDDF00205(RuleTemplate):
     Attributes: administrableProductId, medicalDeviceId
     """
 
+    requires = ["Administration"]
+
     def __init__(self):
         super().__init__(
             "DDF00205",
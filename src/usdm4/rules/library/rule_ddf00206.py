@@ -23,6 +23,8 @@ class RuleDDF00206(RuleTemplate):
     Attributes: sourcing
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00206",
@@ -9,6 +9,8 @@ class RuleDDF00208(RuleTemplate):
     Attributes: sourcing
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00208",
@@ -9,6 +9,8 @@ class RuleDDF00209(RuleTemplate):
     Attributes: sourcing
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00209",
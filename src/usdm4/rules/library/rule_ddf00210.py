@@ -16,6 +16,8 @@ class RuleDDF00210(RuleTemplate):
     Attributes: productDesignation
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00210",
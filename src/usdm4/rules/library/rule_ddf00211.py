@@ -9,6 +9,8 @@ class RuleDDF00211(RuleTemplate):
     Attributes: appliesTo
     """
 
+    requires = ["ProductOrganizationRole"]
+
     def __init__(self):
         super().__init__(
             "DDF00211",
@@ -17,6 +17,8 @@ class RuleDDF00212(RuleTemplate):
     Attributes: appliesToIds
     """
 
+    requires = ["ProductOrganizationRole"]
+
     def __init__(self):
         super().__init__(
             "DDF00212",
@@ -20,6 +20,8 @@ class RuleDDF00213(RuleTemplate):
     Attributes: model, studyInterventionIds
     """
 
+    requires = ["StudyVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00213",
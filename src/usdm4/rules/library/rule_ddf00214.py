@@ -9,6 +9,8 @@ class RuleDDF00214(RuleTemplate):
     Attributes: intentTypes
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00214",
@@ -9,6 +9,8 @@ class RuleDDF00217(RuleTemplate):
     Attributes: blindingSchema
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00217",
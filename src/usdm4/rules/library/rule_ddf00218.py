@@ -9,6 +9,8 @@ class RuleDDF00218(RuleTemplate):
     Attributes: characteristics
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00218",
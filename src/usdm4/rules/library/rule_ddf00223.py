@@ -9,6 +9,8 @@ class RuleDDF00223(RuleTemplate):
     Attributes: model
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00223",
@@ -9,6 +9,8 @@ class RuleDDF00224(RuleTemplate):
     Attributes: timePerspective
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00224",
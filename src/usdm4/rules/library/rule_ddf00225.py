@@ -9,6 +9,8 @@ class RuleDDF00225(RuleTemplate):
     Attributes: samplingMethod
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00225",
@@ -9,6 +9,8 @@ class RuleDDF00226(RuleTemplate):
     Attributes: subTypes
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00226",
@@ -9,6 +9,8 @@ class RuleDDF00227(RuleTemplate):
     Attributes: studyType
     """
 
+    requires = ["InterventionalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00227",
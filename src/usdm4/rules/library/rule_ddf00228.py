@@ -9,6 +9,8 @@ class RuleDDF00228(RuleTemplate):
     Attributes: studyType
     """
 
+    requires = ["ObservationalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00228",
@@ -54,6 +54,8 @@ class RuleDDF00229(RuleTemplate):
     Attributes: studyPhase
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00229",
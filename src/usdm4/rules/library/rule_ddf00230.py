@@ -9,6 +9,8 @@ class RuleDDF00230(RuleTemplate):
     Attributes: studyType
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00230",
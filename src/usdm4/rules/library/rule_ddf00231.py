@@ -13,6 +13,8 @@ class RuleDDF00231(RuleTemplate):
     Attributes: isRetained, includesDNA
     """
 
+    requires = ["BiospecimenRetention"]
+
     def __init__(self):
         super().__init__(
             "DDF00231",
@@ -28,6 +28,8 @@ class RuleDDF00232(RuleTemplate):
     Attributes: studyPhase
     """
 
+    requires = ["ObservationalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00232",
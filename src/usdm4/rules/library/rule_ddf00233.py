@@ -9,6 +9,8 @@ class RuleDDF00233(RuleTemplate):
     Attributes: unit
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00233",
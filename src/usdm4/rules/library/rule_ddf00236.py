@@ -13,6 +13,8 @@ class RuleDDF00236(RuleTemplate):
     Attributes: synonyms
     """
 
+    requires = ["BiomedicalConcept"]
+
     def __init__(self):
         super().__init__(
             "DDF00236",
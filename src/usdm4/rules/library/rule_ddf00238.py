@@ -14,6 +14,8 @@ class RuleDDF00238(RuleTemplate):
     Attributes: numerator
     """
 
+    requires = ["Strength"]
+
     def __init__(self):
         super().__init__(
             "DDF00238",
@@ -31,6 +31,8 @@ class RuleDDF00241(RuleTemplate):
     Attributes: minValue, maxValue
     """
 
+    requires = ["Range"]
+
     def __init__(self):
         super().__init__(
             "DDF00241",
@@ -9,6 +9,8 @@ class RuleDDF00242(RuleTemplate):
     Attributes: minValue, maxValue
     """
 
+    requires = ["Range"]
+
     def __init__(self):
         super().__init__(
             "DDF00242",
@@ -47,6 +47,8 @@ class RuleDDF00244(RuleTemplate):
     Attributes: text
     """
 
+    requires = ["NarrativeContentItem"]
+
     def __init__(self):
         super().__init__(
             "DDF00244",
@@ -16,6 +16,8 @@ class RuleDDF00245(RuleTemplate):
     Attributes: sectionNumber
     """
 
+    requires = ["StudyDefinitionDocumentVersion"]
+
     def __init__(self):
         super().__init__(
             "DDF00245",
@@ -10,6 +10,8 @@
 # the link is ``criterionItemId``. As a result the rule fired on every
 # criterion regardless of data. This rewrite mirrors what the rule text
 # describes (and what CORE typically expresses for the same constraint).
+# The "is it referenced" test is a DataStore.referrers lookup rather than
+# a scan over every criterion.
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -21,6 +23,8 @@ class RuleDDF00249(RuleTemplate):
     Attributes: id
     """
 
+    requires = ["EligibilityCriterionItem"]
+
     def __init__(self):
         super().__init__(
             "DDF00249",
@@ -30,17 +34,11 @@ class RuleDDF00249(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        # Collect every criterionItemId referenced by any EligibilityCriterion
-        # in the model. A criterion item is "used" if its id appears in this
-        # set.
-        used_ids: set[str] = set()
-        for criterion in data.instances_by_klass("EligibilityCriterion"):
-            ref = criterion.get("criterionItemId")
-            if isinstance(ref, str) and ref:
-                used_ids.add(ref)
+        # A criterion item is "used" if any instance references it through
+        # criterionItemId (only EligibilityCriterion carries that attribute).
         for item in data.instances_by_klass("EligibilityCriterionItem"):
             iid = item.get("id")
-            if not iid or iid in used_ids:
+            if not iid or data.referrers(iid, "criterionItemId"):
                 continue
             self._add_failure(
                 "EligibilityCriterionItem is not used by any EligibilityCriterion",
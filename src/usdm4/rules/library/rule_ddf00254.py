@@ -1,5 +1,8 @@
+from usdm4.rules.primitives import group_by_scope
 from usdm4.rules.rule_template import RuleTemplate
 
+STUDY_DESIGN_KLASSES = ["InterventionalStudyDesign", "ObservationalStudyDesign"]
+
 
 class RuleDDF00254(RuleTemplate):
     """
@@ -9,6 +12,8 @@ class RuleDDF00254(RuleTemplate):
     Attributes: children
     """
 
+    requires = ["Activity"]
+
     def __init__(self):
         super().__init__(
             "DDF00254",
@@ -18,27 +23,19 @@ class RuleDDF00254(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
+        # Ids of the activities within each study design, collected once
+        sibling_ids = {
+            scope_id: {sib["id"] for sib in activities}
+            for scope_id, activities in group_by_scope(
+                data, data.instances_by_klass("Activity"), STUDY_DESIGN_KLASSES
+            ).items()
+        }
         for item in data.instances_by_klass("Activity"):
-            scope = data.parent_by_klass(
-                item["id"], ["InterventionalStudyDesign", "ObservationalStudyDesign"]
-            )
+            scope = data.parent_by_klass(item["id"], STUDY_DESIGN_KLASSES)
             if scope is None:
                 continue
-            # Collect ids of same-class siblings within this scope
-            sibling_ids = {
-                sib["id"]
-                for sib in data.instances_by_klass("Activity")
-                if (
-                    sp := data.parent_by_klass(
-                        sib["id"],
-                        ["InterventionalStudyDesign", "ObservationalStudyDesign"],
-                    )
-                )
-                is not None
-                and sp["id"] == scope["id"]
-            }
             for ref_id in item.get("childIds") or []:
-                if ref_id not in sibling_ids:
+                if ref_id not in sibling_ids[scope["id"]]:
                     self._add_failure(
                         f"childIds references {ref_id!r} outside the same scope",
                         "Activity",
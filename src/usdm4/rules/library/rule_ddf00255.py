@@ -18,6 +18,8 @@ class RuleDDF00255(RuleTemplate):
     Attributes: code
     """
 
+    requires = ["StudyAmendment"]
+
     def __init__(self):
         super().__init__(
             "DDF00255",
@@ -16,6 +16,8 @@ class RuleDDF00256(RuleTemplate):
     Attributes: code
     """
 
+    requires = ["StudyAmendment"]
+
     def __init__(self):
         super().__init__(
             "DDF00256",
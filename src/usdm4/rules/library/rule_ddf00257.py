@@ -9,6 +9,8 @@ class RuleDDF00257(RuleTemplate):
     Attributes: characteristics
     """
 
+    requires = ["InterventionalStudyDesign"]
+
     def __init__(self):
         super().__init__(
             "DDF00257",
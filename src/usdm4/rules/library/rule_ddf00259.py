@@ -9,6 +9,8 @@ class RuleDDF00259(RuleTemplate):
     Attributes: code
     """
 
+    tags = [RuleTemplate.CT]
+
     def __init__(self):
         super().__init__(
             "DDF00259",
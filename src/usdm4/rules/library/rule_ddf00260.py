@@ -1,9 +1,8 @@
 # MANUAL: do not regenerate
 #
 # Id values must not contain spaces. Applies to every indexed instance —
-# DataStore's private `_ids` dict is the only way to reach all of them
-# without enumerating every class. Acceptable here because it's a
-# cross-cutting model-wide check.
+# DataStore.instances() reaches all of them without enumerating every
+# class.
 from usdm4.rules.rule_template import RuleTemplate
 
 
@@ -24,9 +23,8 @@ class RuleDDF00260(RuleTemplate):
 
     def validate(self, config: dict) -> bool:
         data = config["data"]
-        # Iterate every indexed instance. DataStore doesn't expose a public
-        # iterator, so access _ids directly.
-        for iid, item in data._ids.items():
+        # Iterate every indexed instance.
+        for iid, item in data.instances():
             if not isinstance(iid, str) or " " not in iid:
                 continue
             instance_type = (
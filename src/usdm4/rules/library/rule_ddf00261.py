@@ -9,6 +9,8 @@ class RuleDDF00261(RuleTemplate):
     Attributes: code
     """
 
+    requires = ["GeographicScope"]
+
     def __init__(self):
         super().__init__(
             "DDF00261",
@@ -7,9 +7,10 @@ them here (rather than inlining into every generated rule) makes the
 generated code short, readable, and easy to audit.
 
 Design principle: DataStore provides the index primitives
-(instances_by_klass, instance_by_id, parent_by_klass, path_by_id). This
-module adds *composite* helpers that sit one level up — things like
-"find duplicates by key", "resolve an id list via DataStore", etc.
+(instances_by_klass, instance_by_id, where, parent_by_klass, parent_by_id,
+path_by_id, referrers, instances). This module adds *composite* helpers
+that sit one level up — things like "find duplicates by key", "resolve an
+id list via DataStore", etc.
 
 Intentionally small. If a helper is only used by one rule it lives in
 that rule's body, not here.
@@ -104,3 +105,21 @@ def same_scope(
 def scope_of(data_store, instance_id: str, scope_classes: list[str]) -> Optional[dict]:
     """Thin alias for DataStore.parent_by_klass, for readability in generated code."""
     return data_store.parent_by_klass(instance_id, scope_classes)
+
+
+def group_by_scope(
+    data_store, items: Iterable[dict], scope_classes: list[str]
+) -> dict[str, list[dict]]:
+    """
+    Group items by the id of their scope (see scope_of), in input order.
+    Items with no scope are left out.
+
+    Built once per rule, so "the <X>s within the same <Z>" is a lookup
+    rather than a rescan of every X for each one.
+    """
+    groups: dict[str, list[dict]] = defaultdict(list)
+    for it in items:
+        scope = data_store.parent_by_klass(it.get("id"), scope_classes)
+        if scope is not None:
+            groups[scope["id"]].append(it)
+    return dict(groups)
@@ -33,16 +33,48 @@ class RuleStatus(str, Enum):
     FAILURE = "Failure"
     EXCEPTION = "Exception"
     NOT_IMPLEMENTED = "Not Implemented"
+    # Not run, the document has nothing the rule checks
+    SKIPPED = "Skipped"
+    # No outcome, a gated validation stopped before reaching the rule (on
+    # a pool, before the rule finished)
+    NOT_RUN = "Not Run"
+    # Stopped, the rule ran past its time budget
+    TIMEOUT = "Timeout"
+
+
+@dataclass
+class RuleProfile:
+    """cProfile and tracemalloc capture of a single rule's execution."""
+
+    # pstats report, by cumulative time
+    stats: str
+    # Peak memory allocated while the rule ran, in bytes
+    peak_memory: int
+    # Allocation sites of the memory still held when the rule finished
+    allocations: str
 
 
 @dataclass
 class RuleOutcome:
-    """Outcome of executing a single rule against a USDM document."""
+    """Outcome of executing a single rule against a USDM document.
+
+    ``wall_time`` and ``cpu_time`` are in seconds; ``instance_count`` is
+    the number of instances the rule was handed or enumerated from the
+    DataStore. ``reads`` are the DataStore queries the rule made, as
+    ``(method, args, kwargs)``, None when what it read is not known; incremental
+    validation compares their answers to decide whether to run the rule
+    again.
+    """
 
     rule_id: str
     status: RuleStatus
     errors: Errors = field(default_factory=Errors)
     exception: str | None = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    instance_count: int = 0
+    profile: RuleProfile | None = None
+    reads: set[tuple] | None = field(default=None, repr=False)
 
     @property
     def error_count(self) -> int:
@@ -77,6 +109,19 @@ class RulesValidationResults:
     def add_not_implemented(self, rule: str) -> None:
         self.outcomes[rule] = RuleOutcome(rule, RuleStatus.NOT_IMPLEMENTED)
 
+    def add_skipped(self, rule: str) -> None:
+        self.outcomes[rule] = RuleOutcome(rule, RuleStatus.SKIPPED)
+
+    def add_not_run(self, rule: str) -> None:
+        self.outcomes[rule] = RuleOutcome(rule, RuleStatus.NOT_RUN)
+
+    def add_timeout(self, rule: str, message: str) -> None:
+        self.outcomes[rule] = RuleOutcome(rule, RuleStatus.TIMEOUT, exception=message)
+
+    def add_outcome(self, outcome: RuleOutcome) -> None:
+        """Record an outcome produced elsewhere, e.g. by a worker."""
+        self.outcomes[outcome.rule_id] = outcome
+
     # ---- query API ----------------------------------------------------------
 
     def count(self) -> int:
@@ -91,23 +136,62 @@ class RulesValidationResults:
         return self.passed()
 
     def passed(self) -> bool:
-        return all(o.status == RuleStatus.SUCCESS for o in self.outcomes.values())
+        # A skipped rule had nothing to check, so cannot have failed
+        return all(
+            o.status in (RuleStatus.SUCCESS, RuleStatus.SKIPPED)
+            for o in self.outcomes.values()
+        )
 
     def passed_or_not_implemented(self) -> bool:
         return all(
-            o.status in (RuleStatus.SUCCESS, RuleStatus.NOT_IMPLEMENTED)
+            o.status
+            in (RuleStatus.SUCCESS, RuleStatus.SKIPPED, RuleStatus.NOT_IMPLEMENTED)
             for o in self.outcomes.values()
         )
 
     def by_status(self, status: RuleStatus) -> list[RuleOutcome]:
         return [o for o in self.outcomes.values() if o.status == status]
 
+    def not_run(self) -> list[str]:
+        """Ids of the rules a gated validation stopped before running."""
+        return [o.rule_id for o in self.by_status(RuleStatus.NOT_RUN)]
+
+    @property
+    def wall_time(self) -> float:
+        return sum(o.wall_time for o in self.outcomes.values())
+
+    def timings(self, limit: int | None = None) -> list[dict]:
+        """
+        Row-per-rule cost report, most expensive (by wall time) first.
+
+        Each row carries ``rule_id``, ``status``, ``wall_time`` and
+        ``cpu_time`` (seconds), ``instance_count`` and ``share``, the
+        rule's fraction of the total wall time. ``limit`` keeps only the
+        first rows.
+        """
+        total = self.wall_time
+        rows = [
+            {
+                "rule_id": o.rule_id,
+                "status": o.status.value,
+                "wall_time": o.wall_time,
+                "cpu_time": o.cpu_time,
+                "instance_count": o.instance_count,
+                "share": o.wall_time / total if total else 0.0,
+            }
+            for o in sorted(
+                self.outcomes.values(), key=lambda o: (-o.wall_time, o.rule_id)
+            )
+        ]
+        return rows[:limit] if limit is not None else rows
+
     # ---- rendering ----------------------------------------------------------
 
     def to_dict(
         self,
         include_success: bool = False,
         include_not_implemented: bool = False,
+        include_skipped: bool = False,
     ) -> list[dict]:
         """
         Flat row-per-error list, sorted by rule id.
@@ -115,7 +199,8 @@ class RulesValidationResults:
         Defaults drop Success / NotImplemented rows (the phantom rows
         every current caller filters out). Pass ``include_success=True``
         / ``include_not_implemented=True`` to restore the pre-refactor
-        full-shape output.
+        full-shape output. Skipped rows, dropped too, are kept with
+        ``include_skipped=True``.
 
         Row keys for a Failure/Exception are identical to the
         pre-refactor output so YAML baselines in
@@ -123,12 +208,15 @@ class RulesValidationResults:
 
         Warnings are preserved — we pass ``level=Errors.DEBUG`` through
         so rules constructed at ``RuleTemplate.WARNING`` still surface.
+        A Timeout row carries the budget it exceeded as ``exception``.
         """
-        keep = {RuleStatus.FAILURE, RuleStatus.EXCEPTION}
+        keep = {RuleStatus.FAILURE, RuleStatus.EXCEPTION, RuleStatus.TIMEOUT}
         if include_success:
             keep.add(RuleStatus.SUCCESS)
         if include_not_implemented:
             keep.add(RuleStatus.NOT_IMPLEMENTED)
+        if include_skipped:
+            keep.add(RuleStatus.SKIPPED)
 
         rows: list[dict] = []
         for rule_id in sorted(self.outcomes):
@@ -188,6 +276,9 @@ class RulesValidationResults:
         for outcome in self.by_status(RuleStatus.EXCEPTION):
             lines.append(f"\n{outcome.rule_id}: EXCEPTION")
             lines.append(f"  {outcome.exception}")
+        for outcome in self.by_status(RuleStatus.TIMEOUT):
+            lines.append(f"\n{outcome.rule_id}: TIMEOUT")
+            lines.append(f"  {outcome.exception}")
         return "\n".join(lines)
 
     # ---- back-compat --------------------------------------------------------
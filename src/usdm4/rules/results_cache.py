@@ -0,0 +1,79 @@
+import os
+import time
+from usdm4.file_cache.pickle_cache import PickleCache
+from usdm4.rules.results import RulesValidationResults
+
+
+class ResultsCache(PickleCache):
+    """On-disk cache of rule library validation results.
+
+    Results are named by a SHA-256 over the validated file's contents, a
+    digest of the package version and the sources the rules run on, the
+    version of the terminology the rules ran with, the rule selection and
+    the cache format version, so that a change to any of them simply
+    misses the cache.
+
+    Entries older than ``max_age`` seconds are misses and are removed, as
+    are the least recently used entries once the cache holds more than
+    ``max_size`` bytes; None means no limit. Eviction runs whenever an
+    entry is saved.
+    """
+
+    # Bump whenever RulesValidationResults changes shape
+    VERSION = 3
+    MAX_SIZE = 256 * 1024 * 1024
+    MAX_AGE = 30 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        filepath: str,
+        max_size: int | None = MAX_SIZE,
+        max_age: float | None = MAX_AGE,
+    ):
+        super().__init__(filepath)
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def read(self, key: str) -> RulesValidationResults | None:
+        path = self._full_filepath(key)
+        try:
+            if self._expired(os.path.getmtime(path)):
+                self.delete(key)
+                return None
+            results = super().read(key)
+            if results is not None:
+                # Marks the entry as recently used
+                os.utime(path)
+            return results
+        except Exception:
+            return None
+
+    def save(self, key: str, results: RulesValidationResults) -> None:
+        super().save(key, results)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        try:
+            with os.scandir(self.filepath) as scan:
+                for entry in scan:
+                    if entry.name.endswith(self.EXTENSION):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except Exception:
+            return
+        # Oldest first
+        entries.sort()
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, path in entries:
+            over_size = self.max_size is not None and size > self.max_size
+            if not over_size and not self._expired(mtime):
+                continue
+            try:
+                os.remove(path)
+                size -= entry_size
+            except Exception:
+                pass
+
+    def _expired(self, mtime: float) -> bool:
+        return self.max_age is not None and time.time() - mtime > self.max_age
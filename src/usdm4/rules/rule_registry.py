@@ -0,0 +1,106 @@
+import os
+import json
+import importlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Type
+from usdm4.rules.rule_template import RuleTemplate
+
+
+@dataclass(eq=False)
+class RuleEntry:
+    """A rule of the library as listed in the registry.
+
+    Stands in for the rule class: calling an entry imports the rule's
+    module, on first use only, and returns a new rule, and ``visits`` is
+    available, with ``requires`` and ``tags``, without importing anything.
+    """
+
+    rule_id: str
+    module: str
+    class_name: str
+    level: int
+    visits: list[str]
+    requires: list[str]
+    tags: list[str]
+    package: str
+    _rule_class: Type[RuleTemplate] | None = field(default=None, repr=False)
+
+    def load(self) -> Type[RuleTemplate]:
+        if self._rule_class is None:
+            module = importlib.import_module(f"{self.package}.{self.module}")
+            self._rule_class = getattr(module, self.class_name)
+        return self._rule_class
+
+    def __call__(self) -> RuleTemplate:
+        return self.load()()
+
+
+class RuleRegistry:
+    """The generated list of the rules in the library, so that an engine
+    can start without importing and inspecting every rule module.
+
+    The registry is the module ``usdm4.rules.library.registry``, written
+    by ``tools/build_rule_registry.py``. It is only used for the package
+    it was built for and only while its modules match the rule files in
+    the library and its rows have the current columns; otherwise the
+    engine scans the library as before.
+    """
+
+    PACKAGE = "usdm4.rules.library"
+    MODULE = "registry"
+    COLUMNS = 7
+
+    def __init__(self, library_path: str, package_name: str):
+        self.library_path = library_path
+        self.package_name = package_name
+
+    def entries(self) -> list[RuleEntry] | None:
+        if self.package_name != self.PACKAGE:
+            return None
+        try:
+            registry = importlib.import_module(f"{self.PACKAGE}.{self.MODULE}")
+        except ImportError:
+            return None
+        modules = {file.stem for file in Path(self.library_path).glob("rule_ddf*.py")}
+        if modules != {row[1] for row in registry.RULES} or any(
+            len(row) != self.COLUMNS for row in registry.RULES
+        ):
+            return None
+        return [RuleEntry(*row, self.package_name) for row in registry.RULES]
+
+    def build(self, rule_classes: list[Type[RuleTemplate]]) -> list[tuple]:
+        rows = []
+        for rule_class in rule_classes:
+            rule = rule_class()
+            rows.append(
+                (
+                    rule._rule,
+                    rule_class.__module__.rsplit(".", 1)[-1],
+                    rule_class.__name__,
+                    rule._level,
+                    list(rule_class.visits),
+                    list(rule_class.requires),
+                    list(rule_class.tags),
+                )
+            )
+        return sorted(rows, key=lambda row: (row[1], row[2]))
+
+    def write(self, rows: list[tuple]) -> None:
+        lines = [
+            "# Generated by tools/build_rule_registry.py from the rule library, do",
+            "# not edit. Regenerate whenever a rule is added, removed or changed.",
+            "#",
+            "# (rule id, module, class, level, visits, requires, tags)",
+            "# fmt: off",
+            "RULES = [",
+            *[
+                f"    ({', '.join(json.dumps(value) for value in row)}),"
+                for row in rows
+            ],
+            "]",
+            "# fmt: on",
+            "",
+        ]
+        with open(os.path.join(self.library_path, f"{self.MODULE}.py"), "w") as file:
+            file.write("\n".join(lines))
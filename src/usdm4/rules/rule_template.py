@@ -1,7 +1,11 @@
+import time
+from array import array
+from datetime import datetime
+from simple_error_log.error import Error
 from simple_error_log.error_location import ErrorLocation
 from simple_error_log.errors import Errors
 
-from usdm4.ct.cdisc.library import Library as CTLibrary
+from usdm4.ct.cdisc.library import TermIndex
 
 
 class ValidationLocation(ErrorLocation):
@@ -31,34 +35,218 @@ class ValidationLocation(ErrorLocation):
         return f"{self.rule} [{self.rule_text}]: {self.klass}.{self.attribute} at {self.path}"
 
 
+class RuleFindings(Errors):
+    """The findings of one rule, held column by column.
+
+    ``add_finding`` records a failure of the rule at a class, attribute
+    and path, with the rule's id as its type and the rule's level, and
+    allocates no ``ValidationLocation`` or ``Error``.
+    Entries added the ``Errors`` way (``add``, ``error``, ...) keep their
+    own location, type, level and extra.
+
+    ``count`` and ``to_dict`` read the columns. ``Error`` objects are
+    built, afresh, only when ``_items`` is read, as by ``dump``,
+    ``merge`` into another ``Errors`` or :meth:`materialise`.
+    """
+
+    def __init__(self, rule: str = "", rule_text: str = "", level: int = Errors.ERROR):
+        self.rule = rule
+        self.rule_text = rule_text
+        self.level = level
+        self.clear()
+
+    def clear(self) -> None:
+        self._messages: list[str] = []
+        self._klasses: list[str | None] = []
+        self._attributes: list[str | None] = []
+        self._paths: list[str | None] = []
+        self._timestamps = array("d")
+        # Entries not added by add_finding, by index, as (location, type,
+        # level, extra)
+        self._entries: dict[int, tuple] = {}
+
+    def add_finding(self, message: str, klass: str, attribute: str, path: str) -> None:
+        self._messages.append(message)
+        self._klasses.append(klass)
+        self._attributes.append(attribute)
+        self._paths.append(path)
+        self._timestamps.append(time.time())
+
+    def add(
+        self,
+        message: str,
+        location: ErrorLocation = None,
+        error_type: str = "",
+        level: int = Errors.ERROR,
+        extra: dict | None = None,
+    ) -> None:
+        self._entries[len(self._messages)] = (
+            location if location else ErrorLocation(),
+            error_type,
+            level,
+            extra,
+        )
+        self.add_finding(message, None, None, None)
+
+    def count(self) -> int:
+        return len(self._messages)
+
+    def error_count(self) -> int:
+        findings = self.count() - len(self._entries)
+        return (findings if self.level == Errors.ERROR else 0) + sum(
+            1 for entry in self._entries.values() if entry[2] == Errors.ERROR
+        )
+
+    def to_dict(self, level: int = Errors.ERROR) -> list[dict]:
+        result = []
+        label = Error.LABEL[self.level].capitalize()
+        columns = zip(
+            self._messages,
+            self._klasses,
+            self._attributes,
+            self._paths,
+            self._timestamps,
+        )
+        for index, (message, klass, attribute, path, timestamp) in enumerate(columns):
+            entry = self._entries.get(index)
+            if entry is None:
+                if self.level < level:
+                    continue
+                entry_label, error_type, extra = label, self.rule, None
+                location = {
+                    "rule": self.rule,
+                    "rule_text": self.rule_text,
+                    "klass": klass,
+                    "attribute": attribute,
+                    "path": path,
+                }
+            else:
+                if entry[2] < level:
+                    continue
+                entry_label = Error.LABEL[entry[2]].capitalize()
+                location, error_type, extra = entry[0].to_dict(), entry[1], entry[3]
+            result.append(
+                {
+                    "level": entry_label,
+                    "message": message,
+                    "type": error_type,
+                    "extra": extra,
+                    # As Error.to_dict's "%Y-%m-%d %H:%M:%S.%f", only faster
+                    "timestamp": datetime.fromtimestamp(timestamp).isoformat(
+                        " ", "microseconds"
+                    ),
+                    "location": location,
+                }
+            )
+        return result
+
+    def merge(self, other: Errors) -> None:
+        items = sorted(self._items + other._items, key=lambda item: item.timestamp)
+        self.clear()
+        for item in items:
+            self.add(
+                item.message, item.location, item.error_type, item.level, item.extra
+            )
+            self._timestamps[-1] = item.timestamp.timestamp()
+
+    def materialise(self) -> Errors:
+        errors = Errors()
+        errors._items = self._items
+        return errors
+
+    @property
+    def _items(self) -> list[Error]:
+        items = []
+        for index in range(self.count()):
+            location, error_type, level, extra = self._entry(index)
+            item = Error(self._messages[index], location, error_type, level, extra)
+            item.timestamp = self._timestamp(index)
+            items.append(item)
+        return items
+
+    def _entry(self, index: int) -> tuple:
+        entry = self._entries.get(index)
+        if entry is not None:
+            return entry
+        return (
+            ValidationLocation(
+                self.rule,
+                self.rule_text,
+                self._klasses[index],
+                self._attributes[index],
+                self._paths[index],
+            ),
+            self.rule,
+            self.level,
+            None,
+        )
+
+    def _timestamp(self, index: int) -> datetime:
+        return datetime.fromtimestamp(self._timestamps[index])
+
+
 class RuleTemplate:
     """
     Base class for rule templates
+
+    A rule either overrides ``validate`` or names the classes it checks in
+    ``visits`` and overrides ``visit``, which is called with each instance
+    of those classes, then ``finish``. The engine walks each class once
+    for all the rules visiting it; ``validate`` does the same walk for
+    the rule on its own, so a visiting rule can still be run directly.
+
+    A rule that only checks instances of certain classes names them in
+    ``requires``; the engine skips it when the document has no instance
+    of any of them. ``tags`` group rules (e.g. ``CT``) so that a subset
+    can be selected for a validation.
     """
 
     ERROR = Errors.ERROR
     WARNING = Errors.WARNING
 
+    # Tags
+    CT = "ct"
+    TIMELINE = "timeline"
+
+    # Classes whose instances are passed to visit()
+    visits: list[str] = []
+    # Classes of which at least one instance is needed for the rule to run
+    requires: list[str] = []
+    tags: list[str] = []
+
     class CTException(Exception):
         pass
 
     def __init__(self, rule: str, level: int, rule_text: str):
-        self._errors = Errors()
+        self._errors = RuleFindings(rule, rule_text, level)
         self._rule = rule
         self._level = level
         self._rule_text = rule_text
 
     def validate(self, config: dict) -> bool:
+        if not self.visits:
+            raise NotImplementedError("rule is not implemented")
+        data = config["data"]
+        for klass in self.visits:
+            for instance in data.instances_by_klass(klass):
+                self.visit(instance, config)
+        return self.finish(config)
+
+    def visit(self, instance: dict, config: dict) -> None:
+        """Check one instance of a class in ``visits``, recording any
+        failures. Instances of a class arrive in document order; the order
+        in which the classes are walked is not defined."""
         raise NotImplementedError("rule is not implemented")
 
+    def finish(self, config: dict) -> bool:
+        """Called once every instance has been visited; returns the result."""
+        return self._result()
+
     def errors(self) -> Errors:
         return self._errors
 
     def _add_failure(self, message: str, klass: str, attribute: str, path: str):
-        location = ValidationLocation(
-            self._rule, self._rule_text, klass, attribute, path
-        )
-        self._errors.add(message, location, self._rule, self._level)
+        self._errors.add_finding(message, klass, attribute, path)
 
     def _result(self) -> bool:
         return self._errors.count() == 0
@@ -69,10 +257,10 @@ class RuleTemplate:
         Resolves the codelist via ``ct.klass_and_attribute`` (a None return
         → :class:`CTException`, which is the "rule registered against an
         unmapped attribute" config flaw), then delegates the per-value
-        match to :meth:`Library.find_in_terms` — the single matching
-        primitive that all CT-checking rules use. (``find_in_codelist``
-        uses the same primitive after resolving a codelist_id.) Both
-        entry points share matching semantics so there's no drift.
+        match to :meth:`TermIndex.find` — the single matching primitive
+        that all CT-checking rules use. (``find_in_codelist`` uses the
+        same primitive after resolving a codelist_id.) Both entry points
+        share matching semantics so there's no drift.
 
         Behaviour on empty terms: the resolved codelist with no terms is
         a config flaw, same shape as "codelist not loaded". Raise
@@ -93,7 +281,10 @@ class RuleTemplate:
             )
         # Use the shared matching primitive directly with the resolved
         # terms — no need to round-trip through find_in_codelist (which
-        # would re-resolve the codelist_id we already have).
+        # would re-resolve the codelist_id we already have). Indexed here,
+        # once per run, rather than through ct, so that existing rule unit
+        # tests can stub `ct` with a plain MagicMock.
+        index = TermIndex(terms)
         for instance in data.instances_by_klass(klass):
             if attribute not in instance:
                 self._add_failure(
@@ -124,20 +315,13 @@ class RuleTemplate:
                     target = item["standardCode"]
                 code = target.get("code")
                 decode = target.get("decode")
-                # Call the matching primitive via the Library class
-                # (it's a @staticmethod, so no instance access needed).
-                # Going through the class rather than ct lets existing
-                # rule unit tests stub `ct` with a plain MagicMock —
-                # they don't need to also stub find_in_terms.
                 code_term, _ = (
-                    CTLibrary.find_in_terms(terms, code, by="concept_id")
+                    index.find(code, by="concept_id")
                     if code is not None
                     else (None, None)
                 )
                 decode_term, _ = (
-                    CTLibrary.find_in_terms(terms, decode, by="any")
-                    if decode is not None
-                    else (None, None)
+                    index.find(decode, by="any") if decode is not None else (None, None)
                 )
                 if code_term is None and decode_term is not None:
                     self._add_failure(
@@ -164,7 +348,7 @@ class RuleTemplate:
                     # Pair mismatch — the code resolves to term A and the
                     # decode resolves to term B. The original index-based
                     # comparison is preserved as a conceptId comparison
-                    # because find_in_terms returns the full term dict.
+                    # because find returns the full term dict.
                     self._add_failure(
                         f"Invalid code and decode pair '{code}' and '{decode}', the code and decode do not match",
                         klass,
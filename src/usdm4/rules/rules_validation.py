@@ -1,4 +1,10 @@
+from typing import Iterable, Iterator
+from usdm4.api.wrapper import Wrapper
+from usdm4.data_store.data_store import DataStore
 from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.batch_validation import BatchValidation
+from usdm4.rules.results import RuleOutcome, RulesValidationResults
+from usdm4.rules.results_cache import ResultsCache
 from usdm4.base.singleton import Singleton
 
 
@@ -6,5 +12,111 @@ class RulesValidation4(metaclass=Singleton):
     def __init__(self, root_path: str):
         self.rules_validation = RulesValidationEngine(root_path, "usdm4.rules.library")
 
-    def validate(self, filename: str):
-        return self.rules_validation.validate_rules(filename)
+    def validate(
+        self,
+        filename: str,
+        *,
+        snapshot_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: str = RulesValidationEngine.THREAD,
+        profile_rule: str | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        results_cache: ResultsCache | None = None,
+        bypass_cache: bool = False,
+        max_failures: int | None = None,
+        rule_timeout: float | None = None,
+    ):
+        return self.rules_validation.validate_rules(
+            filename,
+            snapshot_dir=snapshot_dir,
+            max_workers=max_workers,
+            executor=executor,
+            profile_rule=profile_rule,
+            include=include,
+            exclude=exclude,
+            results_cache=results_cache,
+            bypass_cache=bypass_cache,
+            max_failures=max_failures,
+            rule_timeout=rule_timeout,
+        )
+
+    def iter_validate(
+        self,
+        filename: str,
+        *,
+        snapshot_dir: str | None = None,
+        max_workers: int | None = None,
+        executor: str = RulesValidationEngine.THREAD,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        rule_timeout: float | None = None,
+    ) -> Iterator[RuleOutcome | RulesValidationResults]:
+        return self.rules_validation.iter_validate(
+            filename,
+            snapshot_dir=snapshot_dir,
+            max_workers=max_workers,
+            executor=executor,
+            include=include,
+            exclude=exclude,
+            rule_timeout=rule_timeout,
+        )
+
+    def validate_data(
+        self,
+        data: dict | Wrapper | DataStore,
+        *,
+        max_workers: int | None = None,
+        executor: str = RulesValidationEngine.THREAD,
+        profile_rule: str | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_failures: int | None = None,
+        rule_timeout: float | None = None,
+    ):
+        return self.rules_validation.validate_data(
+            data,
+            max_workers=max_workers,
+            executor=executor,
+            profile_rule=profile_rule,
+            include=include,
+            exclude=exclude,
+            max_failures=max_failures,
+            rule_timeout=rule_timeout,
+        )
+
+    def validate_incremental(
+        self,
+        data: dict | Wrapper | DataStore,
+        previous_data: DataStore,
+        previous: RulesValidationResults,
+        *,
+        max_workers: int | None = None,
+        executor: str = RulesValidationEngine.THREAD,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        rule_timeout: float | None = None,
+    ) -> RulesValidationResults:
+        return self.rules_validation.validate_incremental(
+            data,
+            previous_data,
+            previous,
+            max_workers=max_workers,
+            executor=executor,
+            include=include,
+            exclude=exclude,
+            rule_timeout=rule_timeout,
+        )
+
+    def validate_many(
+        self,
+        filenames: Iterable[str],
+        workers: int | None = None,
+        snapshot_dir: str | None = None,
+    ) -> Iterator[tuple[str, RulesValidationResults]]:
+        return BatchValidation(self.rules_validation, workers, snapshot_dir).validate(
+            filenames
+        )
+
+    def reload_ct(self) -> None:
+        self.rules_validation.reload_ct()
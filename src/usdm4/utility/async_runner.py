@@ -0,0 +1,58 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class AsyncRunner:
+    """Runs blocking calls for coroutines on a pool of at most
+    ``max_workers`` threads (None for the ``ThreadPoolExecutor`` default),
+    started on first use, so the event loop is never blocked.
+
+    Calls beyond the pool size wait their turn. A coroutine cancelled
+    while its call is still waiting drops the call; a call already
+    running cannot be interrupted and finishes in the background, its
+    result discarded. :meth:`shutdown` cancels the waiting calls, waits
+    for the running ones and refuses any further call.
+    """
+
+    THREAD_NAME_PREFIX = "usdm4-async"
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor(), functools.partial(function, *args, **kwargs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._closed = True
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def aclose(self) -> None:
+        # Waiting for the running calls must not block the event loop
+        await asyncio.to_thread(self.shutdown)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncRunner has been shut down")
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.THREAD_NAME_PREFIX,
+                )
+            return self._pool
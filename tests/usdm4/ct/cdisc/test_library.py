@@ -17,6 +17,7 @@ from src.usdm4.ct.cdisc.library import (
     ConfigurationError,
     Library,
     MissingCodelistError,
+    TermIndex,
 )
 
 
@@ -91,6 +92,8 @@ def test_load_cache_hit_uses_cache(mock_api_cls, mock_cache_cls):
     assert "C1" in lib._by_code_list
     assert "T1" in lib._by_term
     lib._cache.read.assert_called_once()
+    # Terms are indexed at load time
+    assert lib._term_indexes["C1"].current(lib._by_code_list["C1"]["terms"])
 
 
 @patch("src.usdm4.ct.cdisc.library.LibraryCache")
@@ -722,6 +725,89 @@ def test_find_in_codelist_handles_none_value(loaded_library):
     assert loaded_library.find_in_codelist("", "C1", by="any") == (None, None)
 
 
+# ---------------------------------------------------------------------------
+# TermIndex / term_index — the precomputed lookups behind the predicates
+# ---------------------------------------------------------------------------
+
+
+def _overlapping_terms():
+    return [
+        {"conceptId": "T1", "preferredTerm": "Alpha", "submissionValue": "BETA"},
+        {"conceptId": "T2", "preferredTerm": "Beta", "submissionValue": "ALPHA"},
+        {"conceptId": "T3", "preferredTerm": "T1", "submissionValue": "T3"},
+        {"conceptId": "T4", "preferredTerm": "Alpha", "submissionValue": "OTHER"},
+    ]
+
+
+def test_term_index_any_returns_first_term_matching_any_field():
+    index = TermIndex(_overlapping_terms())
+    # T1's submission value "BETA" precedes T2's preferred term "Beta"
+    assert index.find("beta")[0]["conceptId"] == "T1"
+    assert index.find("ALPHA")[0]["conceptId"] == "T1"
+    assert index.find("T1")[0]["conceptId"] == "T1"
+    assert index.find("alpha", by="submission_value")[0]["conceptId"] == "T2"
+    assert index.find("T1", by="preferred_term")[0]["conceptId"] == "T3"
+    assert index.find("t1", by="concept_id") == (None, None)
+    assert index.find({}, by="concept_id") == (None, None)
+
+
+def test_term_index_item_prefers_concept_id_then_preferred_term():
+    index = TermIndex(_overlapping_terms())
+    # Matches T3's preferred term, but T1's conceptId wins
+    assert index.item("t1")["conceptId"] == "T1"
+    assert index.item("beta")["conceptId"] == "T2"
+    assert index.item("other")["conceptId"] == "T4"
+    assert index.item("nothing") is None
+    assert index.first("preferredTerm", "ALPHA")["conceptId"] == "T1"
+
+
+def test_term_index_matches_linear_scan():
+    terms = _overlapping_terms() + [{"conceptId": "T5", "preferredTerm": None}]
+    for value in [None, "", "T1", "t3", "alpha", "Beta", "other", "missing"]:
+        for by in ["any", "concept_id", "preferred_term", "submission_value"]:
+            needle = (value or "").casefold()
+            expected = next(
+                (
+                    term
+                    for term in terms
+                    if (by in ("concept_id", "any") and term["conceptId"] == value)
+                    or (
+                        by in ("preferred_term", "any")
+                        and (term.get("preferredTerm") or "").casefold() == needle
+                    )
+                    or (
+                        by in ("submission_value", "any")
+                        and (term.get("submissionValue") or "").casefold() == needle
+                    )
+                ),
+                None,
+            )
+            assert Library.find_in_terms(terms, value, by)[0] is expected
+
+
+def test_term_index_is_kept_and_rebuilt_when_terms_grow(loaded_library):
+    code_list = loaded_library._by_code_list["C1"]
+    index = loaded_library._term_index(code_list)
+    assert loaded_library._term_index(code_list) is index
+    assert loaded_library.find_in_codelist("T9", "C1") == (None, None)
+    code_list["terms"].append(
+        {"conceptId": "T9", "preferredTerm": "", "submissionValue": ""}
+    )
+    assert loaded_library.find_in_codelist("T9", "C1")[0]["conceptId"] == "T9"
+    assert loaded_library._term_index(code_list) is not index
+    assert loaded_library._term_indexes == {"C1": loaded_library._term_index(code_list)}
+
+
+def test_term_indexes_belong_to_each_library(loaded_library):
+    other = Library(ROOT)
+    other._by_code_list["C1"] = _sample_code_list("C1")
+    other._by_code_list["C1"]["terms"][0]["submissionValue"] = "OTHER"
+    assert loaded_library.find_in_codelist("TERM_A", "C1")[0]["conceptId"] == "T1"
+    assert other.find_in_codelist("TERM_A", "C1") == (None, None)
+    assert other.find_in_codelist("OTHER", "C1")[0]["conceptId"] == "T1"
+    assert loaded_library._term_indexes["C1"] is not other._term_indexes["C1"]
+
+
 # ---------------------------------------------------------------------------
 # _check_in_and_add
 # ---------------------------------------------------------------------------
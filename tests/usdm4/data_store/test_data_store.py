@@ -4,10 +4,17 @@ Exercises the load/decompose happy path and every error branch with
 small, hand-built JSON documents written to a tmp_path.
 """
 
+import gc
+import importlib.util
 import json
+import sys
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from src.usdm4.api.wrapper import Wrapper
+from src.usdm4.data_store import data_store as data_store_module
 from src.usdm4.data_store.data_store import (
     DataStore,
     DataStoreErrorLocation,
@@ -86,6 +93,8 @@ def test_decompose_builds_indexes(tmp_path):
     versions = ds.instances_by_klass("StudyVersion")
     assert len(versions) == 2
     assert ds.instances_by_klass("not-a-klass") == []
+    assert ds.has_klass("StudyVersion") is True
+    assert ds.has_klass("not-a-klass") is False
 
     # path_by_id
     assert ds.path_by_id("V1") is not None
@@ -207,3 +216,574 @@ def test_decompose_records_duplicate_id(tmp_path):
     ds.decompose()
     # Should report duplicate id; store still constructed
     assert ds.errors.count() >= 1
+
+
+# ---------------------------------------------------------------------------
+# In-memory construction
+# ---------------------------------------------------------------------------
+
+
+def test_from_dict_decomposes_without_file():
+    payload = _valid_study_payload()
+    ds = DataStore.from_dict(payload)
+    ds.decompose()
+    assert ds.filename is None
+    assert ds.data is payload
+    assert ds.instance_by_id("V2") is payload["study"]["versions"][1]
+    assert ds.path_by_id("SP1") == "$.Study.Sponsor"
+
+
+def test_from_dict_null_study_id_leaves_source_untouched():
+    payload = _valid_study_payload()
+    payload["study"]["id"] = None
+    ds = DataStore.from_dict(payload)
+    ds.decompose()
+    assert payload["study"]["id"] is None
+    study = ds.instance_by_id("$root.study.id")
+    assert study is ds.data["study"]
+    assert study is not payload["study"]
+    # Below the study the source objects are shared, not copied
+    assert ds.instance_by_id("V2") is payload["study"]["versions"][1]
+    assert ds.parent_by_id("V2") is study
+
+
+def test_from_dict_missing_study_raises():
+    ds = DataStore.from_dict({"notstudy": {}})
+    with pytest.raises(DecompositionError):
+        ds.decompose()
+
+
+def test_from_wrapper_matches_file():
+    path = "tests/usdm4/test_files/integration/sample_usdm_7.json"
+    with open(path) as f:
+        wrapper = Wrapper.model_validate(json.load(f))
+    ds = DataStore.from_wrapper(wrapper)
+    ds.decompose()
+    file_ds = DataStore(path)
+    file_ds.decompose()
+    assert dict(ds.instances()).keys() == dict(file_ds.instances()).keys()
+    for id, _ in file_ds.instances():
+        assert ds.path_by_id(id) == file_ds.path_by_id(id)
+
+
+# ---------------------------------------------------------------------------
+# Reverse references
+# ---------------------------------------------------------------------------
+
+
+def _referencing_payload():
+    payload = _valid_study_payload()
+    payload["study"]["versions"][0]["criteria"] = [
+        {
+            "id": "EC1",
+            "instanceType": "EligibilityCriterion",
+            "criterionItemId": "ITEM1",
+            "nextId": "EC2",
+            "previousId": None,
+        },
+        {
+            "id": "EC2",
+            "instanceType": "EligibilityCriterion",
+            "criterionItemId": "ITEM1",
+            "previousId": "EC1",
+            "childIds": ["ITEM1", "", 3],
+        },
+    ]
+    return payload
+
+
+def test_referrers(tmp_path):
+    path = _write(tmp_path, _referencing_payload())
+    ds = DataStore(path)
+    ds.decompose()
+    assert [x["id"] for x in ds.referrers("ITEM1", "criterionItemId")] == [
+        "EC1",
+        "EC2",
+    ]
+    assert [x["id"] for x in ds.referrers("ITEM1", "childIds")] == ["EC2"]
+    # Each referring instance reported once across attributes
+    assert [x["id"] for x in ds.referrers("ITEM1")] == ["EC1", "EC2"]
+    assert [x["id"] for x in ds.referrers("EC1")] == ["EC2"]
+    assert ds.referrers("ITEM1", "nextId") == []
+    assert ds.referrers("missing") == []
+
+
+# ---------------------------------------------------------------------------
+# Ancestor index
+# ---------------------------------------------------------------------------
+
+
+def _scoped_payload():
+    payload = _valid_study_payload()
+    payload["study"]["versions"][0]["studyDesigns"] = [
+        {
+            "id": "SD1",
+            "instanceType": "InterventionalStudyDesign",
+            "scheduleTimelines": [
+                {
+                    "id": "TL1",
+                    "instanceType": "ScheduleTimeline",
+                    "instances": [
+                        {"id": "SAI1", "instanceType": "ScheduledActivityInstance"}
+                    ],
+                }
+            ],
+        }
+    ]
+    return payload
+
+
+def test_ancestor_scope_klasses(tmp_path):
+    path = _write(tmp_path, _scoped_payload())
+    ds = DataStore(path)
+    ds.decompose()
+    assert ds.ancestor("SAI1", "ScheduleTimeline")["id"] == "TL1"
+    assert ds.ancestor("SAI1", "InterventionalStudyDesign")["id"] == "SD1"
+    assert ds.ancestor("SAI1", "StudyVersion")["id"] == "V1"
+    # An instance is its own nearest scope
+    assert ds.ancestor("TL1", "ScheduleTimeline")["id"] == "TL1"
+    # Nearest of several scope classes wins
+    assert ds.parent_by_klass("SAI1", ["StudyVersion", "ScheduleTimeline"])["id"] == (
+        "TL1"
+    )
+    assert ds.ancestor("V2", "InterventionalStudyDesign") is None
+    assert (
+        ds.parent_by_klass(
+            "V2", ["InterventionalStudyDesign", "ObservationalStudyDesign"]
+        )
+        is None
+    )
+    assert ds.ancestor("missing", "StudyVersion") is None
+
+
+def test_ancestor_other_klass_walks_parents(tmp_path):
+    path = _write(tmp_path, _scoped_payload())
+    ds = DataStore(path)
+    ds.decompose()
+    assert ds.ancestor("SAI1", "Study")["id"] == "S1"
+    assert ds.ancestor("SAI1", "Sponsor") is None
+
+
+# ---------------------------------------------------------------------------
+# Parents and instances
+# ---------------------------------------------------------------------------
+
+
+def test_parent_by_id():
+    path = "tests/usdm4/test_files/convert/example_2.json"
+    ds = DataStore(path)
+    ds.decompose()
+    assert ds.parent_by_id("StudyVersion_1") is ds.data["study"]
+    assert ds.parent_by_id("$root") is None
+    assert ds.parent_by_id("XXX") is None
+
+
+def test_instances():
+    ds = DataStore.from_dict(
+        {"study": {"id": "S1", "instanceType": "Study", "versions": []}}
+    )
+    ds.decompose()
+    assert ds.instances() == [("$root", ds.data), ("S1", ds.data["study"])]
+
+
+def test_deeply_nested_document():
+    # Traversal uses an explicit stack, so nesting depth is not bounded by
+    # the recursion limit
+    node = {"id": "X_0", "instanceType": "X"}
+    study = {"id": "S1", "instanceType": "Study", "child": node}
+    for index in range(1, 5000):
+        child = {"id": f"X_{index}", "instanceType": "X"}
+        node["child"] = child
+        node = child
+    ds = DataStore.from_dict({"study": study})
+    ds.decompose()
+    assert ds.parent_by_id("X_4999")["id"] == "X_4998"
+    assert ds.parent_by_klass("X_4999", "Study") is study
+
+
+# ---------------------------------------------------------------------------
+# Duplicate ids
+# ---------------------------------------------------------------------------
+
+
+def _duplicates_payload():
+    return {
+        "study": {
+            "id": "S1",
+            "instanceType": "Study",
+            "versions": [
+                {
+                    "id": "V1",
+                    "instanceType": "StudyVersion",
+                    "titles": [{"id": "T1", "instanceType": "StudyTitle"}],
+                },
+                {
+                    "id": "V1",
+                    "instanceType": "StudyVersion",
+                    "titles": [{"id": "T1", "instanceType": "StudyTitle"}],
+                    "documentVersion": {"id": "V1", "instanceType": "X"},
+                },
+            ],
+        }
+    }
+
+
+def test_duplicates(tmp_path):
+    ds = DataStore(_write(tmp_path, _duplicates_payload()))
+    ds.decompose()
+    duplicates = ds.duplicates()
+    assert sorted(duplicates) == ["T1", "V1"]
+    assert sorted(path for _, path in duplicates["V1"]) == [
+        "$.study.versions[0]",
+        "$.study.versions[1]",
+        "$.study.versions[1].documentVersion",
+    ]
+    assert [path for _, path in duplicates["T1"]] == [
+        "$.study.versions[0].titles[0]",
+        "$.study.versions[1].titles[0]",
+    ]
+    versions = ds.data["study"]["versions"]
+    assert duplicates["T1"][0][0] is versions[0]["titles"][0]
+    assert ds.errors.count() == 3
+
+
+def test_duplicates_none(tmp_path):
+    ds = DataStore(_write(tmp_path, _valid_study_payload()))
+    ds.decompose()
+    assert ds.duplicates() == {}
+
+
+# ---------------------------------------------------------------------------
+# Changed instances
+# ---------------------------------------------------------------------------
+
+
+def _store(payload: dict) -> DataStore:
+    ds = DataStore.from_dict(payload)
+    ds.decompose()
+    return ds
+
+
+def test_changed_ids_none_for_equal_documents():
+    previous = _store(_valid_study_payload())
+    assert _store(_valid_study_payload()).changed_ids(previous) == set()
+
+
+def test_changed_ids_edited_instance_and_ancestors():
+    previous = _store(_valid_study_payload())
+    payload = _valid_study_payload()
+    payload["study"]["versions"][1]["versionIdentifier"] = "2"
+    assert _store(payload).changed_ids(previous) == {"$root", "S1", "V2"}
+
+
+def test_changed_ids_added_and_removed_instances():
+    previous = _store(_valid_study_payload())
+    payload = _valid_study_payload()
+    payload["study"]["versions"][1] = {"id": "V3", "instanceType": "StudyVersion"}
+    assert _store(payload).changed_ids(previous) == {"$root", "S1", "V2", "V3"}
+    assert previous.changed_ids(_store(payload)) == {"$root", "S1", "V2", "V3"}
+
+
+def test_changed_ids_includes_duplicated_ids():
+    previous = _store(_duplicates_payload())
+    assert _store(_duplicates_payload()).changed_ids(previous) == {"V1", "T1"}
+
+
+# ---------------------------------------------------------------------------
+# Attribute queries
+# ---------------------------------------------------------------------------
+
+
+def _timings_payload():
+    fixed = {"id": "C1", "instanceType": "Code", "code": "C201358"}
+    after = {"id": "C2", "instanceType": "Code", "code": "C201356"}
+    return {
+        "study": {
+            "id": "S1",
+            "instanceType": "Study",
+            "timings": [
+                {"id": "T1", "instanceType": "Timing", "name": "A", "type": fixed},
+                {"id": "T2", "instanceType": "Timing", "name": "B", "type": after},
+                {"id": "T3", "instanceType": "Timing", "name": "A", "type": None},
+                {"id": "T4", "instanceType": "Timing", "name": ["A"]},
+                {
+                    "id": "T5",
+                    "instanceType": "Timing",
+                    "name": {"id": "X1", "instanceType": "X"},
+                },
+            ],
+        }
+    }
+
+
+def test_where_dotted_path(tmp_path):
+    ds = DataStore(_write(tmp_path, _timings_payload()))
+    ds.decompose()
+    assert [t["id"] for t in ds.where("Timing", "type.code", "C201358")] == ["T1"]
+    # Absent or null anywhere along the path matches None
+    assert [t["id"] for t in ds.where("Timing", "type.code", None)] == [
+        "T3",
+        "T4",
+        "T5",
+    ]
+    assert ds.where("Timing", "type.code", "C99999") == []
+
+
+def test_where_plain_attribute_and_unknown_klass(tmp_path):
+    ds = DataStore(_write(tmp_path, _timings_payload()))
+    ds.decompose()
+    # List and object values are not indexed
+    assert [t["id"] for t in ds.where("Timing", "name", "A")] == ["T1", "T3"]
+    assert ds.where("Activity", "name", "A") == []
+
+
+def test_where_index_built_once(tmp_path):
+    ds = DataStore(_write(tmp_path, _timings_payload()))
+    ds.decompose()
+    result = ds.where("Timing", "type.code", "C201358")
+    index = ds._indexes[("Timing", "type.code")]
+    result.clear()
+    assert ds.where("Timing", "type.code", "C201358")[0]["id"] == "T1"
+    assert ds._indexes[("Timing", "type.code")] is index
+
+
+# ---------------------------------------------------------------------------
+# Frozen stores
+# ---------------------------------------------------------------------------
+
+
+def test_freeze(tmp_path):
+    ds = DataStore(_write(tmp_path, _timings_payload()))
+    assert ds.frozen is False
+    with pytest.raises(RuntimeError, match="must be decomposed"):
+        ds.freeze()
+    assert ds.frozen is False
+    ds.decompose()
+    assert ds.freeze() is ds
+    assert ds.frozen is True
+    with pytest.raises(RuntimeError):
+        ds.decompose()
+    # Lookups hand out copies, the indexes themselves cannot be changed
+    ds.instances_by_klass("Timing").clear()
+    ds.where("Timing", "type.code", "C201358").clear()
+    assert len(ds.instances_by_klass("Timing")) == 5
+    assert len(ds.where("Timing", "type.code", "C201358")) == 1
+
+
+def test_frozen_store_shared_between_threads():
+    path = "tests/usdm4/test_files/expander/example_study.json"
+    ds = DataStore(path)
+    ds.decompose()
+    ds.freeze()
+    expected = DataStore(path)
+    expected.decompose()
+
+    def read(_):
+        return (
+            [ds.path_by_id(id) for id, _ in ds.instances()],
+            [t["id"] for t in ds.where("Timing", "type.code", "C201358")],
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(read, range(16)))
+    assert len(ds._indexes) == 1
+    for result in results:
+        assert result == (
+            [expected.path_by_id(id) for id, _ in expected.instances()],
+            [t["id"] for t in expected.where("Timing", "type.code", "C201358")],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+
+def _state(ds):
+    return (
+        [
+            (id, instance, ds.path_by_id(id), ds.parent_by_id(id))
+            for id, instance in ds.instances()
+        ],
+        {klass: ds.instances_by_klass(klass) for klass in ds._klasses},
+        ds._referrers,
+        [(str(e.location), e.message) for e in ds.errors._items],
+    )
+
+
+def test_snapshot_reload_matches_decompose(tmp_path):
+    path = "tests/usdm4/test_files/expander/example_study.json"
+    plain = DataStore(path)
+    plain.decompose()
+    cold = DataStore(path, snapshot_dir=str(tmp_path))
+    cold.decompose()
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    warm = DataStore(path, snapshot_dir=str(tmp_path))
+    warm.decompose()
+    assert warm.data == plain.data
+    assert _state(warm) == _state(plain)
+    for id, _ in plain.instances():
+        assert warm.ancestor(id, "StudyVersion") == plain.ancestor(id, "StudyVersion")
+
+
+def test_snapshot_reload_keeps_duplicate_ids(tmp_path):
+    payload = {
+        "study": {
+            "id": "S1",
+            "instanceType": "Study",
+            "versions": [
+                {
+                    "id": "V1",
+                    "instanceType": "StudyVersion",
+                    "studyDesigns": [{"id": "D1", "instanceType": "StudyDesign"}],
+                },
+                {
+                    "id": "V1",
+                    "instanceType": "StudyVersion",
+                    "studyDesigns": [{"id": "D2", "instanceType": "StudyDesign"}],
+                },
+            ],
+        }
+    }
+    path = _write(tmp_path, payload)
+    snapshots = str(tmp_path / "snapshots")
+    DataStore(path, snapshot_dir=snapshots).decompose()
+    warm = DataStore(path, snapshot_dir=snapshots)
+    warm.decompose()
+    assert warm.errors.count() == 1
+    # D1 hangs off the shadowed first V1
+    assert warm.path_by_id("D1") == "$.Study.StudyVersion[0].StudyDesign[0]"
+    assert warm.parent_by_id("D1") is warm.data["study"]["versions"][0]
+    assert warm.ancestor("D2", "StudyVersion") is warm.data["study"]["versions"][1]
+    assert [path for _, path in warm.duplicates()["V1"]] == [
+        "$.study.versions[0]",
+        "$.study.versions[1]",
+    ]
+
+
+def test_snapshot_missed_when_file_changes(tmp_path):
+    payload = {"study": {"id": "S1", "instanceType": "Study", "name": "A"}}
+    path = _write(tmp_path, payload)
+    snapshots = str(tmp_path / "snapshots")
+    DataStore(path, snapshot_dir=snapshots).decompose()
+    payload["study"]["name"] = "B"
+    _write(tmp_path, payload)
+    ds = DataStore(path, snapshot_dir=snapshots)
+    ds.decompose()
+    assert ds.instance_by_id("S1")["name"] == "B"
+    assert len(list((tmp_path / "snapshots").glob("*.pickle"))) == 2
+
+
+def test_snapshot_decomposition_error_not_saved(tmp_path):
+    path = _write(tmp_path, {"notstudy": {}})
+    snapshots = tmp_path / "snapshots"
+    with pytest.raises(DecompositionError):
+        DataStore(path, snapshot_dir=str(snapshots)).decompose()
+    assert not snapshots.exists()
+
+
+def test_snapshot_reload_restores_gc_state(tmp_path):
+    path = "tests/usdm4/test_files/convert/example_2.json"
+    DataStore(path, snapshot_dir=str(tmp_path)).decompose()
+    gc.disable()
+    try:
+        DataStore(path, snapshot_dir=str(tmp_path)).decompose()
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+    DataStore(path, snapshot_dir=str(tmp_path)).decompose()
+    assert gc.isenabled()
+
+
+# ---------------------------------------------------------------------------
+# Stream mode
+# ---------------------------------------------------------------------------
+
+STREAM_FILES = [
+    "tests/usdm4/test_files/convert/example_2.json",
+    "tests/usdm4/test_files/expander/example_study.json",
+    "tests/usdm4/test_files/integration/sample_usdm_7.json",
+]
+
+
+@pytest.mark.parametrize("path", STREAM_FILES)
+def test_stream_matches_tree(path):
+    tree = DataStore(path)
+    tree.decompose()
+    stream = DataStore(path, mode=DataStore.STREAM)
+    stream.decompose()
+    assert stream.data == tree.data
+    assert _state(stream) == _state(tree)
+
+
+def test_stream_values(tmp_path):
+    path = tmp_path / "values.json"
+    path.write_text(
+        '{"a": [1, 2.5, -3e2, true, false, null, [], {}, [[1], {"b": "c"}]],'
+        ' "s": "x", "s": "' + "y" * 100 + '"}'
+    )
+    ds = DataStore(str(path), mode=DataStore.STREAM)
+    assert ds._load_data() == json.loads(path.read_text())
+    path.write_text("[1, 2]")
+    assert ds._load_data() == [1, 2]
+    path.write_text("5")
+    assert ds._load_data() == 5
+
+
+def _large_study_payload(count):
+    code = {
+        "instanceType": "Code",
+        "code": "C25301",
+        "codeSystem": "http://www.cdisc.org",
+        "codeSystemVersion": "2024-09-27",
+        "decode": "Day",
+    }
+    payload = _valid_study_payload()
+    payload["study"]["versions"] = [
+        {
+            "id": f"SV{index}",
+            "instanceType": "StudyVersion",
+            "versionIdentifier": "1",
+            "businessTherapeuticAreas": [
+                {**code, "id": f"Code{index}_{area}"} for area in range(10)
+            ],
+        }
+        for index in range(count)
+    ]
+    return payload
+
+
+def _decompose_peak(path, mode):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        DataStore(path, mode=mode).decompose()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_peak_memory_below_tree(tmp_path):
+    path = _write(tmp_path, _large_study_payload(300))
+    tree = _decompose_peak(path, DataStore.TREE)
+    stream = _decompose_peak(path, DataStore.STREAM)
+    assert stream < tree * 0.9
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError, match="Unknown decomposition mode 'lazy'"):
+        DataStore("study.json", mode="lazy")
+
+
+def test_stream_without_ijson_raises(monkeypatch):
+    # A copy of the module imported as if ijson were not installed
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    spec = importlib.util.spec_from_file_location(
+        "data_store_without_ijson", data_store_module.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.ijson is None
+    with pytest.raises(ImportError, match="ijson"):
+        module.DataStore("study.json", mode=DataStore.STREAM)
+    assert module.DataStore("study.json").mode == DataStore.TREE
@@ -0,0 +1,70 @@
+"""Direct tests for SnapshotCache (pickle-backed DataStore snapshots).
+
+Uses ``tmp_path`` so no real user directories are touched.
+"""
+
+from src.usdm4.data_store.snapshot_cache import SnapshotCache
+
+
+def _file(tmp_path, text="{}"):
+    p = tmp_path / "study.json"
+    p.write_text(text)
+    return str(p)
+
+
+def test_key_depends_on_content_and_version(tmp_path, monkeypatch):
+    cache = SnapshotCache(str(tmp_path / "cache"))
+    path = _file(tmp_path)
+    key = cache.key(path)
+    assert key == cache.key(path)
+    monkeypatch.setattr(SnapshotCache, "VERSION", SnapshotCache.VERSION + 1)
+    assert key != cache.key(path)
+    monkeypatch.undo()
+    _file(tmp_path, '{"a": 1}')
+    assert key != cache.key(path)
+
+
+def test_save_then_read_roundtrip(tmp_path):
+    cache = SnapshotCache(str(tmp_path / "cache"))
+    state = {"a": 1, "b": [1, 2, 3]}
+    assert cache.exists("k") is False
+    cache.save("k", state)
+    assert cache.exists("k") is True
+    assert cache.read("k") == state
+
+
+def test_read_missing_or_corrupt_is_a_miss(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    assert cache.read("missing") is None
+    (tmp_path / f"bad{SnapshotCache.EXTENSION}").write_bytes(b"not a pickle")
+    assert cache.read("bad") is None
+
+
+def test_save_failure_is_skipped(tmp_path, monkeypatch):
+    cache = SnapshotCache(str(tmp_path))
+
+    def bomb(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr("src.usdm4.file_cache.pickle_cache.pickle.dump", bomb)
+    cache.save("k", {"x": 1})
+    assert cache.exists("k") is False
+    # No partial temporary file left behind
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_to_unusable_directory_is_skipped(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = SnapshotCache(str(blocker / "cache"))
+    cache.save("k", {"x": 1})
+    assert cache.exists("k") is False
+
+
+def test_delete(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.save("k", {"x": 1})
+    cache.delete("k")
+    assert cache.exists("k") is False
+    # Deleting a missing snapshot is harmless
+    cache.delete("k")
@@ -0,0 +1,38 @@
+"""Direct tests for PickleCache, the base of the snapshot and results caches.
+
+Uses ``tmp_path`` so no real user directories are touched.
+"""
+
+from src.usdm4.file_cache.pickle_cache import PickleCache
+
+
+def _file(tmp_path, text="{}"):
+    p = tmp_path / "study.json"
+    p.write_text(text)
+    return str(p)
+
+
+class VersionedCache(PickleCache):
+    VERSION = 7
+
+
+def test_key_depends_on_content_parts_and_version(tmp_path):
+    cache = PickleCache(str(tmp_path / "cache"))
+    path = _file(tmp_path)
+    key = cache.key(path)
+    assert key == cache.key(path)
+    assert key != cache.key(path, "part")
+    assert cache.key(path, "a", "b") != cache.key(path, "ab")
+    assert key != VersionedCache(cache.filepath).key(path)
+    _file(tmp_path, '{"a": 1}')
+    assert key != cache.key(path)
+
+
+def test_save_then_read_roundtrip(tmp_path):
+    cache = PickleCache(str(tmp_path / "cache"))
+    assert cache.exists("k") is False
+    assert cache.read("k") is None
+    cache.save("k", [1, {"a": 2}])
+    assert cache.exists("k") is True
+    assert cache.read("k") == [1, {"a": 2}]
+    assert (tmp_path / "cache" / f"k{PickleCache.EXTENSION}").is_file()
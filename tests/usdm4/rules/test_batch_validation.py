@@ -0,0 +1,122 @@
+"""Tests for BatchValidation.
+
+The workers are forked from an engine with stub rules and terminology, so
+no rule files or controlled terminology are loaded.
+"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.usdm4.rules import batch_validation
+from src.usdm4.rules.batch_validation import BatchValidation
+from src.usdm4.rules.engine import RulesValidationEngine
+from src.usdm4.rules.results import RuleStatus
+from src.usdm4.rules.rule_template import RuleTemplate
+
+
+class _FilenameRule(RuleTemplate):
+    """Fails with the file name; kills its worker for a 'crash' file."""
+
+    def __init__(self):
+        super().__init__("R_FILE", RuleTemplate.ERROR, "t")
+
+    def validate(self, config):
+        filename = config["data"].filename
+        if "crash" in filename:
+            os._exit(1)
+        self._errors.error(os.path.basename(filename))
+        return False
+
+
+@pytest.fixture
+def engine():
+    with patch.object(RulesValidationEngine, "_load_rules", lambda self: None):
+        e = RulesValidationEngine(root_path="/root", package_name="usdm4.rules.library")
+    e.rules = [_FilenameRule]
+    e._ct = MagicMock()
+    return e
+
+
+def _files(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps({"study": {"id": name, "instanceType": "Study"}}))
+        paths.append(str(path))
+    return paths
+
+
+def _message(results):
+    return results.outcomes["R_FILE"].errors.to_dict()[0]["message"]
+
+
+def test_validate_many_yields_every_file(engine, tmp_path):
+    paths = _files(tmp_path, [f"s{index}" for index in range(6)])
+    got = dict(BatchValidation(engine, workers=2).validate(paths))
+    assert sorted(got) == sorted(paths)
+    for path, results in got.items():
+        assert _message(results) == os.path.basename(path)
+
+
+def test_validate_many_isolates_a_crashing_file(engine, tmp_path):
+    paths = _files(tmp_path, ["a", "b", "crash", "c", "d", "e", "f"])
+    got = list(BatchValidation(engine, workers=2).validate(paths))
+    assert sorted(path for path, _ in got) == sorted(paths)
+    for path, results in got:
+        if "crash" in path:
+            outcome = results.outcomes["Validation"]
+            assert outcome.status == RuleStatus.EXCEPTION
+            assert "terminated" in outcome.exception
+        else:
+            assert _message(results) == os.path.basename(path)
+
+
+def test_validate_many_reports_failing_file(engine, tmp_path):
+    paths = _files(tmp_path, ["a"]) + [str(tmp_path / "missing.json")]
+    got = dict(BatchValidation(engine, workers=2).validate(paths))
+    assert _message(got[paths[0]]) == "a.json"
+    outcome = got[paths[1]].outcomes["Validation"]
+    assert outcome.status == RuleStatus.EXCEPTION
+    assert "No such file" in outcome.exception
+
+
+def test_validate_many_empty():
+    assert list(BatchValidation(MagicMock()).validate([])) == []
+
+
+def test_workers_default_to_cpu_count():
+    with patch("src.usdm4.rules.batch_validation.os.cpu_count", return_value=3):
+        assert BatchValidation(MagicMock()).workers == 3
+
+
+def test_pool_uses_spawn_without_fork(engine):
+    # The module under test imports the engine without the src. prefix
+    with patch.object(
+        batch_validation.RulesValidationEngine, "_can_fork", return_value=False
+    ):
+        pool = BatchValidation(engine)._pool(1)
+    try:
+        assert pool._mp_context.get_start_method() == "spawn"
+        assert pool._initargs == (None, "/root", "usdm4.rules.library")
+    finally:
+        pool.shutdown()
+
+
+def test_start_worker_without_engine_loads_its_own():
+    with patch("src.usdm4.rules.batch_validation.RulesValidationEngine") as engine_cls:
+        batch_validation._start_worker(None, "/root", "package")
+    engine_cls.assert_called_once_with("/root", "package")
+    engine_cls.return_value._ct_library.assert_called_once()
+    assert batch_validation._engine is engine_cls.return_value
+
+
+def test_start_worker_with_engine_and_validate_file(engine, tmp_path):
+    path = _files(tmp_path, ["a"])[0]
+    batch_validation._start_worker(engine, "/root", "package")
+    assert batch_validation._engine is engine
+    assert _message(batch_validation._validate_file(path, None)) == "a.json"
+    results = batch_validation._validate_file(str(tmp_path / "missing.json"), None)
+    assert "No such file" in results.outcomes["Validation"].exception
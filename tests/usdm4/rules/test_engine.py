@@ -4,13 +4,23 @@ Uses heavy mocking to avoid loading every rule_ddf file, a real
 DataStore, or a CTLibrary with disk/API access.
 """
 
+import threading
+import time
+import tracemalloc
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
-from src.usdm4.rules.engine import RulesValidationEngine
-from src.usdm4.rules.results import RuleStatus
+from src.usdm4.rules.engine import (
+    RulesValidationEngine,
+    _RuleStore,
+    _run_shared_rule,
+    _shared,
+    _shared_lock,
+)
+from src.usdm4.rules.results import RuleStatus, RulesValidationResults
+from src.usdm4.rules.results_cache import ResultsCache
 from src.usdm4.rules.rule_template import RuleTemplate
 
 # Note: engine.py imports DecompositionError from `usdm4.data_store.data_store`
@@ -19,7 +29,12 @@ from src.usdm4.rules.rule_template import RuleTemplate
 # objects — so `except DecompositionError` in the engine does NOT catch an
 # exception raised from `src.usdm4.data_store.data_store`. Import from the
 # path the engine actually uses.
-from usdm4.data_store.data_store import DataStoreErrorLocation, DecompositionError
+from usdm4.data_store.data_store import (
+    DataStore,
+    DataStoreErrorLocation,
+    DecompositionError,
+)
+from usdm4.api.wrapper import Wrapper
 
 
 def _decomp_error(msg: str = "bad shape") -> DecompositionError:
@@ -62,12 +77,18 @@ def test_data_store_returns_store_and_none(engine):
     fake_store = MagicMock()
     with patch("src.usdm4.rules.engine.DataStore", return_value=fake_store) as ds_cls:
         ds, err = engine._data_store("file.json")
-    ds_cls.assert_called_once_with("file.json")
+    ds_cls.assert_called_once_with("file.json", snapshot_dir=None)
     fake_store.decompose.assert_called_once()
     assert ds is fake_store
     assert err is None
 
 
+def test_data_store_passes_snapshot_dir(engine):
+    with patch("src.usdm4.rules.engine.DataStore") as ds_cls:
+        engine._data_store("file.json", "snapshots")
+    ds_cls.assert_called_once_with("file.json", snapshot_dir="snapshots")
+
+
 def test_data_store_returns_none_and_exception_on_decomp_failure(engine):
     fake_store = MagicMock()
     fake_store.decompose.side_effect = _decomp_error("bad shape")
@@ -82,12 +103,12 @@ def test_data_store_returns_none_and_exception_on_decomp_failure(engine):
 # ---------------------------------------------------------------------------
 
 
-def _make_rule_class(rule_id: str, validate_behaviour):
+def _make_rule_class(rule_id: str, validate_behaviour, level: int = RuleTemplate.ERROR):
     """Produce a RuleTemplate subclass whose validate() applies `validate_behaviour`."""
 
     class _Rule(RuleTemplate):
         def __init__(self):
-            super().__init__(rule_id, RuleTemplate.ERROR, "t")
+            super().__init__(rule_id, level, "t")
 
         def validate(self, config):
             return validate_behaviour(self, config)
@@ -137,6 +158,432 @@ def test_execute_rules_records_exception_with_traceback(engine):
     assert "boom" in outcome.exception
 
 
+# ---------------------------------------------------------------------------
+# _execute_rules — parallel execution with max_workers
+# ---------------------------------------------------------------------------
+
+
+def _mixed_rules():
+    def fail(self, cfg):
+        self._errors.error(f"fail {cfg['data']}")
+        return False
+
+    def not_implemented(self, cfg):
+        raise NotImplementedError
+
+    def boom(self, cfg):
+        raise RuntimeError("boom")
+
+    return [
+        _make_rule_class(f"R_{index:02d}", behaviour)
+        for index, behaviour in enumerate(
+            [lambda self, cfg: True, fail, not_implemented, boom] * 5
+        )
+    ]
+
+
+def _summary(results):
+    return [
+        (o.rule_id, o.status, o.error_count, (o.exception or "").split("\n")[0])
+        for o in results.outcomes.values()
+    ]
+
+
+@pytest.mark.parametrize(
+    "executor", [RulesValidationEngine.THREAD, RulesValidationEngine.PROCESS]
+)
+def test_execute_rules_parallel_matches_sequential(engine, executor):
+    engine.rules = _mixed_rules()
+    config = {"data": "doc", "ct": None}
+    expected = _summary(engine._execute_rules(config))
+    results = engine._execute_rules(config, max_workers=3, executor=executor)
+    assert _summary(results) == expected
+    assert list(results.outcomes) == [f"R_{index:02d}" for index in range(20)]
+    assert "boom" in results.outcomes["R_03"].exception
+
+
+def test_execute_rules_single_worker_runs_sequentially(engine):
+    engine.rules = _mixed_rules()
+    with patch("src.usdm4.rules.engine.ThreadPoolExecutor") as pool:
+        results = engine._execute_rules({"data": "doc", "ct": None}, max_workers=1)
+    pool.assert_not_called()
+    assert results.count() == 20
+
+
+def test_execute_rules_process_falls_back_to_threads_without_fork(engine):
+    engine.rules = _mixed_rules()
+    config = {"data": "doc", "ct": None}
+    expected = _summary(engine._execute_rules(config))
+    with (
+        patch(
+            "src.usdm4.rules.engine.multiprocessing.get_all_start_methods",
+            return_value=["spawn"],
+        ),
+        patch("src.usdm4.rules.engine.ProcessPoolExecutor") as pool,
+    ):
+        results = engine._execute_rules(
+            config, max_workers=2, executor=RulesValidationEngine.PROCESS
+        )
+    pool.assert_not_called()
+    assert _summary(results) == expected
+
+
+def test_validate_rules_passes_max_workers(engine):
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+        patch.object(engine, "_execute_rules", return_value="results") as execute_rules,
+    ):
+        assert (
+            engine.validate_rules("a.json", max_workers=4, rule_timeout=2.5)
+            == "results"
+        )
+    execute_rules.assert_called_once()
+    assert execute_rules.call_args.args[1:] == (4, "thread", None, engine.rules, 2.5)
+
+
+def test_validate_data_passes_max_workers(engine):
+    with (
+        patch("src.usdm4.rules.engine.CTLibrary"),
+        patch.object(engine, "_execute_rules", return_value="results") as execute_rules,
+    ):
+        engine.validate_data(
+            MagicMock(spec=DataStore),
+            max_workers=2,
+            executor=RulesValidationEngine.PROCESS,
+        )
+    assert execute_rules.call_args.args[1:] == (
+        2,
+        "process",
+        None,
+        engine.rules,
+        None,
+    )
+
+
+def test_run_shared_rule_uses_published_rules_and_config():
+    # What a forked worker runs; exercised in-process here
+    rules = _mixed_rules()
+    _shared.update(rules=rules, config={"data": "doc", "ct": None})
+    try:
+        outcome = _run_shared_rule(1)
+    finally:
+        _shared.clear()
+    assert outcome.rule_id == "R_01"
+    assert outcome.status == RuleStatus.FAILURE
+
+
+def test_run_processes_releases_shared_before_outcomes(engine):
+    rules = _mixed_rules()
+    outcomes = engine._run_processes(rules, {"data": "doc", "ct": None}, 2)
+    first = next(outcomes)
+    # Every worker is forked by now, another process run need not wait
+    assert not _shared_lock.locked()
+    assert _shared == {}
+    pairs = [first, *outcomes]
+    # Yielded as they finish, each with its rule
+    assert all(outcome.rule_id == rule()._rule for rule, outcome in pairs)
+    assert sorted(outcome.rule_id for _, outcome in pairs) == [
+        f"R_{index:02d}" for index in range(20)
+    ]
+
+
+def test_options_are_keyword_only(engine):
+    with pytest.raises(TypeError):
+        engine.validate_rules("a.json", None)
+    with pytest.raises(TypeError):
+        engine.iter_validate("a.json", None)
+    with pytest.raises(TypeError):
+        engine.validate_data({}, 2)
+    with pytest.raises(TypeError):
+        engine.validate_incremental({}, None, None, 2)
+
+
+def test_unknown_executor_raises(engine):
+    with pytest.raises(ValueError, match="Unknown executor 'fibre'"):
+        engine.validate_rules("a.json", max_workers=2, executor="fibre")
+    with pytest.raises(ValueError, match="Unknown executor 'fibre'"):
+        engine.validate_data({}, max_workers=2, executor="fibre")
+
+
+# ---------------------------------------------------------------------------
+# _execute_rules — visiting rules
+# ---------------------------------------------------------------------------
+
+
+def _make_visitor_class(rule_id: str, visits: list, visit_behaviour, seen: list):
+    """Produce a visiting rule recording each instance it is handed in `seen`."""
+
+    class _Visitor(RuleTemplate):
+        def __init__(self):
+            super().__init__(rule_id, RuleTemplate.ERROR, "t")
+
+        def visit(self, instance, config):
+            seen.append((rule_id, instance["id"]))
+            visit_behaviour(self, instance)
+
+    _Visitor.visits = visits
+    return _Visitor
+
+
+def _visitor_data():
+    data = MagicMock()
+    data.instances_by_klass.side_effect = lambda klass: {
+        "A": [{"id": "a1"}, {"id": "a2"}],
+        "B": [{"id": "b1"}],
+    }[klass]
+    return data
+
+
+def _fail_on(id):
+    def behaviour(self, instance):
+        if instance["id"] == id:
+            self._add_failure("bad", "K", "x", instance["id"])
+
+    return behaviour
+
+
+def test_execute_rules_walks_each_visited_class_once(engine):
+    seen = []
+    data = _visitor_data()
+    engine.rules = [
+        _make_visitor_class("V1", ["A"], _fail_on("a2"), seen),
+        _make_rule_class("R_OK", lambda self, cfg: True),
+        _make_visitor_class("V2", ["A", "B"], _fail_on(None), seen),
+    ]
+    results = engine._execute_rules({"data": data, "ct": None})
+    assert [call.args[0] for call in data.instances_by_klass.call_args_list] == [
+        "A",
+        "B",
+    ]
+    assert seen == [
+        ("V1", "a1"),
+        ("V2", "a1"),
+        ("V1", "a2"),
+        ("V2", "a2"),
+        ("V2", "b1"),
+    ]
+    assert list(results.outcomes) == ["V1", "R_OK", "V2"]
+    assert results.outcomes["V1"].status == RuleStatus.FAILURE
+    assert results.outcomes["V1"].error_count == 1
+    assert results.outcomes["V2"].status == RuleStatus.SUCCESS
+
+
+def test_execute_rules_visitor_exception_stops_its_visits(engine):
+    seen = []
+
+    def boom(self, instance):
+        raise RuntimeError("boom")
+
+    def not_implemented(self, instance):
+        raise NotImplementedError
+
+    engine.rules = [
+        _make_visitor_class("V_EX", ["A", "B"], boom, seen),
+        _make_visitor_class("V_NI", ["A"], not_implemented, seen),
+        _make_visitor_class("V_OK", ["A"], _fail_on(None), seen),
+    ]
+    results = engine._execute_rules({"data": _visitor_data(), "ct": None})
+    assert seen == [("V_EX", "a1"), ("V_NI", "a1"), ("V_OK", "a1"), ("V_OK", "a2")]
+    assert results.outcomes["V_EX"].status == RuleStatus.EXCEPTION
+    assert "boom" in results.outcomes["V_EX"].exception
+    assert results.outcomes["V_NI"].status == RuleStatus.NOT_IMPLEMENTED
+    assert results.outcomes["V_OK"].status == RuleStatus.SUCCESS
+
+
+def test_execute_rules_visitors_with_workers_match_sequential(engine):
+    engine.rules = [
+        _make_visitor_class("V1", ["A"], _fail_on("a1"), []),
+        *_mixed_rules(),
+    ]
+    config = {"data": _visitor_data(), "ct": None}
+    expected = _summary(engine._execute_rules(config))
+    assert _summary(engine._execute_rules(config, max_workers=3)) == expected
+    assert list(engine._execute_rules(config, max_workers=3).outcomes)[0] == "V1"
+
+
+# ---------------------------------------------------------------------------
+# _execute_rules — timings, instance counts and profiling
+# ---------------------------------------------------------------------------
+
+
+def test_execute_rules_records_time_and_instance_count(engine):
+    def enumerate_instances(self, cfg):
+        data = cfg["data"]
+        data.instances_by_klass("A")
+        data.where("A", "x", 1)
+        data.instances()
+        data.path_by_id("a1")
+        return True
+
+    data = _visitor_data()
+    data.where.return_value = [{"id": "a1"}]
+    data.instances.return_value = [("a1", {}), ("a2", {}), ("b1", {})]
+    engine.rules = [
+        _make_rule_class("R_OK", enumerate_instances),
+        _make_visitor_class("V1", ["A", "B"], _fail_on(None), []),
+    ]
+    results = engine._execute_rules({"data": data, "ct": None})
+    assert results.outcomes["R_OK"].instance_count == 6
+    assert results.outcomes["V1"].instance_count == 3
+    data.path_by_id.assert_called_once_with("a1")
+    for outcome in results.outcomes.values():
+        assert outcome.wall_time > 0
+        assert outcome.cpu_time >= 0
+        assert outcome.profile is None
+
+
+def test_execute_rules_times_each_visiting_rule(engine):
+    engine.rules = [
+        _make_visitor_class("V_SLOW", ["A"], lambda self, i: time.sleep(0.01), []),
+        _make_visitor_class("V_FAST", ["A"], _fail_on(None), []),
+    ]
+    results = engine._execute_rules({"data": _visitor_data(), "ct": None})
+    assert results.outcomes["V_SLOW"].wall_time >= 0.02
+    assert 0 < results.outcomes["V_FAST"].wall_time < 0.01
+
+
+@pytest.mark.parametrize("tracing", [False, True])
+def test_execute_rules_profiles_named_rule(engine, tracing):
+    seen = []
+    engine.rules = [
+        _make_rule_class("R_OK", lambda self, cfg: seen.append("R_OK") or True),
+        _make_visitor_class("V1", ["A"], _fail_on("a1"), seen),
+    ]
+    if tracing:
+        tracemalloc.start()
+    try:
+        results = engine._execute_rules(
+            {"data": _visitor_data(), "ct": None}, profile_rule="V1"
+        )
+        assert tracemalloc.is_tracing() is tracing
+    finally:
+        tracemalloc.stop()
+    # Run first and on its own, and merged back in rule order
+    assert seen == [("V1", "a1"), ("V1", "a2"), "R_OK"]
+    assert list(results.outcomes) == ["R_OK", "V1"]
+    outcome = results.outcomes["V1"]
+    assert outcome.status == RuleStatus.FAILURE
+    assert outcome.instance_count == 2
+    assert "cumulative" in outcome.profile.stats
+    assert outcome.profile.peak_memory > 0
+    assert isinstance(outcome.profile.allocations, str)
+    assert results.outcomes["R_OK"].profile is None
+
+
+def test_validate_rules_passes_profile_rule(engine):
+    engine.rules = [_make_rule_class("DDF00010", lambda self, cfg: True)]
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+        patch.object(engine, "_execute_rules") as execute_rules,
+    ):
+        engine.validate_rules("a.json", profile_rule="DDF00010")
+    assert execute_rules.call_args.args[1:] == (
+        None,
+        "thread",
+        "DDF00010",
+        engine.rules,
+        None,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Rule selection and skipping
+# ---------------------------------------------------------------------------
+
+
+def _tagged_rule_class(rule_id: str, tags: list, requires: list, seen: list):
+    cls = _make_rule_class(rule_id, lambda self, cfg: seen.append(rule_id) or True)
+    cls.tags = tags
+    cls.requires = requires
+    return cls
+
+
+def _tagged_rules(seen: list):
+    return [
+        _tagged_rule_class("R_CT", [RuleTemplate.CT], [], seen),
+        _tagged_rule_class(
+            "R_BOTH", [RuleTemplate.CT, RuleTemplate.TIMELINE], [], seen
+        ),
+        _tagged_rule_class("R_NONE", [], [], seen),
+    ]
+
+
+@pytest.mark.parametrize(
+    "include, exclude, expected",
+    [
+        (None, None, ["R_CT", "R_BOTH", "R_NONE"]),
+        (["ct"], None, ["R_CT", "R_BOTH"]),
+        (["R_NONE", "timeline"], None, ["R_BOTH", "R_NONE"]),
+        (None, ["timeline"], ["R_CT", "R_NONE"]),
+        (["ct"], ["R_BOTH"], ["R_CT"]),
+        ([], None, []),
+    ],
+)
+def test_validate_data_selects_rules(engine, include, exclude, expected):
+    seen = []
+    engine.rules = _tagged_rules(seen)
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_data(
+            DataStore.from_dict({}), include=include, exclude=exclude
+        )
+    assert list(results.outcomes) == expected
+    assert seen == expected
+
+
+def test_validate_rules_selects_rules(engine):
+    seen = []
+    engine.rules = _tagged_rules(seen)
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        results = engine.validate_rules("a.json", include=["R_CT"])
+    assert list(results.outcomes) == ["R_CT"]
+
+
+def test_select_unknown_rule_or_tag_raises(engine):
+    engine.rules = _tagged_rules([])
+    with pytest.raises(ValueError, match="Unknown rule or tag 'DDF99999'"):
+        engine.validate_rules("a.json", include=["ct"], exclude=["DDF99999"])
+
+
+def test_unknown_profile_rule_raises(engine):
+    engine.rules = _tagged_rules([])
+    with patch.object(engine, "_data_store") as data_store:
+        with pytest.raises(ValueError, match="Unknown rule or tag 'DDF99999'"):
+            engine.validate_rules("a.json", profile_rule="DDF99999")
+        with pytest.raises(ValueError, match="Unknown rule or tag 'DDF99999'"):
+            engine.validate_data({}, profile_rule="DDF99999")
+    data_store.assert_not_called()
+
+
+def test_execute_rules_skips_rules_without_required_instances(engine):
+    seen = []
+    engine.rules = [
+        _tagged_rule_class("R_A", [], ["A"], seen),
+        _tagged_rule_class("R_AB", [], ["Missing", "B"], seen),
+        _tagged_rule_class("R_MISSING", [], ["Missing"], seen),
+        _make_visitor_class("V_MISSING", ["Missing"], _fail_on(None), seen),
+    ]
+    engine.rules[3].requires = ["Missing"]
+    data = MagicMock()
+    data.has_klass.side_effect = lambda klass: klass in ["A", "B"]
+    results = engine._execute_rules(
+        {"data": data, "ct": None}, max_workers=2, profile_rule="R_MISSING"
+    )
+    assert seen == ["R_A", "R_AB"]
+    assert [(o.rule_id, o.status) for o in results.outcomes.values()] == [
+        ("R_A", RuleStatus.SUCCESS),
+        ("R_AB", RuleStatus.SUCCESS),
+        ("R_MISSING", RuleStatus.SKIPPED),
+        ("V_MISSING", RuleStatus.SKIPPED),
+    ]
+    assert results.outcomes["R_MISSING"].profile is None
+    assert results.passed()
+
+
 # ---------------------------------------------------------------------------
 # validate_rules — top-level entry point
 # ---------------------------------------------------------------------------
@@ -160,6 +607,35 @@ def test_validate_rules_happy_path(engine):
     assert results.outcomes["R_OK"].status == RuleStatus.SUCCESS
 
 
+def test_validate_rules_loads_ct_once(engine):
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary") as ct_cls,
+    ):
+        engine.validate_rules("a.json")
+        engine.validate_rules("b.json")
+
+    ct_cls.assert_called_once_with("/root")
+    ct_cls.return_value.load.assert_called_once()
+
+
+def test_reload_ct_replaces_terminology(engine):
+    seen = []
+    cls = _make_rule_class("R_CT", lambda self, cfg: seen.append(cfg["ct"]) or True)
+    engine.rules = [cls]
+    first, second = MagicMock(), MagicMock()
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary", side_effect=[first, second]),
+    ):
+        engine.validate_rules("a.json")
+        engine.reload_ct()
+        engine.validate_rules("a.json")
+
+    assert seen == [first, second]
+    second.load.assert_called_once()
+
+
 def test_validate_rules_decomposition_error_records_exception(engine):
     fake_store = MagicMock()
     fake_store.decompose.side_effect = _decomp_error("bad shape")
@@ -171,6 +647,686 @@ def test_validate_rules_decomposition_error_records_exception(engine):
     assert results.outcomes["Decomposition"].status == RuleStatus.EXCEPTION
 
 
+# ---------------------------------------------------------------------------
+# iter_validate — outcomes as the rules finish
+# ---------------------------------------------------------------------------
+
+
+def test_iter_validate_yields_each_outcome_then_results(engine):
+    seen = []
+    engine.rules = _tagged_rules(seen) + [
+        _tagged_rule_class("R_MISSING", [], ["Missing"], seen)
+    ]
+    data = MagicMock()
+    data.has_klass.return_value = False
+    with (
+        patch.object(engine, "_data_store", return_value=(data, None)),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        iterator = engine.iter_validate("a.json")
+        assert seen == []
+        assert next(iterator).rule_id == "R_MISSING"
+        assert next(iterator).rule_id == "R_CT"
+        # Later rules have not run yet
+        assert seen == ["R_CT"]
+        items = list(iterator)
+        expected = engine.validate_rules("a.json")
+    assert [item.rule_id for item in items[:-1]] == ["R_BOTH", "R_NONE"]
+    results = items[-1]
+    assert list(results.outcomes) == ["R_CT", "R_BOTH", "R_NONE", "R_MISSING"]
+    assert _summary(results) == _summary(expected)
+
+
+def test_iter_validate_yields_pooled_outcomes_as_they_finish(engine):
+    release = threading.Event()
+
+    def slow(self, cfg):
+        return release.wait(timeout=10)
+
+    engine.rules = [
+        _make_rule_class("R_SLOW", slow),
+        _make_rule_class("R_FAST", lambda self, cfg: True),
+    ]
+    with (
+        patch.object(engine, "_data_store", return_value=(MagicMock(), None)),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        iterator = engine.iter_validate("a.json", max_workers=2)
+        assert next(iterator).rule_id == "R_FAST"
+        release.set()
+        slow_outcome, results = list(iterator)
+    assert slow_outcome.status == RuleStatus.SUCCESS
+    assert list(results.outcomes) == ["R_SLOW", "R_FAST"]
+
+
+def test_iter_validate_decomposition_error(engine):
+    with patch.object(
+        engine, "_data_store", return_value=(None, _decomp_error("bad shape"))
+    ):
+        outcome, results = list(engine.iter_validate("a.json"))
+    assert outcome.rule_id == "Decomposition"
+    assert outcome.status == RuleStatus.EXCEPTION
+    assert list(results.outcomes) == ["Decomposition"]
+
+
+def test_iter_validate_checks_arguments_on_call(engine):
+    engine.rules = _tagged_rules([])
+    with patch.object(engine, "_data_store") as data_store:
+        with pytest.raises(ValueError, match="Unknown rule or tag"):
+            engine.iter_validate("a.json", include=["DDF99999"])
+        with pytest.raises(ValueError):
+            engine.iter_validate("a.json", executor="fibre")
+    data_store.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# validate_data — in-memory entry point
+# ---------------------------------------------------------------------------
+
+
+def test_validate_data_from_dict(engine):
+    fake_store = MagicMock()
+    cls = _make_rule_class("R_OK", lambda self, cfg: True)
+    engine.rules = [cls]
+    payload = {"study": {"id": "S1"}}
+
+    # The engine checks isinstance(data, DataStore), so only the
+    # constructors are patched, not the class itself
+    with (
+        patch.object(DataStore, "from_dict", return_value=fake_store) as from_dict,
+        patch.object(DataStore, "from_wrapper") as from_wrapper,
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        results = engine.validate_data(payload)
+
+    from_dict.assert_called_once_with(payload)
+    from_wrapper.assert_not_called()
+    fake_store.decompose.assert_called_once()
+    assert results.outcomes["R_OK"].status == RuleStatus.SUCCESS
+
+
+def test_validate_data_from_wrapper(engine):
+    wrapper = MagicMock(spec=Wrapper)
+    with (
+        patch.object(DataStore, "from_dict") as from_dict,
+        patch.object(DataStore, "from_wrapper") as from_wrapper,
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        engine.validate_data(wrapper)
+
+    from_wrapper.assert_called_once_with(wrapper)
+    from_dict.assert_not_called()
+
+
+def test_validate_data_from_decomposed_store(engine):
+    store = MagicMock(spec=DataStore)
+    store.path_by_id.return_value = "$.study"
+    # Rules see the store through a recording wrapper
+    cls = _make_rule_class(
+        "R_OK", lambda self, cfg: cfg["data"].path_by_id("s1") == "$.study"
+    )
+    engine.rules = [cls]
+    with (
+        patch.object(DataStore, "from_dict") as from_dict,
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        results = engine.validate_data(store)
+
+    from_dict.assert_not_called()
+    store.decompose.assert_not_called()
+    assert results.outcomes["R_OK"].status == RuleStatus.SUCCESS
+
+
+def test_validate_data_decomposition_error_records_exception(engine):
+    results = engine.validate_data({"notstudy": {}})
+    assert results.outcomes["Decomposition"].status == RuleStatus.EXCEPTION
+
+
+# ---------------------------------------------------------------------------
+# Per-rule time budget
+# ---------------------------------------------------------------------------
+
+
+def _endless(self, cfg):
+    # e.g. following a cyclic chain of references
+    while True:
+        cfg["data"].instance_by_id("c1")
+
+
+def _slow_over_instances(self, cfg):
+    for instance in cfg["data"].instances_by_klass("A"):
+        time.sleep(0.01)
+    return True
+
+
+def _swallowing(self, cfg):
+    try:
+        _endless(self, cfg)
+    except Exception:
+        return True
+
+
+@pytest.mark.parametrize("behaviour", [_endless, _slow_over_instances, _swallowing])
+def test_execute_rules_stops_rule_over_time_budget(engine, behaviour):
+    engine.rules = [
+        _make_rule_class("R_SLOW", behaviour),
+        _make_rule_class("R_OK", lambda self, cfg: True),
+    ]
+    data = MagicMock()
+    data.instances_by_klass.return_value = [{"id": f"a{i}"} for i in range(500)]
+    results = engine._execute_rules({"data": data, "ct": None}, timeout=0.05)
+    outcome = results.outcomes["R_SLOW"]
+    assert outcome.status == RuleStatus.TIMEOUT
+    assert outcome.exception == "Rule exceeded its time budget of 0.05s"
+    assert 0.05 <= outcome.wall_time < 1
+    # What it read is incomplete, so it is always run again
+    assert outcome.reads is None
+    assert results.outcomes["R_OK"].status == RuleStatus.SUCCESS
+
+
+def test_time_budget_not_checked_without_timeout(engine):
+    seen = []
+
+    def behaviour(self, cfg):
+        instances = cfg["data"].instances_by_klass("A")
+        seen.append(type(instances))
+        return True
+
+    engine.rules = [_make_rule_class("R_OK", behaviour)]
+    data = MagicMock()
+    data.instances_by_klass.return_value = [{"id": "a1"}]
+    engine._execute_rules({"data": data, "ct": None})
+    engine._execute_rules({"data": data, "ct": None}, timeout=10)
+    assert seen[0] is list
+    assert seen[1] is not list and issubclass(seen[1], list)
+
+
+def test_visiting_rule_over_time_budget_is_stopped(engine):
+    seen = []
+    engine.rules = [
+        _make_visitor_class("V_SLOW", ["A"], lambda self, i: time.sleep(0.01), seen),
+        _make_visitor_class("V_OK", ["A"], _fail_on(None), []),
+    ]
+    data = MagicMock()
+    data.instances_by_klass.return_value = [{"id": f"a{i}"} for i in range(500)]
+    results = engine._execute_rules({"data": data, "ct": None}, timeout=0.05)
+    assert results.outcomes["V_SLOW"].status == RuleStatus.TIMEOUT
+    assert len(seen) < 500
+    assert results.outcomes["V_OK"].status == RuleStatus.SUCCESS
+    assert results.outcomes["V_OK"].instance_count == 500
+
+
+@pytest.mark.parametrize(
+    "executor", [RulesValidationEngine.THREAD, RulesValidationEngine.PROCESS]
+)
+def test_time_budget_on_pool(engine, executor):
+    engine.rules = [_make_rule_class("R_SLOW", _endless), *_mixed_rules()]
+    config = {"data": MagicMock(), "ct": None}
+    expected = _summary(engine._execute_rules(config, timeout=0.05))
+    results = engine._execute_rules(
+        config, max_workers=2, executor=executor, timeout=0.05
+    )
+    assert results.outcomes["R_SLOW"].status == RuleStatus.TIMEOUT
+    assert _summary(results) == expected
+
+
+def test_invalid_rule_timeout_raises(engine):
+    with pytest.raises(ValueError, match="rule_timeout 0"):
+        engine.validate_data({}, rule_timeout=0)
+
+
+# ---------------------------------------------------------------------------
+# Gated validation — ERROR rules first, stopping after max_failures
+# ---------------------------------------------------------------------------
+
+
+def _gate_behaviour(passes: bool, seen: list):
+    """A validate() recording the rule's id in `seen`, failing unless `passes`."""
+
+    def behaviour(self, cfg):
+        seen.append(self._rule)
+        if not passes:
+            self._errors.error("fail")
+        return passes
+
+    return behaviour
+
+
+def _gate_rules(seen: list):
+    return [
+        _make_rule_class("W_FAIL", _gate_behaviour(False, seen), RuleTemplate.WARNING),
+        _make_rule_class("E_OK", _gate_behaviour(True, seen)),
+        _make_rule_class("E_FAIL", _gate_behaviour(False, seen)),
+        _make_rule_class("E_LATER", _gate_behaviour(True, seen)),
+        _make_rule_class("W_OK", _gate_behaviour(True, seen), RuleTemplate.WARNING),
+    ]
+
+
+@pytest.mark.parametrize(
+    "max_failures, expected_seen, expected_not_run",
+    [
+        (1, ["E_OK", "E_FAIL"], ["W_FAIL", "E_LATER", "W_OK"]),
+        (2, ["E_OK", "E_FAIL", "E_LATER", "W_FAIL"], ["W_OK"]),
+        (3, ["E_OK", "E_FAIL", "E_LATER", "W_FAIL", "W_OK"], []),
+    ],
+)
+def test_validate_data_gate_stops_after_max_failures(
+    engine, max_failures, expected_seen, expected_not_run
+):
+    seen = []
+    engine.rules = _gate_rules(seen)
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_data(
+            DataStore.from_dict({}), max_failures=max_failures
+        )
+    assert seen == expected_seen
+    # Rule order is kept whatever order the rules ran in
+    assert list(results.outcomes) == ["W_FAIL", "E_OK", "E_FAIL", "E_LATER", "W_OK"]
+    assert results.not_run() == expected_not_run
+    assert results.outcomes["E_FAIL"].status == RuleStatus.FAILURE
+    assert not results.passed_or_not_implemented()
+
+
+def test_gate_without_failures_matches_full_validation(engine):
+    engine.rules = [
+        _make_rule_class("W_OK", _gate_behaviour(True, []), RuleTemplate.WARNING),
+        _make_rule_class("E_OK", _gate_behaviour(True, [])),
+    ]
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_data(DataStore.from_dict({}), max_failures=1)
+        expected = engine.validate_data(DataStore.from_dict({}))
+    assert _summary(results) == _summary(expected)
+    assert results.not_run() == []
+
+
+def test_gate_counts_exceptions_as_failures(engine):
+    engine.rules = _mixed_rules()
+    with (
+        patch("src.usdm4.rules.engine.DataStore"),
+        patch("src.usdm4.rules.engine.CTLibrary"),
+    ):
+        results = engine.validate_rules("a.json", max_failures=2, max_workers=1)
+    assert [o.status for o in results.outcomes.values()][:4] == [
+        RuleStatus.SUCCESS,
+        RuleStatus.FAILURE,
+        RuleStatus.NOT_IMPLEMENTED,
+        RuleStatus.EXCEPTION,
+    ]
+    assert len(results.not_run()) == 16
+
+
+def test_gate_on_thread_pool_drops_rules_not_started(engine):
+    release = threading.Event()
+    seen = []
+
+    def blocked(self, cfg):
+        seen.append(self._rule)
+        return release.wait(timeout=10)
+
+    engine.rules = [
+        _make_rule_class("R_BLOCKED", blocked),
+        _make_rule_class("R_FAIL", _gate_behaviour(False, [])),
+        *[_make_rule_class(f"R_{index}", blocked) for index in range(5)],
+    ]
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_data(
+            DataStore.from_dict({}), max_workers=2, max_failures=1
+        )
+    timer.join()
+    # Only the rules already started when R_FAIL failed ran, and their
+    # outcomes were not waited for
+    assert seen in (["R_BLOCKED"], ["R_BLOCKED", "R_0"])
+    assert results.outcomes["R_FAIL"].status == RuleStatus.FAILURE
+    assert results.not_run() == ["R_BLOCKED", *[f"R_{index}" for index in range(5)]]
+
+
+def test_gate_on_process_pool_drops_rules_not_started(engine, tmp_path):
+    # Forked workers record the rules they start as files
+    def slow(self, cfg):
+        (tmp_path / self._rule).touch()
+        time.sleep(0.2)
+        return True
+
+    def fail(self, cfg):
+        (tmp_path / self._rule).touch()
+        self._errors.error("fail")
+        return False
+
+    engine.rules = [
+        _make_rule_class("R_SLOW", slow),
+        _make_rule_class("R_FAIL", fail),
+        *[_make_rule_class(f"R_{index}", slow) for index in range(10)],
+    ]
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_data(
+            DataStore.from_dict({}),
+            max_workers=2,
+            executor=RulesValidationEngine.PROCESS,
+            max_failures=1,
+        )
+    started = {path.name for path in tmp_path.iterdir()}
+    assert results.outcomes["R_FAIL"].status == RuleStatus.FAILURE
+    assert results.not_run() == ["R_SLOW", *[f"R_{index}" for index in range(10)]]
+    # Only the rules already running, or in the pool's queue of
+    # max_workers + 1 calls, when R_FAIL failed ran; the others were
+    # dropped
+    assert {"R_SLOW", "R_FAIL"} <= started
+    assert len(started - {"R_SLOW", "R_FAIL"}) <= 4
+
+
+def test_gate_invalid_max_failures_raises(engine):
+    with pytest.raises(ValueError, match="max_failures 0"):
+        engine.validate_data({}, max_failures=0)
+
+
+# ---------------------------------------------------------------------------
+# validate_rules with a results cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cached_engine(engine, tmp_path):
+    engine.rules = [_make_rule_class("R_OK", lambda self, cfg: True)]
+    engine._ct = MagicMock(version="2024-03-29")
+    engine._library_digest = "library"
+    path = tmp_path / "study.json"
+    path.write_text("{}")
+    return engine, str(path), ResultsCache(str(tmp_path / "results"))
+
+
+def test_validate_rules_returns_cached_results(cached_engine):
+    engine, path, cache = cached_engine
+    with patch.object(engine, "_data_store", return_value=(MagicMock(), None)) as ds:
+        first = engine.validate_rules(path, results_cache=cache)
+        second = engine.validate_rules(path, results_cache=cache)
+        assert ds.call_count == 1
+        engine.validate_rules(path, results_cache=cache, bypass_cache=True)
+        engine.validate_rules(path, results_cache=cache, profile_rule="R_OK")
+        assert ds.call_count == 3
+        # A different selection, terminology or library misses
+        engine.validate_rules(path, results_cache=cache, include=["R_OK"])
+        engine._ct.version = "2024-09-27"
+        engine.validate_rules(path, results_cache=cache)
+        engine._library_digest = "changed"
+        engine.validate_rules(path, results_cache=cache)
+        assert ds.call_count == 6
+    assert _summary(second) == _summary(first)
+
+
+def test_validate_rules_gate_does_not_save_results(cached_engine):
+    engine, path, cache = cached_engine
+    with (
+        patch.object(engine, "_data_store", return_value=(MagicMock(), None)) as ds,
+        patch.object(cache, "save", wraps=cache.save) as save,
+    ):
+        engine.validate_rules(path, results_cache=cache, max_failures=1)
+        save.assert_not_called()
+        first = engine.validate_rules(path, results_cache=cache)
+        save.assert_called_once()
+        # Complete results from the cache answer a gate
+        gated = engine.validate_rules(path, results_cache=cache, max_failures=1)
+        assert ds.call_count == 2
+    assert _summary(gated) == _summary(first)
+
+
+def test_validate_rules_does_not_save_timed_out_results(cached_engine):
+    engine, path, cache = cached_engine
+    engine.rules = [_make_rule_class("R_SLOW", _endless)]
+    with (
+        patch.object(engine, "_data_store", return_value=(MagicMock(), None)),
+        patch.object(cache, "save") as save,
+    ):
+        results = engine.validate_rules(path, results_cache=cache, rule_timeout=0.01)
+    assert results.outcomes["R_SLOW"].status == RuleStatus.TIMEOUT
+    save.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "rules/library/rule_ddf00001.py",
+        "data_store/data_store.py",
+        "ct/cdisc/library.py",
+        "ct/cdisc/config/ct_config.yaml",
+    ],
+)
+def test_library_version_digests_library_sources(tmp_path, source):
+    for name in [
+        "rules/library/rule_ddf00001.py",
+        "data_store/data_store.py",
+        "ct/cdisc/library.py",
+        "ct/cdisc/config/ct_config.yaml",
+    ]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("# one")
+    with patch.object(RulesValidationEngine, "_load_rules", lambda self: None):
+        engine = RulesValidationEngine(str(tmp_path), "usdm4.rules.library")
+        version = engine._library_version()
+        (tmp_path / source).write_text("# two")
+        # Kept for the engine's lifetime
+        assert engine._library_version() == version
+        changed = RulesValidationEngine(str(tmp_path), "usdm4.rules.library")
+    assert changed._library_version() != version
+
+
+def test_library_version_digests_package_version(tmp_path):
+    with patch.object(RulesValidationEngine, "_load_rules", lambda self: None):
+        version = RulesValidationEngine(str(tmp_path), "")._library_version()
+        with patch("src.usdm4.rules.engine.__package_version__", "0.0.0"):
+            changed = RulesValidationEngine(str(tmp_path), "")._library_version()
+    assert changed != version
+
+
+# ---------------------------------------------------------------------------
+# Recorded reads and validate_incremental
+# ---------------------------------------------------------------------------
+
+
+def test_rule_store_records_queries():
+    data = _RuleStore(MagicMock())
+    data.instances_by_klass("A")
+    data.where("A", "type.code", "C1")
+    data.instances()
+    data.instance_by_id("a1")
+    data.parent_by_klass("a1", ["B", "C"])
+    data.visited("D", [])
+    assert data.reads == {
+        ("instances_by_klass", ("A",), ()),
+        ("where", ("A", "type.code", "C1"), ()),
+        ("instances", (), ()),
+        ("instance_by_id", ("a1",), ()),
+        ("parent_by_klass", ("a1", ("B", "C")), ()),
+        ("instances_by_klass", ("D",), ()),
+    }
+
+
+def test_rule_store_records_keyword_arguments():
+    data = _RuleStore(MagicMock())
+    data.referrers("a1", attribute="nextId")
+    data.parent_by_klass("a1", klasses=["B", "C"])
+    data._data_store.referrers.assert_called_once_with("a1", attribute="nextId")
+    assert data.reads == {
+        ("referrers", ("a1",), (("attribute", "nextId"),)),
+        ("parent_by_klass", ("a1",), (("klasses", ("B", "C")),)),
+    }
+
+
+def test_rule_store_reads_unknown_after_other_access():
+    data = _RuleStore(MagicMock())
+    data.instance_by_id("a1")
+    assert data.data is not None
+    assert data.reads is None
+    data.instance_by_id("a2")
+    assert data.reads is None
+
+
+def test_rule_store_reads_unknown_for_unhashable_query():
+    data = _RuleStore(MagicMock())
+    data.where("A", "x", {"not": "hashable"})
+    assert data.reads is None
+    data = _RuleStore(MagicMock())
+    data.referrers("a1", attribute={"not": "hashable"})
+    assert data.reads is None
+
+
+def test_execute_rules_records_reads(engine):
+    def read(self, cfg):
+        cfg["data"].path_by_id("a1")
+        return True
+
+    engine.rules = [
+        _make_rule_class("R_OK", read),
+        _make_visitor_class("V1", ["A", "B"], _fail_on(None), []),
+        _tagged_rule_class("R_SKIP", [], ["Missing"], []),
+    ]
+    data = _visitor_data()
+    data.has_klass.return_value = False
+    results = engine._execute_rules({"data": data, "ct": None})
+    assert results.outcomes["R_OK"].reads == {("path_by_id", ("a1",), ())}
+    assert results.outcomes["V1"].reads == {
+        ("instances_by_klass", ("A",), ()),
+        ("instances_by_klass", ("B",), ()),
+    }
+    assert results.outcomes["R_SKIP"].status == RuleStatus.SKIPPED
+    assert results.outcomes["R_SKIP"].reads == {("has_klass", ("Missing",), ())}
+
+
+def _versions(identifiers: dict) -> dict:
+    return {
+        "study": {
+            "id": "S1",
+            "instanceType": "Study",
+            "name": "S",
+            "versions": [
+                {"id": id, "instanceType": "StudyVersion", "versionIdentifier": v}
+                for id, v in identifiers.items()
+            ],
+        }
+    }
+
+
+def test_validate_incremental_runs_only_affected_rules(engine):
+    seen = []
+
+    def by_id(id):
+        def validate(self, cfg):
+            seen.append(self._rule)
+            version = cfg["data"].instance_by_id(id)
+            if version["versionIdentifier"] != "1":
+                self._errors.error(f"{id} changed")
+            return self._errors.count() == 0
+
+        return validate
+
+    def opaque(self, cfg):
+        seen.append(self._rule)
+        return cfg["data"].data is not None
+
+    engine.rules = [
+        _make_rule_class("R_V1", by_id("V1")),
+        _make_rule_class("R_V2", by_id("V2")),
+        _make_rule_class("R_DATA", opaque),
+    ]
+    previous_data = DataStore.from_dict(_versions({"V1": "1", "V2": "1"}))
+    previous_data.decompose()
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        previous = engine.validate_data(previous_data)
+        seen.clear()
+        edited = _versions({"V1": "1", "V2": "2"})
+        results = engine.validate_incremental(edited, previous_data, previous)
+    assert seen == ["R_V2", "R_DATA"]
+    assert list(results.outcomes) == ["R_V1", "R_V2", "R_DATA"]
+    assert results.outcomes["R_V1"] is previous.outcomes["R_V1"]
+    assert results.outcomes["R_V2"].status == RuleStatus.FAILURE
+    assert results.outcomes["R_DATA"].status == RuleStatus.SUCCESS
+
+
+def test_validate_incremental_compares_answers_by_instance(engine):
+    seen = []
+
+    def reading(query):
+        def validate(self, cfg):
+            seen.append(self._rule)
+            return query(cfg["data"]) is not None
+
+        return validate
+
+    engine.rules = [
+        _make_rule_class("R_PARENT", reading(lambda d: d.parent_by_id("V1"))),
+        _make_rule_class(
+            "R_REFERRERS", reading(lambda d: d.referrers("V1", attribute="nextId"))
+        ),
+        _make_rule_class("R_KLASS", reading(lambda d: d.instances_by_klass("X"))),
+        _make_rule_class("R_PATH", reading(lambda d: d.path_by_id("V1"))),
+    ]
+    previous_data = DataStore.from_dict(_versions({"V1": "1", "V2": "1"}))
+    previous_data.decompose()
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        previous = engine.validate_data(previous_data)
+        seen.clear()
+        edited = _versions({"V1": "1", "V2": "2"})
+        engine.validate_incremental(edited, previous_data, previous)
+    # The study holding V2 changed with it
+    assert seen == ["R_PARENT"]
+
+
+def test_validate_incremental_compares_duplicated_ids_by_value(engine):
+    seen = []
+
+    def by_id(self, cfg):
+        seen.append(self._rule)
+        return cfg["data"].instance_by_id("V1") is not None
+
+    def duplicates(self, cfg):
+        seen.append(self._rule)
+        return bool(cfg["data"].duplicates())
+
+    engine.rules = [
+        _make_rule_class("R_V1", by_id),
+        _make_rule_class("R_DUPS", duplicates),
+    ]
+
+    def study(identifiers: list) -> DataStore:
+        data = _versions({})
+        data["study"]["versions"] = [
+            {"id": id, "instanceType": "StudyVersion", "versionIdentifier": v}
+            for id, v in identifiers
+        ]
+        store = DataStore.from_dict(data)
+        store.decompose()
+        return store
+
+    previous_data = study([("V1", "1"), ("V1", "1"), ("V2", "1")])
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        previous = engine.validate_data(previous_data)
+        seen.clear()
+        same = study([("V1", "1"), ("V1", "1"), ("V2", "2")])
+        results = engine.validate_incremental(same, previous_data, previous)
+        assert seen == []
+        assert results.outcomes["R_V1"] is previous.outcomes["R_V1"]
+        changed = study([("V1", "1"), ("V1", "2"), ("V2", "1")])
+        engine.validate_incremental(changed, previous_data, previous)
+        assert seen == ["R_V1", "R_DUPS"]
+
+
+def test_validate_incremental_runs_rules_new_to_the_selection(engine):
+    engine.rules = [_make_rule_class("R_OK", lambda self, cfg: True)]
+    store = DataStore.from_dict(_versions({"V1": "1"}))
+    store.decompose()
+    with patch("src.usdm4.rules.engine.CTLibrary"):
+        results = engine.validate_incremental(store, store, RulesValidationResults())
+    assert results.outcomes["R_OK"].status == RuleStatus.SUCCESS
+
+
+def test_validate_incremental_decomposition_error(engine):
+    results = engine.validate_incremental(
+        {"notstudy": {}}, MagicMock(), RulesValidationResults()
+    )
+    assert results.outcomes["Decomposition"].status == RuleStatus.EXCEPTION
+
+
 # ---------------------------------------------------------------------------
 # _load_rules — uses a tempdir of fake rule files
 # ---------------------------------------------------------------------------
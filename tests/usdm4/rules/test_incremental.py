@@ -0,0 +1,117 @@
+"""Harness checking incremental validation against a full validation.
+
+Each bundled USDM test file is validated, edited a few ways (a value
+changed, an attribute removed, an entry dropped from a list of child
+instances) and validated again both in full and incrementally from the
+first results. The two must be identical, timestamps and timings aside.
+"""
+
+import copy
+import glob
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.usdm4.rules.engine import RulesValidationEngine
+from usdm4.data_store.data_store import DataStore, DecompositionError
+
+ROOT_PATH = str(Path(__file__).parents[3] / "src" / "usdm4")
+EDITS_PER_FILE = 3
+
+
+def _study_files() -> list[str]:
+    files = []
+    for path in sorted(glob.glob("tests/usdm4/test_files/**/*.json", recursive=True)):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            DataStore.from_dict(data).decompose()
+        except (ValueError, DecompositionError):
+            continue
+        files.append(path)
+    return files
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return RulesValidationEngine(ROOT_PATH, "usdm4.rules.library")
+
+
+def _rows(results) -> list:
+    return [
+        (
+            o.rule_id,
+            o.status,
+            [
+                {k: v for k, v in error.items() if k != "timestamp"}
+                for error in o.errors.to_dict(level=0)
+            ],
+            o.exception,
+        )
+        for o in results.outcomes.values()
+    ]
+
+
+def _instances(value, found: list) -> list:
+    if isinstance(value, dict):
+        if "id" in value and "instanceType" in value:
+            found.append(value)
+        for item in value.values():
+            _instances(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _instances(item, found)
+    return found
+
+
+def _edit(data: dict, seed: int) -> dict:
+    edited = copy.deepcopy(data)
+    rnd = random.Random(seed)
+    instance = rnd.choice(_instances(edited, []))
+    attributes = [k for k in instance if k not in ("id", "instanceType")]
+    lists = [k for k in attributes if isinstance(instance[k], list) and instance[k]]
+    edit = seed % 3
+    if edit == 0 and lists:
+        items = instance[rnd.choice(lists)]
+        items.pop(rnd.randrange(len(items)))
+    elif edit == 1 and attributes:
+        del instance[rnd.choice(attributes)]
+    else:
+        strings = [k for k in attributes if isinstance(instance[k], str)]
+        instance[rnd.choice(strings or ["id"])] = "edited"
+    return edited
+
+
+def _store(data: dict) -> DataStore | dict:
+    store = DataStore.from_dict(data)
+    try:
+        store.decompose()
+    except DecompositionError:
+        return data
+    return store
+
+
+@pytest.mark.parametrize("path", _study_files())
+def test_incremental_matches_full_validation(engine, path):
+    with open(path) as f:
+        data = json.load(f)
+    previous_data = _store(data)
+    previous = engine.validate_data(previous_data)
+    unchanged = engine.validate_incremental(_store(data), previous_data, previous)
+    # Only the rules that read the store in ways not recorded run again
+    assert [
+        rule_id
+        for rule_id, outcome in previous.outcomes.items()
+        if unchanged.outcomes[rule_id] is not outcome
+    ] == [
+        rule_id
+        for rule_id, outcome in previous.outcomes.items()
+        if outcome.reads is None
+    ]
+    for seed in range(EDITS_PER_FILE):
+        edited = _edit(data, seed)
+        expected = engine.validate_data(edited)
+        results = engine.validate_incremental(_store(edited), previous_data, previous)
+        assert _rows(results) == _rows(expected)
@@ -1,7 +1,7 @@
 """Tests for the rule body primitives (src/usdm4/rules/primitives.py).
 
 All functions are pure data helpers; the data_store dependency in
-``any_ids_unresolved``, ``same_scope`` and ``scope_of`` is satisfied
+``any_ids_unresolved``, ``same_scope``, ``scope_of`` and ``group_by_scope`` is satisfied
 with MagicMock.
 """
 
@@ -12,6 +12,7 @@ from src.usdm4.rules.primitives import (
     children,
     duplicate_values,
     duplicates_by,
+    group_by_scope,
     not_in_set,
     same_scope,
     scope_of,
@@ -166,3 +167,25 @@ def test_scope_of_delegates_to_data_store():
     result = scope_of(ds, "a", ["StudyProtocol"])
     assert result == {"id": "SP"}
     ds.parent_by_klass.assert_called_once_with("a", ["StudyProtocol"])
+
+
+# ---------------------------------------------------------------------------
+# group_by_scope
+# ---------------------------------------------------------------------------
+
+
+def test_group_by_scope_groups_by_scope_id_in_order():
+    scopes = {"a": {"id": "SD1"}, "b": {"id": "SD2"}, "c": {"id": "SD1"}, "d": None}
+    ds = MagicMock()
+    ds.parent_by_klass.side_effect = lambda id, klasses: scopes[id]
+    items = [{"id": "a"}, {"id": "b"}, {"id": "c"}, {"id": "d"}]
+    result = group_by_scope(ds, items, ["StudyDesign"])
+    assert result == {
+        "SD1": [{"id": "a"}, {"id": "c"}],
+        "SD2": [{"id": "b"}],
+    }
+    ds.parent_by_klass.assert_any_call("a", ["StudyDesign"])
+
+
+def test_group_by_scope_empty_input():
+    assert group_by_scope(MagicMock(), [], ["StudyDesign"]) == {}
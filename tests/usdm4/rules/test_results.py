@@ -27,6 +27,9 @@ def test_rule_status_values():
     assert RuleStatus.FAILURE.value == "Failure"
     assert RuleStatus.EXCEPTION.value == "Exception"
     assert RuleStatus.NOT_IMPLEMENTED.value == "Not Implemented"
+    assert RuleStatus.SKIPPED.value == "Skipped"
+    assert RuleStatus.NOT_RUN.value == "Not Run"
+    assert RuleStatus.TIMEOUT.value == "Timeout"
 
 
 def test_rule_outcome_defaults():
@@ -35,6 +38,7 @@ def test_rule_outcome_defaults():
     assert o.status == RuleStatus.SUCCESS
     assert o.error_count == 0
     assert o.exception is None
+    assert (o.wall_time, o.cpu_time, o.instance_count, o.profile) == (0.0, 0.0, 0, None)
 
 
 def test_rule_outcome_error_count_reflects_errors():
@@ -89,11 +93,44 @@ def test_add_not_implemented(results):
     assert results.outcomes["R5"].status == RuleStatus.NOT_IMPLEMENTED
 
 
+def test_add_outcome(results):
+    outcome = RuleOutcome("R6", RuleStatus.SUCCESS)
+    results.add_outcome(outcome)
+    assert results.outcomes["R6"] is outcome
+
+
 # ---------------------------------------------------------------------------
 # Query API
 # ---------------------------------------------------------------------------
 
 
+def test_timings_sorted_by_wall_time(results):
+    results.add_outcome(RuleOutcome("R1", RuleStatus.SUCCESS, wall_time=1.0))
+    results.add_outcome(
+        RuleOutcome(
+            "R2", RuleStatus.FAILURE, wall_time=3.0, cpu_time=2.5, instance_count=7
+        )
+    )
+    results.add_outcome(RuleOutcome("R0", RuleStatus.SUCCESS, wall_time=1.0))
+    assert results.wall_time == 5.0
+    rows = results.timings()
+    assert [row["rule_id"] for row in rows] == ["R2", "R0", "R1"]
+    assert rows[0] == {
+        "rule_id": "R2",
+        "status": "Failure",
+        "wall_time": 3.0,
+        "cpu_time": 2.5,
+        "instance_count": 7,
+        "share": 0.6,
+    }
+    assert [row["rule_id"] for row in results.timings(limit=1)] == ["R2"]
+
+
+def test_timings_without_time_recorded(results):
+    results.add_success("R1")
+    assert results.timings()[0]["share"] == 0.0
+
+
 def test_count_and_finding_count(results):
     errs = Errors()
     errs.error("x")
@@ -113,6 +150,28 @@ def test_is_valid_and_passed_all_success(results):
     assert results.is_valid is True
 
 
+def test_passed_with_skipped(results):
+    results.add_success("R1")
+    results.add_skipped("R2")
+    assert results.outcomes["R2"].status == RuleStatus.SKIPPED
+    assert results.passed() is True
+    assert results.passed_or_not_implemented() is True
+
+
+def test_not_run(results):
+    errs = Errors()
+    errs.error("x")
+    results.add_failure("R1", errs)
+    results.add_not_run("R2")
+    results.add_success("R3")
+    results.add_not_run("R4")
+    assert results.outcomes["R2"].status == RuleStatus.NOT_RUN
+    assert results.not_run() == ["R2", "R4"]
+    assert results.passed() is False
+    assert results.passed_or_not_implemented() is False
+    assert [row["rule_id"] for row in results.to_dict()] == ["R1"]
+
+
 def test_passed_false_when_any_failure(results):
     errs = Errors()
     errs.error("x")
@@ -201,6 +260,24 @@ def test_to_dict_include_not_implemented_produces_row(results):
     assert rows[0]["status"] == "Not Implemented"
 
 
+def test_to_dict_include_skipped_produces_row(results):
+    results.add_skipped("R1")
+    assert results.to_dict() == []
+    rows = results.to_dict(include_skipped=True)
+    assert len(rows) == 1
+    assert rows[0]["status"] == "Skipped"
+
+
+def test_timeout_row_and_gate(results):
+    results.add_success("R1")
+    results.add_timeout("R2", "Rule exceeded its time budget of 1s")
+    assert results.outcomes["R2"].status == RuleStatus.TIMEOUT
+    assert results.passed_or_not_implemented() is False
+    rows = results.to_dict()
+    assert [(row["rule_id"], row["status"]) for row in rows] == [("R2", "Timeout")]
+    assert rows[0]["exception"] == "Rule exceeded its time budget of 1s"
+
+
 def test_to_dict_exception_row_uses_exception_text(results):
     results.add_exception("R5", RuntimeError("boom"))
     rows = results.to_dict()
@@ -264,6 +341,14 @@ def test_format_text_exception_branch(results):
     assert "boom" in text
 
 
+def test_format_text_timeout_branch(results):
+    results.add_timeout("RT", "Rule exceeded its time budget of 1s")
+    text = results.format_text()
+    assert "Validation FAILED" in text
+    assert "RT: TIMEOUT" in text
+    assert "time budget of 1s" in text
+
+
 def test_format_text_failure_without_location(results):
     errs = Errors()
     errs.error("no-loc")  # no ValidationLocation attached
@@ -0,0 +1,144 @@
+"""Direct tests for ResultsCache (pickle-backed rule validation results).
+
+Uses ``tmp_path`` so no real user directories are touched.
+"""
+
+import os
+import time
+
+from src.usdm4.rules.results import RulesValidationResults
+from src.usdm4.rules.results_cache import ResultsCache
+
+
+def _file(tmp_path, text="{}"):
+    p = tmp_path / "study.json"
+    p.write_text(text)
+    return str(p)
+
+
+def _results(rule="R1"):
+    results = RulesValidationResults()
+    results.add_success(rule)
+    return results
+
+
+def _bomb(*args, **kwargs):
+    raise RuntimeError("disk full")
+
+
+def _age(cache, key, seconds):
+    path = os.path.join(cache.filepath, f"{key}{ResultsCache.EXTENSION}")
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_key_depends_on_content_parts_and_version(tmp_path, monkeypatch):
+    cache = ResultsCache(str(tmp_path / "cache"))
+    path = _file(tmp_path)
+    key = cache.key(path, "library", "2024-03-29")
+    assert key == cache.key(path, "library", "2024-03-29")
+    assert key != cache.key(path, "library", "2024-09-27")
+    assert key != cache.key(path, "other", "2024-03-29")
+    assert key != cache.key(path, "library", "2024-03-29", "selection")
+    monkeypatch.setattr(ResultsCache, "VERSION", ResultsCache.VERSION + 1)
+    assert key != cache.key(path, "library", "2024-03-29")
+    monkeypatch.undo()
+    _file(tmp_path, '{"a": 1}')
+    assert key != cache.key(path, "library", "2024-03-29")
+
+
+def test_save_then_read_roundtrip(tmp_path):
+    cache = ResultsCache(str(tmp_path / "cache"))
+    assert cache.read("k") is None
+    cache.save("k", _results())
+    assert list(cache.read("k").outcomes) == ["R1"]
+
+
+def test_read_corrupt_is_a_miss(tmp_path):
+    cache = ResultsCache(str(tmp_path))
+    (tmp_path / f"bad{ResultsCache.EXTENSION}").write_bytes(b"not a pickle")
+    assert cache.read("bad") is None
+
+
+def test_read_expired_is_a_miss_and_removed(tmp_path):
+    cache = ResultsCache(str(tmp_path), max_age=60)
+    cache.save("k", _results())
+    _age(cache, "k", 120)
+    assert cache.read("k") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_marks_entry_used(tmp_path):
+    cache = ResultsCache(str(tmp_path), max_age=60)
+    cache.save("k", _results())
+    _age(cache, "k", 30)
+    assert cache.read("k") is not None
+    path = tmp_path / f"k{ResultsCache.EXTENSION}"
+    assert time.time() - path.stat().st_mtime < 5
+
+
+def test_save_evicts_least_recently_used_over_size(tmp_path):
+    cache = ResultsCache(str(tmp_path), max_size=None)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.save(key, _results())
+        _age(cache, key, 100 - index * 10)
+    # "a" is the oldest but was just used
+    cache.read("a")
+    size = (tmp_path / f"a{ResultsCache.EXTENSION}").stat().st_size
+    cache.max_size = size * 3
+    cache.save("d", _results())
+    assert sorted(path.stem for path in tmp_path.iterdir()) == ["a", "c", "d"]
+
+
+def test_save_evicts_expired(tmp_path):
+    cache = ResultsCache(str(tmp_path), max_size=None, max_age=60)
+    cache.save("old", _results())
+    _age(cache, "old", 120)
+    cache.save("new", _results())
+    assert [path.stem for path in tmp_path.iterdir()] == ["new"]
+
+
+def test_no_limits_keeps_everything(tmp_path):
+    cache = ResultsCache(str(tmp_path), max_size=None, max_age=None)
+    cache.save("old", _results())
+    _age(cache, "old", 10**9)
+    cache.save("new", _results())
+    assert cache.read("old") is not None
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_evict_failure_is_skipped(tmp_path, monkeypatch):
+    cache = ResultsCache(str(tmp_path), max_size=None)
+    cache.save("k", _results())
+    cache.max_size = 0
+    monkeypatch.setattr("src.usdm4.rules.results_cache.os.remove", _bomb)
+    cache.evict()
+    assert cache.read("k") is not None
+    # A missing directory has nothing to evict
+    ResultsCache(str(tmp_path / "missing")).evict()
+
+
+def test_save_failure_is_skipped(tmp_path, monkeypatch):
+    cache = ResultsCache(str(tmp_path))
+    monkeypatch.setattr("src.usdm4.file_cache.pickle_cache.pickle.dump", _bomb)
+    cache.save("k", _results())
+    assert cache.read("k") is None
+    # No partial temporary file left behind
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_to_unusable_directory_is_skipped(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ResultsCache(str(blocker / "cache"))
+    cache.save("k", _results())
+    assert cache.read("k") is None
+
+
+def test_delete(tmp_path):
+    cache = ResultsCache(str(tmp_path))
+    cache.save("k", _results())
+    cache.delete("k")
+    assert cache.read("k") is None
+    # Deleting a missing entry is harmless
+    cache.delete("k")
@@ -14,7 +14,12 @@ class TestRuleDDF00007:
 
     def _data(self, timings):
         data = MagicMock()
-        data.instances_by_klass.return_value = timings
+        # Stands in for DataStore.where(klass, "type.code", value)
+        data.where.side_effect = lambda klass, path, value: [
+            i
+            for i in timings
+            if isinstance(i.get("type"), dict) and i["type"].get("code") == value
+        ]
         data.path_by_id.return_value = "$.path"
         return data
 
@@ -16,7 +16,7 @@ class TestRuleDDF00027:
         data = MagicMock()
         data.instances_by_klass.side_effect = lambda k: by_klass.get(k, [])
         data.path_by_id.return_value = "$.path"
-        data._parent = parent_dict
+        data.parent_by_id.side_effect = lambda id: parent_dict.get(id)
         return data
 
     def test_non_dict_parent_is_skipped(self):
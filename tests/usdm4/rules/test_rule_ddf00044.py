@@ -20,7 +20,8 @@ class TestRuleDDF00044:
         data = MagicMock()
         data.instances_by_klass.return_value = assignments
         data.path_by_id.return_value = "$.path"
-        data._parent = parent_dict or {}
+        parent_dict = parent_dict or {}
+        data.parent_by_id.side_effect = lambda id: parent_dict.get(id)
         return data
 
     def test_missing_target_skipped(self):
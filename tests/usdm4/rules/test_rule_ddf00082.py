@@ -22,23 +22,27 @@ class TestRuleDDF00082:
     def test_validate_passes(self):
         rule = RuleDDF00082()
         data = MagicMock()
-        data.filename = "/path/to/study.json"
+        data.data = {"study": {}}
         # Patch the class methods directly so the patch affects all
         # references to SchemaValidation regardless of import path.
         with (
             patch.object(SchemaValidation, "__init__", return_value=None),
-            patch.object(SchemaValidation, "validate_file", return_value=None),
+            patch.object(
+                SchemaValidation, "validate_against_component", return_value=None
+            ),
         ):
             assert rule.validate({"data": data}) is True
 
     def test_validate_fails_on_validation_error(self):
         rule = RuleDDF00082()
         data = MagicMock()
-        data.filename = "/path/to/study.json"
+        data.data = {"study": {}}
         err = ValidationError("bad type", path=["study"], instance={"x": 1})
         with (
             patch.object(SchemaValidation, "__init__", return_value=None),
-            patch.object(SchemaValidation, "validate_file", side_effect=err),
+            patch.object(
+                SchemaValidation, "validate_against_component", side_effect=err
+            ),
         ):
             assert rule.validate({"data": data}) is False
             assert rule.errors().count() == 1
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 
+from usdm4.data_store.data_store import DataStore
 from usdm4.rules.library.rule_ddf00083 import RuleDDF00083
 from usdm4.rules.rule_template import RuleTemplate
 
@@ -12,73 +13,67 @@ class TestRuleDDF00083:
         assert rule._rule == "DDF00083"
         assert rule._level == RuleTemplate.ERROR
 
-    def _data(self, tree):
+    def _data(self, duplicates):
         data = MagicMock()
-        data.data = tree
+        data.duplicates.return_value = duplicates
         return data
 
     def test_unique_ids_pass(self):
         rule = RuleDDF00083()
-        tree = {
-            "id": "A",
-            "instanceType": "Root",
-            "children": [
-                {"id": "B", "instanceType": "Child"},
-                {"id": "C", "instanceType": "Child"},
-            ],
-        }
-        assert rule.validate({"data": self._data(tree)}) is True
+        assert rule.validate({"data": self._data({})}) is True
 
     def test_duplicate_id_fails(self):
         rule = RuleDDF00083()
-        tree = {
-            "id": "A",
-            "instanceType": "Root",
-            "children": [
-                {"id": "DUP", "instanceType": "Child"},
-                {"id": "DUP", "instanceType": "Child"},
-            ],
+        duplicates = {
+            "DUP": [
+                ({"id": "DUP", "instanceType": "Child"}, "$.children[0]"),
+                ({"id": "DUP", "instanceType": "Child"}, "$.children[1]"),
+            ]
         }
-        assert rule.validate({"data": self._data(tree)}) is False
+        assert rule.validate({"data": self._data(duplicates)}) is False
         assert rule.errors().count() == 2
         assert "not unique" in rule.errors().dump()
+        paths = [e.location.to_dict()["path"] for e in rule.errors()._items]
+        assert paths == ["$.children[0]", "$.children[1]"]
 
-    def test_nested_lists_and_dicts(self):
-        rule = RuleDDF00083()
-        tree = {
-            "id": "A",
-            "instanceType": "Root",
-            "nested": {
-                "more": [
-                    {"id": "X", "instanceType": "Deep"},
-                    {"id": "X", "instanceType": "Deep"},
-                ]
-            },
-        }
-        assert rule.validate({"data": self._data(tree)}) is False
-        assert rule.errors().count() == 2
-
-    def test_dict_without_instance_type_is_ignored(self):
+    def test_missing_instance_type_reported_as_unknown(self):
         rule = RuleDDF00083()
-        # A dict carrying `id` but not `instanceType` should NOT be counted
-        # (mirrors the CORE filter `[id and instanceType]`).
-        tree = {
-            "id": "A",
-            "instanceType": "Root",
-            "meta": {"id": "A"},  # same id, no instanceType — ignored
-        }
-        assert rule.validate({"data": self._data(tree)}) is True
+        duplicates = {"DUP": [({"id": "DUP"}, "$.a"), ({"id": "DUP"}, "$.b")]}
+        assert rule.validate({"data": self._data(duplicates)}) is False
+        assert rule.errors()._items[0].location.to_dict()["klass"] == "Unknown"
 
     def test_non_string_ids_ignored(self):
         rule = RuleDDF00083()
-        tree = {
-            "id": 1,
-            "instanceType": "Root",
-            "children": [{"id": 1, "instanceType": "Child"}],
+        duplicates = {
+            1: [
+                ({"id": 1, "instanceType": "Root"}, "$.study"),
+                ({"id": 1, "instanceType": "Child"}, "$.study.children[0]"),
+            ]
         }
-        assert rule.validate({"data": self._data(tree)}) is True
+        assert rule.validate({"data": self._data(duplicates)}) is True
 
-    def test_missing_data_attr_passes(self):
+    def test_document_paths_from_data_store(self):
         rule = RuleDDF00083()
-        data = MagicMock(spec=["foo"])  # no .data attribute
-        assert rule.validate({"data": data}) is True
+        data = DataStore.from_dict(
+            {
+                "study": {
+                    "id": "S1",
+                    "instanceType": "Study",
+                    "versions": [
+                        {"id": "X", "instanceType": "StudyVersion"},
+                        {
+                            "id": "V2",
+                            "instanceType": "StudyVersion",
+                            "nested": {"id": "X", "instanceType": "Deep"},
+                        },
+                    ],
+                }
+            }
+        )
+        data.decompose()
+        assert rule.validate({"data": data}) is False
+        locations = [e.location.to_dict() for e in rule.errors()._items]
+        assert [(loc["klass"], loc["path"]) for loc in locations] == [
+            ("StudyVersion", "$.study.versions[0]"),
+            ("Deep", "$.study.versions[1].nested"),
+        ]
@@ -14,7 +14,12 @@ class TestRuleDDF00096:
 
     def _data(self, endpoints, parent_map=None):
         data = MagicMock()
-        data.instances_by_klass.return_value = endpoints
+        # Stands in for DataStore.where(klass, "level.code", value)
+        data.where.side_effect = lambda klass, path, value: [
+            i
+            for i in endpoints
+            if isinstance(i.get("level"), dict) and i["level"].get("code") == value
+        ]
         data.path_by_id.return_value = "$.path"
         data.parent_by_klass.side_effect = lambda eid, _k: (parent_map or {}).get(eid)
         return data
@@ -14,7 +14,8 @@ class TestRuleDDF00249:
 
     def _data(self, criteria, items):
         """Build a DataStore-like mock returning ``criteria`` for
-        ``EligibilityCriterion`` and ``items`` for ``EligibilityCriterionItem``.
+        ``EligibilityCriterion`` and ``items`` for ``EligibilityCriterionItem``,
+        with ``referrers`` answered from the criteria.
         """
 
         def by_klass(klass):
@@ -26,6 +27,9 @@ class TestRuleDDF00249:
 
         data = MagicMock()
         data.instances_by_klass.side_effect = by_klass
+        data.referrers.side_effect = lambda iid, attribute: [
+            c for c in criteria if c.get(attribute) == iid
+        ]
         data.path_by_id.return_value = "$.path"
         return data
 
@@ -14,7 +14,7 @@ class TestRuleDDF00260:
 
     def _data(self, ids):
         data = MagicMock()
-        data._ids = ids
+        data.instances.return_value = list(ids.items())
         data.path_by_id.return_value = "$.path"
         return data
 
@@ -0,0 +1,163 @@
+"""Tests for the rule registry and its use by RulesValidationEngine."""
+
+import importlib
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.results import RuleStatus
+from usdm4.rules.library.registry import RULES
+from usdm4.rules.rule_registry import RuleEntry, RuleRegistry
+from usdm4.rules.rule_template import RuleTemplate
+
+ROOT_PATH = str(Path(__file__).parents[3] / "src" / "usdm4")
+LIBRARY_PATH = str(Path(ROOT_PATH) / "rules" / "library")
+
+
+def _scanned_engine() -> RulesValidationEngine:
+    with patch.object(RulesValidationEngine, "_load_rules", lambda self: None):
+        engine = RulesValidationEngine(ROOT_PATH, RuleRegistry.PACKAGE)
+    engine._scan_rules()
+    return engine
+
+
+def test_registry_is_up_to_date():
+    # Fails when a rule has changed without tools/build_rule_registry.py
+    # being run
+    engine = _scanned_engine()
+    rows = RuleRegistry(LIBRARY_PATH, RuleRegistry.PACKAGE).build(engine.rules)
+    assert [tuple(row) for row in RULES] == rows
+
+
+def test_entries_from_registry():
+    entries = RuleRegistry(LIBRARY_PATH, RuleRegistry.PACKAGE).entries()
+    assert len(entries) == len(RULES)
+    entry = next(e for e in entries if e.rule_id == "DDF00060")
+    assert entry.module == "rule_ddf00060"
+    assert entry.class_name == "RuleDDF00060"
+    assert entry.visits == ["Timing"]
+    assert entry.requires == ["Timing"]
+    assert entry.tags == [RuleTemplate.TIMELINE]
+    assert entry.package == RuleRegistry.PACKAGE
+
+
+def test_entries_not_used_for_other_package():
+    assert RuleRegistry(LIBRARY_PATH, "other.library").entries() is None
+
+
+def test_entries_not_used_when_stale(tmp_path):
+    (tmp_path / "rule_ddf00001.py").write_text("")
+    assert RuleRegistry(str(tmp_path), RuleRegistry.PACKAGE).entries() is None
+
+
+def test_entries_not_used_without_registry():
+    with patch(
+        "usdm4.rules.rule_registry.importlib.import_module",
+        side_effect=ImportError,
+    ):
+        assert RuleRegistry(LIBRARY_PATH, RuleRegistry.PACKAGE).entries() is None
+
+
+def test_entry_imports_rule_on_first_use():
+    entry = RuleEntry(
+        "DDF00060",
+        "rule_ddf00060",
+        "RuleDDF00060",
+        40,
+        ["Timing"],
+        ["Timing"],
+        [RuleTemplate.TIMELINE],
+        RuleRegistry.PACKAGE,
+    )
+    with patch(
+        "usdm4.rules.rule_registry.importlib.import_module",
+        wraps=importlib.import_module,
+    ) as import_module:
+        rule = entry()
+        entry()
+    import_module.assert_called_once_with("usdm4.rules.library.rule_ddf00060")
+    assert rule._rule == "DDF00060"
+    assert entry.load() is type(rule)
+
+
+@pytest.mark.parametrize("visits", [[], ["StudyVersion"]])
+def test_entry_without_module_fails_only_its_rule(visits):
+    engine = RulesValidationEngine(ROOT_PATH, RuleRegistry.PACKAGE)
+    ok = next(entry for entry in engine.rules if entry.rule_id == "DDF00010")
+    missing = RuleEntry(
+        "DDF99999",
+        "rule_ddf99999",
+        "RuleDDF99999",
+        40,
+        visits,
+        [],
+        [],
+        RuleRegistry.PACKAGE,
+    )
+    engine.rules = [missing, ok]
+    results = engine.validate_rules("tests/usdm4/test_files/test_validate.json")
+    outcome = results.outcomes["DDF99999"]
+    assert outcome.status == RuleStatus.EXCEPTION
+    assert "No module named 'usdm4.rules.library.rule_ddf99999'" in outcome.exception
+    assert outcome.reads is None
+    assert results.outcomes["DDF00010"].status == RuleStatus.SUCCESS
+
+
+def test_entries_not_used_with_old_columns(tmp_path):
+    rows = [row[:6] for row in RULES]
+    with patch("usdm4.rules.library.registry.RULES", rows):
+        assert RuleRegistry(LIBRARY_PATH, RuleRegistry.PACKAGE).entries() is None
+
+
+def test_write_round_trip(tmp_path, monkeypatch):
+    row = (
+        "DDF1",
+        "rule_ddf1",
+        "RuleDDF1",
+        40,
+        ["A"],
+        ["A", "B"],
+        [RuleTemplate.TIMELINE],
+    )
+    (tmp_path / "rule_ddf1.py").write_text("")
+    registry = RuleRegistry(str(tmp_path), RuleRegistry.PACKAGE)
+    registry.write([row])
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop("registry", None)
+    try:
+        module = importlib.import_module("registry")
+        assert module.RULES == [row]
+        with patch.dict(sys.modules, {"usdm4.rules.library.registry": module}):
+            entries = registry.entries()
+    finally:
+        sys.modules.pop("registry", None)
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.rule_id == "DDF1"
+    assert entry.module == "rule_ddf1"
+    assert entry.class_name == "RuleDDF1"
+    assert entry.visits == ["A"]
+    assert entry.requires == ["A", "B"]
+    assert entry.tags == [RuleTemplate.TIMELINE]
+    assert entry.package == RuleRegistry.PACKAGE
+
+
+def test_engine_uses_registry_without_importing_rules():
+    with patch.object(RulesValidationEngine, "_scan_rules") as scan:
+        engine = RulesValidationEngine(ROOT_PATH, RuleRegistry.PACKAGE)
+    scan.assert_not_called()
+    assert all(isinstance(rule, RuleEntry) for rule in engine.rules)
+    assert [engine._rule_id(rule) for rule in engine.rules] == [row[0] for row in RULES]
+
+
+def test_engine_scans_without_registry():
+    with patch.object(RuleRegistry, "entries", return_value=None):
+        engine = RulesValidationEngine(ROOT_PATH, RuleRegistry.PACKAGE)
+    assert len(engine.rules) == len(RULES)
+    assert not any(isinstance(rule, RuleEntry) for rule in engine.rules)
+    assert sorted(engine._rule_id(rule) for rule in engine.rules) == sorted(
+        row[0] for row in RULES
+    )
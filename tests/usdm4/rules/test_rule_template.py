@@ -1,4 +1,4 @@
-"""Tests for RuleTemplate and ValidationLocation.
+"""Tests for RuleTemplate, RuleFindings and ValidationLocation.
 
 After the predicate-consolidation refactor (see project memory
 ``project_m11_sdtm_phase_code_tension`` and feedback memory
@@ -11,12 +11,14 @@ mirrors the Library predicate contract — including raising
 MissingCodelistError when the codelist is unknown or has no terms.
 """
 
+import pickle
 from unittest.mock import MagicMock
 
 import pytest
+from simple_error_log.errors import Errors
 
 from usdm4.ct.cdisc.library import MissingCodelistError
-from usdm4.rules.rule_template import RuleTemplate, ValidationLocation
+from usdm4.rules.rule_template import RuleFindings, RuleTemplate, ValidationLocation
 
 from tests.usdm4.rules.ct_helpers import FakeCT
 
@@ -59,6 +61,104 @@ def test_validation_location_to_dict_and_headers():
     ]
 
 
+# ---------------------------------------------------------------------------
+# RuleFindings
+# ---------------------------------------------------------------------------
+
+
+def _errors_way(findings):
+    """The same findings recorded as rules did before RuleFindings."""
+    errors = Errors()
+    for item in findings._items:
+        location = ValidationLocation(
+            "R", "T", item.location.klass, item.location.attribute, item.location.path
+        )
+        errors.add(item.message, location, "R", Errors.WARNING)
+        errors._items[-1].timestamp = item.timestamp
+    return errors
+
+
+def test_rule_findings_match_errors():
+    findings = RuleFindings("R", "T", Errors.WARNING)
+    findings.add_finding("plain", "K", "A", "$.a")
+    findings.add_finding("value 'x' of 2", "K", "B", "$.b")
+    errors = _errors_way(findings)
+    assert findings.count() == 2
+    assert findings.to_dict(level=Errors.DEBUG) == errors.to_dict(level=Errors.DEBUG)
+    assert [row["message"] for row in findings.to_dict(Errors.DEBUG)] == [
+        "plain",
+        "value 'x' of 2",
+    ]
+    assert findings.to_dict() == []
+    assert findings.error_count() == 0
+    assert findings.dump(Errors.DEBUG) == errors.dump(Errors.DEBUG)
+
+
+def test_rule_findings_errors_way_entries_keep_their_own_details():
+    findings = RuleFindings("R", "T")
+    findings.add_finding("finding", "K", "A", "$.a")
+    findings.warning("warned", ValidationLocation("X", "Y", "K", "B", "$.b"), "W")
+    findings.info("noted", extra={"n": 1})
+    rows = findings.to_dict(level=Errors.DEBUG)
+    assert [(row["level"], row["type"], row["extra"]) for row in rows] == [
+        ("Error", "R", None),
+        ("Warning", "W", None),
+        ("Info", "", {"n": 1}),
+    ]
+    assert rows[1]["location"]["rule"] == "X"
+    assert findings.error_count() == 1
+    assert [row["message"] for row in findings.to_dict(Errors.WARNING)] == [
+        "finding",
+        "warned",
+    ]
+
+
+def test_rule_findings_materialise_and_merge():
+    findings = RuleFindings("R", "T")
+    findings.add_finding("first 1", "K", "A", "$.a")
+    other = Errors()
+    other.error("second")
+    findings.add_finding("third", "K", "A", "$.c")
+    errors = findings.materialise()
+    assert [item.message for item in errors._items] == ["first 1", "third"]
+    assert isinstance(errors._items[0].location, ValidationLocation)
+    # Merging either way orders the entries by time
+    findings.merge(other)
+    merged = Errors()
+    merged.merge(errors)
+    merged.merge(other)
+    assert findings.to_dict() == merged.to_dict()
+    assert [row["message"] for row in findings.to_dict()] == [
+        "first 1",
+        "second",
+        "third",
+    ]
+    assert findings.materialise().to_dict() == merged.to_dict()
+    findings.clear()
+    assert findings.count() == 0
+
+
+def test_rule_findings_pickle_roundtrip():
+    findings = RuleFindings("R", "T")
+    findings.add_finding("value 1", "K", "A", "$.a")
+    findings.error("added")
+    copy = pickle.loads(pickle.dumps(findings))
+    assert copy.to_dict() == findings.to_dict()
+
+
+def test_rule_template_add_failure_records_finding():
+    rt = RuleTemplate("R001", RuleTemplate.WARNING, "rule text")
+    rt._add_failure("bad value", "K", "A", "$.a")
+    [row] = rt.errors().to_dict(level=Errors.DEBUG)
+    assert row["message"] == "bad value"
+    assert row["level"] == "Warning"
+    assert row["type"] == "R001"
+    assert (
+        row["location"]
+        == ValidationLocation("R001", "rule text", "K", "A", "$.a").to_dict()
+    )
+
+
 # ---------------------------------------------------------------------------
 # RuleTemplate base behaviour
 # ---------------------------------------------------------------------------
@@ -70,6 +170,35 @@ def test_rule_template_validate_raises_not_implemented():
         rt.validate({})
 
 
+class _Visitor(RuleTemplate):
+    visits = ["A", "B"]
+
+    def __init__(self):
+        super().__init__("R002", RuleTemplate.ERROR, "rule text")
+
+    def visit(self, instance, config):
+        if instance.get("bad"):
+            self._add_failure("bad", instance["instanceType"], "bad", "$")
+
+
+def test_rule_template_validate_walks_visited_classes():
+    data = MagicMock()
+    data.instances_by_klass.side_effect = lambda klass: {
+        "A": [{"instanceType": "A"}, {"instanceType": "A", "bad": True}],
+        "B": [{"instanceType": "B", "bad": True}],
+    }[klass]
+    rule = _Visitor()
+    assert rule.validate({"data": data}) is False
+    assert [e.location.klass for e in rule.errors()._items] == ["A", "B"]
+
+
+def test_rule_template_visit_raises_not_implemented():
+    rt = RuleTemplate("R001", RuleTemplate.ERROR, "rule text")
+    with pytest.raises(NotImplementedError):
+        rt.visit({}, {})
+    assert rt.finish({}) is True
+
+
 def test_rule_template_result_initial_true():
     rt = RuleTemplate("R001", RuleTemplate.ERROR, "rule text")
     assert rt._result() is True
@@ -1,8 +1,15 @@
+import os
 import json
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
 from src.usdm4 import USDM4
+from src.usdm4.rules.results import RuleStatus
+from usdm4.rules.library.registry import RULES
 from simple_error_log.errors import Errors
 from tests.usdm4.helpers.files import write_json_file, read_json_file
 
@@ -27,6 +34,256 @@ def test_validate_error():
     assert not result.passed_or_not_implemented()
 
 
+def _rows(result):
+    return [
+        {k: v for k, v in row.items() if k != "timestamp"} for row in result.to_dict()
+    ]
+
+
+def test_validate_data_matches_validate():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    with open(test_file) as f:
+        data = json.load(f)
+    expected = USDM4().validate(test_file)
+    result = USDM4().validate_data(data)
+    assert _rows(result) == _rows(expected)
+
+
+def test_validate_data_wrapper():
+    errors = Errors()
+    test_file = "tests/usdm4/test_files/integration/sample_usdm_7.json"
+    wrapper = USDM4().load(test_file, errors)
+    expected = USDM4().validate(test_file)
+    result = USDM4().validate_data(wrapper)
+    assert _rows(result) == _rows(expected)
+
+
+def test_validate_with_snapshot_dir(tmp_path):
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file)
+    usdm = USDM4(snapshot_dir=str(tmp_path))
+    cold = usdm.validate(test_file)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    warm = usdm.validate(test_file)
+    assert _rows(cold) == _rows(expected)
+    assert _rows(warm) == _rows(expected)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_validate_with_max_workers(executor):
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file)
+    usdm = USDM4(max_workers=2, executor=executor)
+    result = usdm.validate(test_file)
+    assert list(result.outcomes) == list(expected.outcomes)
+    assert _rows(result) == _rows(expected)
+    with open(test_file) as f:
+        assert _rows(usdm.validate_data(json.load(f))) == _rows(expected)
+
+
+def test_validate_with_results_dir(tmp_path):
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file)
+    usdm = USDM4(results_dir=str(tmp_path))
+    cold = usdm.validate(test_file)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    with patch("src.usdm4.rules.engine.DataStore") as data_store:
+        warm = usdm.validate(test_file)
+    data_store.assert_not_called()
+    assert _rows(cold) == _rows(expected)
+    assert _rows(warm) == _rows(expected)
+    assert _rows(usdm.validate(test_file, bypass_cache=True)) == _rows(expected)
+
+
+def test_validate_timings_and_profile():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    result = USDM4().validate(test_file, profile_rule="DDF00010")
+    rows = result.timings()
+    assert len(rows) == result.count()
+    assert rows[0]["wall_time"] >= rows[-1]["wall_time"]
+    assert result.outcomes["DDF00010"].instance_count > 0
+    profiled = [rule for rule, outcome in result.outcomes.items() if outcome.profile]
+    assert profiled == ["DDF00010"]
+    assert result.outcomes["DDF00010"].profile.stats
+
+
+def test_validate_rule_subset():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file)
+    ct_rules = [row[0] for row in RULES if "ct" in row[-1]]
+    result = USDM4().validate(test_file, include=["ct"])
+    assert list(result.outcomes) == ct_rules
+    assert _rows(result) == [
+        row for row in _rows(expected) if row["rule_id"] in ct_rules
+    ]
+    with open(test_file) as f:
+        result = USDM4().validate_data(json.load(f), exclude=["ct", "DDF00010"])
+    assert not set(result.outcomes) & set(ct_rules + ["DDF00010"])
+    assert len(result.outcomes) == len(RULES) - len(ct_rules) - 1
+
+
+def test_iter_validate_matches_validate():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    *outcomes, result = USDM4().iter_validate(test_file, exclude=["ct"])
+    expected = USDM4().validate(test_file, exclude=["ct"])
+    assert sorted(outcome.rule_id for outcome in outcomes) == sorted(expected.outcomes)
+    assert _rows(result) == _rows(expected)
+
+
+def test_validate_gate_stops_at_first_failure():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file)
+    result = USDM4().validate(test_file, max_failures=1)
+    assert not result.passed_or_not_implemented()
+    assert list(result.outcomes) == list(expected.outcomes)
+    failed = [
+        rule_id
+        for rule_id, outcome in result.outcomes.items()
+        if outcome.status in (RuleStatus.FAILURE, RuleStatus.EXCEPTION)
+    ]
+    assert len(failed) == 1
+    assert _rows(result) == [row for row in _rows(expected) if row["rule_id"] in failed]
+    assert result.not_run()
+
+
+def test_validate_with_rule_timeout():
+    test_file = "tests/usdm4/test_files/test_validate.json"
+    expected = USDM4().validate(test_file)
+    assert USDM4(rule_timeout=60).validate(test_file).passed_or_not_implemented()
+    # A budget no rule can keep to stops every rule reading the study
+    result = USDM4(rule_timeout=1e-9).validate(test_file)
+    timed_out = result.by_status(RuleStatus.TIMEOUT)
+    assert timed_out
+    assert len(result.outcomes) == len(expected.outcomes)
+    assert not result.passed_or_not_implemented()
+
+
+def test_validate_skips_rules_without_required_classes():
+    result = USDM4().validate("tests/usdm4/test_files/test_validate.json")
+    skipped = result.by_status(RuleStatus.SKIPPED)
+    assert skipped
+    for outcome in skipped:
+        assert outcome.wall_time == 0.0
+    assert result.passed_or_not_implemented()
+
+
+def test_validate_incremental_matches_validate_data():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    usdm = USDM4()
+    store = usdm.data_store(test_file)
+    previous = usdm.validate_data(store)
+    with open(test_file) as f:
+        data = json.load(f)
+    data["study"]["name"] = "edited"
+    result = usdm.validate_incremental(data, store, previous)
+    assert _rows(result) == _rows(usdm.validate_data(data))
+
+
+def test_validate_incremental_respects_selection():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    usdm = USDM4()
+    store = usdm.data_store(test_file)
+    previous = usdm.validate_data(store, include=["ct"], exclude=["DDF00141"])
+    with open(test_file) as f:
+        data = json.load(f)
+    data["study"]["name"] = "edited"
+    result = usdm.validate_incremental(
+        data, store, previous, include=["ct"], exclude=["DDF00141"]
+    )
+    expected = usdm.validate_data(data, include=["ct"], exclude=["DDF00141"])
+    assert _rows(result) == _rows(expected)
+    assert list(result.outcomes) == list(expected.outcomes)
+    assert "DDF00141" not in result.outcomes
+    assert "DDF00010" not in result.outcomes
+
+
+def test_validate_many_matches_validate():
+    test_files = [
+        "tests/usdm4/test_files/test_validate.json",
+        "tests/usdm4/test_files/test_validate_error.json",
+    ]
+    results = dict(USDM4().validate_many(test_files, workers=2))
+    assert sorted(results) == sorted(test_files)
+    for test_file in test_files:
+        assert _rows(results[test_file]) == _rows(USDM4().validate(test_file))
+
+
+def test_validate_async_matches_validate():
+    test_file = "tests/usdm4/test_files/test_validate_error.json"
+    expected = USDM4().validate(test_file, include=["ct"])
+
+    async def main():
+        async with USDM4(async_workers=2) as usdm:
+            return await asyncio.gather(
+                usdm.validate_async(test_file, include=["ct"]),
+                usdm.validate_async(test_file, include=["ct"]),
+            )
+
+    for result in asyncio.run(main()):
+        assert _rows(result) == _rows(expected)
+
+
+def test_load_async():
+    test_file = "tests/usdm4/test_files/integration/sample_usdm_7.json"
+    usdm = USDM4()
+    errors = Errors()
+    wrapper = asyncio.run(usdm.load_async(test_file, errors))
+    assert wrapper.study.id == usdm.load(test_file, Errors()).study.id
+    assert asyncio.run(usdm.load_async("missing.json", errors)) is None
+    assert errors.count() == 1
+    usdm.close()
+    with pytest.raises(RuntimeError):
+        asyncio.run(usdm.load_async(test_file, errors))
+
+
+def test_validate_core_async(tmp_path):
+    usdm = USDM4(cache_dir=str(tmp_path))
+    with patch.object(usdm, "validate_core", return_value="core") as validate_core:
+        result = asyncio.run(usdm.validate_core_async("study.json", version="3-0"))
+    assert result == "core"
+    validate_core.assert_called_once_with(
+        os.path.abspath("study.json"), "3-0", None, None
+    )
+    with patch.object(usdm, "validate_core", return_value="core") as validate_core:
+        asyncio.run(usdm.validate_core_async("study.json", cache_dir="core"))
+    validate_core.assert_called_once_with(
+        os.path.abspath("study.json"), "4-0", os.path.abspath("core"), None
+    )
+    usdm.close()
+
+
+def test_directories_are_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    usdm = USDM4(cache_dir="core", snapshot_dir="snapshots", results_dir="results")
+    assert usdm._cache_dir == str(tmp_path / "core")
+    assert usdm._snapshot_dir == str(tmp_path / "snapshots")
+    assert usdm._results_cache.filepath == str(tmp_path / "results")
+    assert USDM4()._cache_dir is None
+
+
+def test_core_validator_is_created_once():
+    usdm = USDM4()
+    created = []
+
+    def core_validator(**kwargs):
+        created.append(kwargs)
+        time.sleep(0.01)
+        return object()
+
+    with patch("src.usdm4.CoreValidator", side_effect=core_validator):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            validators = list(pool.map(lambda _: usdm._get_core_validator(), range(4)))
+    assert len(created) == 1
+    assert all(validator is validators[0] for validator in validators)
+
+
+def test_reload_ct():
+    usdm = USDM4()
+    with patch.object(usdm.validator.rules_validation, "reload_ct") as reload_ct:
+        usdm.validator.reload_ct()
+    reload_ct.assert_called_once()
+
+
 def test_example_1():
     test_file = "tests/usdm4/test_files/package/example_1.json"
     result = USDM4().validate(test_file)
@@ -185,6 +442,14 @@ def test_builder():
     assert isinstance(builder, Builder)
 
 
+def test_builder_seed_uses_snapshot_dir(tmp_path):
+    errors = Errors()
+    builder = USDM4(snapshot_dir=str(tmp_path)).builder(errors)
+    builder.seed("tests/usdm4/test_files/builder/seed_1.json")
+    assert builder.data_store.snapshot_dir == str(tmp_path)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+
 def test_assembler():
     """Test assembler method returns an Assembler instance."""
     from usdm4.assembler.assembler import Assembler
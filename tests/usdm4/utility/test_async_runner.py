@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+import pytest
+
+from usdm4.utility.async_runner import AsyncRunner
+
+
+def _blocked(release: threading.Event, started: threading.Event):
+    def call():
+        started.set()
+        release.wait(timeout=10)
+        return "blocked"
+
+    return call
+
+
+class TestAsyncRunner:
+    """Test running blocking calls for coroutines."""
+
+    def test_run_returns_result_from_pool_thread(self):
+        runner = AsyncRunner()
+
+        async def main():
+            return await runner.run(
+                lambda a, b=0: (a + b, threading.current_thread().name), 1, b=2
+            )
+
+        total, name = asyncio.run(main())
+        runner.shutdown()
+        assert total == 3
+        assert name.startswith(AsyncRunner.THREAD_NAME_PREFIX)
+
+    def test_run_raises_call_exception(self):
+        runner = AsyncRunner()
+
+        def boom():
+            raise KeyError("boom")
+
+        with pytest.raises(KeyError, match="boom"):
+            asyncio.run(runner.run(boom))
+        runner.shutdown()
+
+    def test_concurrency_is_bounded(self):
+        runner = AsyncRunner(max_workers=2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.02)
+            with lock:
+                running.pop()
+
+        async def main():
+            await asyncio.gather(*[runner.run(call) for _ in range(6)])
+
+        asyncio.run(main())
+        runner.shutdown()
+        assert len(peak) == 6
+        assert max(peak) == 2
+
+    def test_cancelled_waiting_call_never_runs(self):
+        runner = AsyncRunner(max_workers=1)
+        release, started = threading.Event(), threading.Event()
+        ran = []
+
+        async def main():
+            first = asyncio.ensure_future(runner.run(_blocked(release, started)))
+            await asyncio.to_thread(started.wait, 10)
+            second = asyncio.ensure_future(runner.run(ran.append, "second"))
+            await asyncio.sleep(0)
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            # The pool hears of the cancellation on the next loop iteration
+            await asyncio.sleep(0)
+            release.set()
+            return await first
+
+        assert asyncio.run(main()) == "blocked"
+        runner.shutdown()
+        assert ran == []
+
+    def test_shutdown_cancels_waiting_calls_and_refuses_more(self):
+        runner = AsyncRunner(max_workers=1)
+        release, started = threading.Event(), threading.Event()
+        ran = []
+
+        async def main():
+            first = asyncio.ensure_future(runner.run(_blocked(release, started)))
+            await asyncio.to_thread(started.wait, 10)
+            second = asyncio.ensure_future(runner.run(ran.append, "second"))
+            await asyncio.sleep(0)
+            runner.shutdown(wait=False)
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            return await first
+
+        assert asyncio.run(main()) == "blocked"
+        assert runner.closed
+        assert ran == []
+        with pytest.raises(RuntimeError, match="shut down"):
+            asyncio.run(runner.run(ran.append, "third"))
+
+    def test_aclose_waits_for_running_call(self):
+        runner = AsyncRunner()
+        release, started = threading.Event(), threading.Event()
+
+        async def main():
+            call = asyncio.ensure_future(runner.run(_blocked(release, started)))
+            await asyncio.to_thread(started.wait, 10)
+            asyncio.get_running_loop().call_later(0.01, release.set)
+            await runner.aclose()
+            return await call
+
+        assert asyncio.run(main()) == "blocked"
+        assert runner.closed
+
+    def test_shutdown_unused_runner(self):
+        runner = AsyncRunner()
+        runner.shutdown()
+        runner.shutdown()
+        assert runner.closed
@@ -1,6 +1,7 @@
 """Integration tests for TagResolver over a real USDM file, via the two
 public access routes: USDM4.tag_resolver() and Builder.data_store."""
 
+from concurrent.futures import ThreadPoolExecutor
 from simple_error_log.errors import Errors
 from usdm4 import USDM4, TagResolver
 
@@ -24,6 +25,22 @@ def test_facade_tag_resolver_recursive_tag_and_ref():
     assert result == "<p>Age 18.0</p>"
 
 
+def test_facade_tag_resolver_from_snapshot(tmp_path):
+    """A resolver over a store reloaded from a snapshot resolves exactly as
+    one over a freshly decomposed store."""
+    errors = Errors()
+    usdm = USDM4(snapshot_dir=str(tmp_path))
+    usdm.tag_resolver(FILE, errors)
+    resolver = usdm.tag_resolver(FILE, errors)
+    instance = {
+        "id": "EligibilityCriterionItem_X",
+        "dictionaryId": "SyntaxTemplateDictionary_1",
+    }
+    result = resolver.translate(instance, '<p>Age <usdm:tag name="min_age"/></p>')
+    assert errors.error_count() == 0
+    assert result == "<p>Age 18.0</p>"
+
+
 def test_facade_tag_resolver_plain_text_untouched():
     errors = Errors()
     resolver = USDM4().tag_resolver(FILE, errors)
@@ -86,3 +103,44 @@ def test_builder_data_store_property():
     result = resolver.translate(instance, '<usdm:tag name="max_age"/>')
     assert "usdm:tag" not in result
     assert errors.error_count() == 0
+
+
+def test_shared_data_store_across_consumers():
+    """One frozen store from USDM4.data_store() serves validation, tag
+    resolution and Builder.seed concurrently, with the same results as
+    each decomposing the file itself."""
+    usdm = USDM4()
+    store = usdm.data_store(FILE)
+    assert store.frozen
+    expected = usdm.validate(FILE)
+    instance = {
+        "id": "EligibilityCriterionItem_X",
+        "dictionaryId": "SyntaxTemplateDictionary_1",
+    }
+
+    def validate():
+        return usdm.validate_data(store)
+
+    def resolve():
+        errors = Errors()
+        resolver = usdm.tag_resolver(store, errors)
+        return resolver.translate(instance, '<usdm:tag name="min_age"/>')
+
+    def seed():
+        builder = usdm.builder(Errors())
+        builder.seed(store)
+        return builder.data_store
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        validated = executor.submit(validate)
+        resolved = executor.submit(resolve)
+        seeded = executor.submit(seed)
+        assert [
+            {k: v for k, v in row.items() if k != "timestamp"}
+            for row in validated.result().to_dict()
+        ] == [
+            {k: v for k, v in row.items() if k != "timestamp"}
+            for row in expected.to_dict()
+        ]
+        assert resolved.result() == "18.0"
+        assert seeded.result() is store
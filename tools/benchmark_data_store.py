@@ -0,0 +1,126 @@
+"""Measure DataStore decomposition for time and peak memory.
+
+Decomposes each file once in each mode, ``tree`` and ``stream`` (which
+needs ``ijson``), measuring wall time and the peak traced allocation
+(``tracemalloc``) of ``decompose()``, i.e. the parsed document plus the
+indexes built over it, then the time taken to
+produce the path of every instance (paths are built on first request) and
+the time taken to reload the decomposition from a snapshot.
+Run from the repo root:
+
+    python tools/benchmark_data_store.py [file.json ...]
+    python tools/benchmark_data_store.py --synthetic 100000
+
+With no arguments the bundled test files are used. ``--synthetic N``
+writes a generated study of roughly N instances to a temporary file and
+measures that instead.
+"""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from usdm4.data_store.data_store import DataStore
+
+DEFAULT_FILES = [
+    "tests/usdm4/test_files/convert/example_2.json",
+    "tests/usdm4/test_files/expander/example_study.json",
+    "tests/usdm4/test_files/integration/sample_usdm_7.json",
+]
+
+
+def synthetic(instances: int) -> str:
+    """Write a study of about ``instances`` instances (activities, each with
+    a procedure and its code) and return the file name."""
+    activities = []
+    for index in range(instances // 3):
+        activities.append(
+            {
+                "id": f"Activity_{index}",
+                "instanceType": "Activity",
+                "name": f"ACTIVITY {index}",
+                "nextId": f"Activity_{index + 1}",
+                "definedProcedures": [
+                    {
+                        "id": f"Procedure_{index}",
+                        "instanceType": "Procedure",
+                        "code": {
+                            "id": f"Code_{index}",
+                            "instanceType": "Code",
+                            "code": "C12345",
+                            "codeSystem": "http://www.cdisc.org",
+                            "codeSystemVersion": "2024-09-27",
+                            "decode": "Procedure",
+                        },
+                    }
+                ],
+            }
+        )
+    study = {
+        "study": {
+            "id": "Study_1",
+            "instanceType": "Study",
+            "versions": [
+                {
+                    "id": "StudyVersion_1",
+                    "instanceType": "StudyVersion",
+                    "studyDesigns": [
+                        {
+                            "id": "StudyDesign_1",
+                            "instanceType": "InterventionalStudyDesign",
+                            "activities": activities,
+                        }
+                    ],
+                }
+            ],
+        },
+        "usdmVersion": "4.0.0",
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+        json.dump(study, file)
+        return file.name
+
+
+def measure(filename: str, mode: str) -> tuple[float, int, int, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = DataStore(filename, mode=mode)
+    store.decompose()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    instances = store.instances()
+    for id, _ in instances:
+        store.path_by_id(id)
+    paths = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        DataStore(filename, snapshot_dir=snapshot_dir).decompose()
+        start = time.perf_counter()
+        DataStore(filename, snapshot_dir=snapshot_dir).decompose()
+        snapshot = time.perf_counter() - start
+    return elapsed, peak, len(instances), paths, snapshot
+
+
+if __name__ == "__main__":
+    repo_root = Path(__file__).parent.parent.resolve()
+    if sys.argv[1:2] == ["--synthetic"]:
+        files = [synthetic(int(sys.argv[2]))]
+    else:
+        files = sys.argv[1:] or [str(repo_root / f) for f in DEFAULT_FILES]
+    print(
+        f"{'file':<28} {'mode':<7} {'instances':>10} {'time (ms)':>10} "
+        f"{'peak (MB)':>10} {'paths (ms)':>11} {'snapshot (ms)':>14}"
+    )
+    for filename in files:
+        for mode in DataStore.MODES:
+            elapsed, peak, count, paths, snapshot = measure(filename, mode)
+            print(
+                f"{Path(filename).name:<28} {mode:<7} {count:>10} "
+                f"{elapsed * 1000:>10.1f} {peak / 1024 / 1024:>10.2f} "
+                f"{paths * 1000:>11.1f} {snapshot * 1000:>14.1f}"
+            )
@@ -0,0 +1,112 @@
+"""Compare recording rule findings as Errors and as RuleFindings.
+
+Records N findings of one rule both ways, the Errors way (a
+``ValidationLocation`` and an ``Error`` per finding, as rules did
+before) and into a ``RuleFindings`` store, measuring for each the time
+and peak traced allocation (``tracemalloc``) of recording them, the time
+taken by ``to_dict()`` and ``merge()`` into an ``Errors``, as done by
+``RulesValidationResults.to_dict()`` and ``to_errors()``, and the
+pickled size, as kept by the results cache. Run from the repo root:
+
+    python tools/benchmark_findings.py [N]
+    python tools/benchmark_findings.py --study 3000
+
+N defaults to 100000. ``--study N`` instead validates a generated study
+of roughly N instances in which every activity fails two rules (a
+duplicated name and a missing next activity) and times the validation
+and ``to_dict()`` of its results.
+"""
+
+import gc
+import json
+import pickle
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from simple_error_log.errors import Errors
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.rule_template import RuleFindings, ValidationLocation
+from benchmark_data_store import synthetic
+
+RULE = "DDF00010"
+RULE_TEXT = "The names of all child instances of the same parent class must be unique."
+MESSAGE = "Duplicate name '{}'"
+
+
+def record_errors(count: int) -> Errors:
+    errors = Errors()
+    for index in range(count):
+        location = ValidationLocation(
+            RULE, RULE_TEXT, "Activity", "name", f"$.activities[{index}].name"
+        )
+        errors.add(MESSAGE.format(index), location, RULE, Errors.ERROR)
+    return errors
+
+
+def record_findings(count: int) -> RuleFindings:
+    findings = RuleFindings(RULE, RULE_TEXT, Errors.ERROR)
+    for index in range(count):
+        findings.add_finding(
+            MESSAGE.format(index), "Activity", "name", f"$.activities[{index}].name"
+        )
+    return findings
+
+
+def measure(record, count: int) -> tuple[float, int, float, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    errors = record(count)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    errors.to_dict(level=Errors.DEBUG)
+    to_dict = time.perf_counter() - start
+    start = time.perf_counter()
+    Errors().merge(errors)
+    merge = time.perf_counter() - start
+    size = len(pickle.dumps(errors, protocol=pickle.HIGHEST_PROTOCOL))
+    return elapsed, peak, to_dict, merge, size
+
+
+def study(instances: int) -> None:
+    filename = synthetic(instances)
+    with open(filename) as file:
+        data = json.load(file)
+    for activity in data["study"]["versions"][0]["studyDesigns"][0]["activities"]:
+        activity["name"] = "ACTIVITY"
+        activity["nextId"] = "Missing"
+    with open(filename, "w") as file:
+        json.dump(data, file)
+    repo_root = Path(__file__).parent.parent.resolve()
+    engine = RulesValidationEngine(
+        str(repo_root / "src" / "usdm4"), "usdm4.rules.library"
+    )
+    start = time.perf_counter()
+    results = engine.validate_rules(filename)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = results.to_dict()
+    to_dict = time.perf_counter() - start
+    print(f"{'findings':>10} {'validate (ms)':>14} {'to_dict (ms)':>13}")
+    print(f"{len(rows):>10} {elapsed * 1000:>14.1f} {to_dict * 1000:>13.1f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--study"]:
+        study(int(sys.argv[2]))
+        sys.exit(0)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(
+        f"{'store':<14} {'findings':>10} {'record (ms)':>12} {'peak (MB)':>10} "
+        f"{'to_dict (ms)':>13} {'merge (ms)':>11} {'pickle (MB)':>12}"
+    )
+    for name, record in [("Errors", record_errors), ("RuleFindings", record_findings)]:
+        elapsed, peak, to_dict, merge, size = measure(record, count)
+        print(
+            f"{name:<14} {count:>10} {elapsed * 1000:>12.1f} "
+            f"{peak / 1024 / 1024:>10.2f} {to_dict * 1000:>13.1f} "
+            f"{merge * 1000:>11.1f} {size / 1024 / 1024:>12.2f}"
+        )
@@ -0,0 +1,103 @@
+"""Time scope lookups and the rules that make them.
+
+Decomposes a generated study of roughly N instances (see
+``benchmark_data_store.synthetic``), then times ``parent_by_klass`` from
+every instance to its study design and to its study version, and each
+rule that looks up the scope of instances, run on its own against the
+store. Run from the repo root:
+
+    python tools/benchmark_scopes.py [N]
+
+N defaults to 3000. Only long-standing DataStore and rule APIs are used,
+so pointing PYTHONPATH at an older checkout's ``src`` times that tree
+with the same study for comparison.
+"""
+
+import importlib
+import json
+import sys
+import time
+from usdm4.data_store.data_store import DataStore
+from benchmark_data_store import synthetic
+
+STUDY_DESIGN_KLASSES = ["InterventionalStudyDesign", "ObservationalStudyDesign"]
+
+
+# Rules checking instances within a scope (the same study design,
+# timeline, ...)
+SCOPING_RULES = [
+    "DDF00024",
+    "DDF00026",
+    "DDF00028",
+    "DDF00029",
+    "DDF00037",
+    "DDF00046",
+    "DDF00047",
+    "DDF00069",
+    "DDF00073",
+    "DDF00080",
+    "DDF00096",
+    "DDF00105",
+    "DDF00106",
+    "DDF00107",
+    "DDF00127",
+    "DDF00152",
+    "DDF00170",
+    "DDF00171",
+    "DDF00254",
+]
+
+
+def rule_class(rule: str) -> type:
+    module = importlib.import_module(f"usdm4.rules.library.rule_{rule.lower()}")
+    return getattr(module, f"Rule{rule}")
+
+
+def instance_ids(data) -> list[str]:
+    ids = []
+    if isinstance(data, dict):
+        if "instanceType" in data:
+            ids.append(data["id"])
+        for value in data.values():
+            ids += instance_ids(value)
+    elif isinstance(data, list):
+        for value in data:
+            ids += instance_ids(value)
+    return ids
+
+
+def lookups(store: DataStore, ids: list[str], klasses, repeat: int = 5) -> float:
+    """Best of ``repeat`` runs of one lookup per id."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for id in ids:
+            store.parent_by_klass(id, klasses)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == "__main__":
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    filename = synthetic(instances)
+    with open(filename) as file:
+        ids = instance_ids(json.load(file))
+    store = DataStore(filename)
+    store.decompose()
+    print(f"{'lookup / rule':<28} {'time (ms)':>10}")
+    for name, klasses in [
+        ("study design", STUDY_DESIGN_KLASSES),
+        ("study version", "StudyVersion"),
+    ]:
+        elapsed = lookups(store, ids, klasses)
+        print(f"{f'{name} x {len(ids)}':<28} {elapsed * 1000:>10.1f}")
+    total = 0
+    for rule_id in SCOPING_RULES:
+        rule = rule_class(rule_id)()
+        start = time.perf_counter()
+        rule.validate({"data": store})
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        print(f"{rule_id:<28} {elapsed * 1000:>10.1f}")
+    print(f"{'all scoping rules':<28} {total * 1000:>10.1f}")
@@ -0,0 +1,57 @@
+"""Rules engine start-up time with and without the rule registry.
+
+Each run is a fresh interpreter that imports the engine, constructs it and
+then instantiates every rule (importing the rule modules, which the
+registry defers until a rule first runs). With ``scan`` the registry is
+ignored and the library is scanned as it was before the registry existed.
+Run from the repo root:
+
+    python tools/benchmark_startup.py [runs]
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+from statistics import median
+
+RUN = """
+import sys
+import time
+start = time.perf_counter()
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.rule_registry import RuleRegistry
+imported = time.perf_counter()
+if sys.argv[2] == "scan":
+    RuleRegistry.entries = lambda self: None
+engine = RulesValidationEngine(sys.argv[1], RuleRegistry.PACKAGE)
+constructed = time.perf_counter()
+rules = [rule_class() for rule_class in engine.rules]
+loaded = time.perf_counter()
+print(imported - start, constructed - imported, loaded - constructed)
+"""
+
+
+def measure(root_path: str, mode: str) -> list[float]:
+    env = {**os.environ, "PYTHONPATH": str(Path(root_path).parent)}
+    output = subprocess.run(
+        [sys.executable, "-c", RUN, root_path, mode],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    root_path = str(Path(__file__).parent.parent.resolve() / "src" / "usdm4")
+    print(
+        f"{'mode':<10} {'import (ms)':>12} {'construct (ms)':>15} "
+        f"{'first rules (ms)':>17}   (median of {runs})"
+    )
+    for mode in ["scan", "registry"]:
+        timings = list(zip(*[measure(root_path, mode) for _ in range(runs)]))
+        imported, constructed, loaded = [median(values) * 1000 for values in timings]
+        print(f"{mode:<10} {imported:>12.1f} {constructed:>15.1f} {loaded:>17.1f}")
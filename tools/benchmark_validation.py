@@ -0,0 +1,63 @@
+"""Per-file rule validation latency with cold and warm terminology.
+
+The rules engine loads the controlled terminology on its first validation
+and keeps it, so only the first file pays for the load. This validates
+each file twice with one engine, after timing a terminology load on its
+own, and reports both latencies, then the warm latency with the rules
+run on a pool of threads and of processes. Run from the repo root:
+
+    python tools/benchmark_validation.py [--workers N] [file.json ...]
+
+With no arguments a selection of the bundled test files is used.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.ct.cdisc.library import Library as CTLibrary
+
+DEFAULT_FILES = [
+    "tests/usdm4/test_files/test_validate.json",
+    "tests/usdm4/test_files/convert/example_2.json",
+    "tests/usdm4/test_files/expander/example_study.json",
+    "tests/usdm4/test_files/integration/sample_usdm_7.json",
+]
+
+
+def timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    repo_root = Path(__file__).parent.parent.resolve()
+    root_path = str(repo_root / "src" / "usdm4")
+    args = sys.argv[1:]
+    workers = os.cpu_count() or 1
+    if args[:1] == ["--workers"]:
+        workers, args = int(args[1]), args[2:]
+    files = args or [str(repo_root / f) for f in DEFAULT_FILES]
+    load = timed(CTLibrary(root_path).load)
+    print(f"terminology load: {load * 1000:.1f} ms")
+    engine = RulesValidationEngine(root_path, "usdm4.rules.library")
+    print(
+        f"{'file':<28} {'first (ms)':>11} {'warm (ms)':>10} "
+        f"{'threads (ms)':>13} {'processes (ms)':>15}   ({workers} workers)"
+    )
+    for filename in files:
+        first = timed(engine.validate_rules, filename)
+        warm = timed(engine.validate_rules, filename)
+        threads = timed(engine.validate_rules, filename, max_workers=workers)
+        processes = timed(
+            engine.validate_rules,
+            filename,
+            max_workers=workers,
+            executor=RulesValidationEngine.PROCESS,
+        )
+        print(
+            f"{Path(filename).name:<28} {first * 1000:>11.1f} {warm * 1000:>10.1f} "
+            f"{threads * 1000:>13.1f} {processes * 1000:>15.1f}"
+        )
@@ -0,0 +1,23 @@
+"""Regenerate the rule registry, src/usdm4/rules/library/registry.py.
+
+Scans the rule library the way the engine does without a registry, then
+writes the id, module, class, level, visited and required classes and
+tags of every rule. Run from the repo root after adding, removing or
+changing a rule:
+
+    python tools/build_rule_registry.py
+"""
+
+from pathlib import Path
+from usdm4.rules.engine import RulesValidationEngine
+from usdm4.rules.rule_registry import RuleRegistry
+
+if __name__ == "__main__":
+    root_path = str(Path(__file__).parent.parent.resolve() / "src" / "usdm4")
+    engine = RulesValidationEngine(root_path, RuleRegistry.PACKAGE)
+    engine.rules = []
+    engine._scan_rules()
+    registry = RuleRegistry(engine.library_path, engine.package_name)
+    rows = registry.build(engine.rules)
+    registry.write(rows)
+    print(f"{len(rows)} rules written to {registry.library_path}/registry.py")
@@ -0,0 +1,41 @@
+"""Report which rules dominate validation time for a USDM JSON file.
+
+Validates the file once to warm the terminology, again to time every rule,
+and prints the most expensive rules with their wall time, CPU time and the
+number of instances each examined. ``--profile RULE`` also runs that rule
+under cProfile and tracemalloc and prints the capture. Run from the repo
+root:
+
+    python tools/rule_timings.py file.json [--top N] [--profile DDF00010]
+"""
+
+import argparse
+from pathlib import Path
+from usdm4.rules.engine import RulesValidationEngine
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--profile", default=None)
+    args = parser.parse_args()
+    root_path = str(Path(__file__).parent.parent.resolve() / "src" / "usdm4")
+    engine = RulesValidationEngine(root_path, "usdm4.rules.library")
+    engine.validate_rules(args.filename)
+    results = engine.validate_rules(args.filename, profile_rule=args.profile)
+    print(f"rules: {results.count()}, total {results.wall_time * 1000:.1f} ms")
+    print(
+        f"{'rule':<12} {'status':<16} {'wall (ms)':>10} {'cpu (ms)':>10} "
+        f"{'instances':>10} {'share':>7}"
+    )
+    for row in results.timings(args.top):
+        print(
+            f"{row['rule_id']:<12} {row['status']:<16} "
+            f"{row['wall_time'] * 1000:>10.2f} {row['cpu_time'] * 1000:>10.2f} "
+            f"{row['instance_count']:>10} {row['share']:>7.1%}"
+        )
+    if args.profile:
+        profile = results.outcomes[args.profile].profile
+        print(f"\n{args.profile} peak memory: {profile.peak_memory / 1024:.1f} KiB")
+        print(profile.stats)
+        print(profile.allocations)